@@ -0,0 +1,92 @@
+import argparse
+import json
+import time
+
+from common import runIsolated, waitForWorkers, writeResults
+
+
+def measure(schemas: int, tables: int, latency: float) -> dict:
+    from PySide6.QtWidgets import QApplication
+
+    from fake_mysql import FakeServer
+    from mysql_editor.pool import ConnectionPool
+    from mysql_editor.window import WindowUI
+
+    app = QApplication.instance() or QApplication([])
+
+    server = FakeServer(schemas, tables, 0, latency)
+
+    start = time.perf_counter()
+
+    window = WindowUI(ConnectionPool(server.connect, 4, server.connect()))
+
+    waitForWorkers(app)
+
+    usable = time.perf_counter() - start
+    startupRoundTrips = server.roundTrips
+
+    start = time.perf_counter()
+
+    window.databaseTree.topLevelItem(window.databaseTree.topLevelItemCount() - 1).setExpanded(True)
+
+    waitForWorkers(app)
+
+    expand = time.perf_counter() - start
+    start = time.perf_counter()
+
+    window.refresh()
+
+    waitForWorkers(app)
+
+    return {
+        "schemas": schemas,
+        "tables_per_schema": tables,
+        "latency_ms": latency * 1000,
+        "connect_to_usable_s": usable,
+        "startup_round_trips": startupRoundTrips,
+        "expand_s": expand,
+        "refresh_s": time.perf_counter() - start,
+        "tree_items": window.databaseTree.topLevelItemCount(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time from connection to a usable database tree")
+    parser.add_argument("--schemas", type=int, nargs="+", default=[10, 100, 500, 1500])
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=1.0, help="simulated round trip in milliseconds")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--output", help="also write the results with run details to this JSON file")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(measure(args.schemas[0], args.tables, args.latency / 1000)))
+
+        return
+
+    results = []
+
+    for schemas in args.schemas:
+        results.append(runIsolated(
+            __file__, ["--schemas", str(schemas), "--tables", str(args.tables), "--latency", str(args.latency)]
+        ))
+
+    writeResults("database_tree", {"tables": args.tables, "latency_ms": args.latency}, results, args.output)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+        return
+
+    print(f"{'schemas':>8} {'round trips':>12} {'usable (s)':>11} {'expand (s)':>11} {'refresh (s)':>12}")
+
+    for result in results:
+        print(
+            f"{result['schemas']:>8} {result['startup_round_trips']:>12} {result['connect_to_usable_s']:>11.3f} "
+            f"{result['expand_s']:>11.3f} {result['refresh_s']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
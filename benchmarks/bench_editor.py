@@ -0,0 +1,168 @@
+import argparse
+import json
+import time
+
+from common import runIsolated, silenceDialogs, waitForWorkers, writeResults
+
+
+def timed(app, action) -> float:
+    start = time.perf_counter()
+
+    action()
+    waitForWorkers(app)
+
+    return time.perf_counter() - start
+
+
+def measure(rows: int, tables: int, latency: float, pages: int, edits: int, blobSize: int, statements: int) -> dict:
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication, QTableView
+
+    from fake_mysql import FakeServer
+    from mysql_editor.backend import Backend
+    from mysql_editor.pool import ConnectionPool
+    from mysql_editor.stats import QueryMonitor, QueryStats
+    from mysql_editor.window import WindowUI
+
+    app = QApplication.instance() or QApplication([])
+    messages = silenceDialogs()
+
+    server = FakeServer(10, tables, rows, latency, blobSize)
+    window = WindowUI(ConnectionPool(server.connect, 4, server.connect()))
+
+    waitForWorkers(app)
+
+    backend = Backend()
+    result = {"rows": rows, "tables_per_schema": tables, "latency_ms": latency * 1000, "blob_size": blobSize}
+
+    def genDatabaseList():
+        backend.invalidateCatalog()
+        window.databaseTree.clear()
+        window.genDatabaseList()
+
+    result["gen_database_list_s"] = timed(app, genDatabaseList)
+
+    backend.invalidateCatalog()
+    result["structure_set_table_s"] = timed(app, lambda: window.tableStructure.setTable("db0", "t0"))
+
+    backend.invalidateCatalog()
+    result["data_set_table_s"] = timed(app, lambda: window.tableData.setTable("db0", "t0"))
+
+    model = window.tableData.findChild(QTableView).model()
+
+    if blobSize:
+        backend.invalidateCatalog()
+        result["blob_data_set_table_s"] = timed(app, lambda: window.tableData.setTable("db0", "blobs"))
+
+        window.tableData.setTable("db0", "t0")
+        waitForWorkers(app)
+
+    def fetchPages():
+        for _ in range(pages):
+            if not model.canFetchMore():
+                break
+
+            model.fetchMore()
+            waitForWorkers(app)
+
+    result["data_fetch_pages_s"] = timed(app, fetchPages)
+    result["data_rows_fetched"] = model.rowCount()
+
+    recorded = []
+    QueryMonitor().addListener(recorded.append)
+
+    query = "SELECT * FROM `db0`.`t1`;"
+    result["query_render_s"] = timed(app, lambda: window.executeQueries(query))
+
+    stats = next((stats for stats in recorded if stats.query == query.rstrip(";") and stats.render), QueryStats(query))
+
+    result.update({
+        "query_server_s": stats.server, "query_fetch_s": stats.fetch, "query_pack_s": stats.pack,
+        "query_grid_s": stats.render, "query_rows": stats.rows, "query_bytes": stats.bytes
+    })
+
+    QueryMonitor().removeListener(recorded.append)
+
+    script = "".join(f"INSERT INTO `db0`.`t0` (`name`) VALUES ('row {index}');\n" for index in range(statements))
+    roundTrips = server.roundTrips
+    result["multi_statement_s"] = timed(app, lambda: window.executeQueries(f"{script}CALL report(5);"))
+    result["multi_statement_round_trips"] = server.roundTrips - roundTrips
+    result["procedure_result_sets"] = window.queryTabs.currentWidget().results.count()
+
+    window.tableData.setTable("db0", "t2")
+    waitForWorkers(app)
+
+    model = window.tableData.findChild(QTableView).model()
+    edited = min(edits, model.rowCount())
+
+    for row in range(edited):
+        model.setData(model.index(row, 1), f"edited {row}", Qt.ItemDataRole.EditRole)
+
+    roundTrips = server.roundTrips
+    result["save_edits_s"] = timed(app, lambda: window.tableData.saveEdits("db0", "t2"))
+    result["save_edits_changes"] = edited
+    result["save_edits_round_trips"] = server.roundTrips - roundTrips
+    result["dialogs"] = messages
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the editor's hot paths against a fake server")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000], help="rows per table")
+    parser.add_argument("--tables", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated round trip in milliseconds")
+    parser.add_argument("--pages", type=int, default=10, help="extra table data pages to fetch")
+    parser.add_argument("--edits", type=int, default=1000, help="cells to change before saving")
+    parser.add_argument("--blob-size", type=int, default=65536, help="bytes per value in the db0.blobs table")
+    parser.add_argument("--statements", type=int, default=200, help="statements in the multi-statement run")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--output", help="also write the results with run details to this JSON file")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(measure(
+            args.rows[0], args.tables, args.latency / 1000, args.pages, args.edits, args.blob_size, args.statements
+        )))
+
+        return
+
+    results = []
+
+    for rows in args.rows:
+        results.append(runIsolated(
+            __file__, ["--rows", str(rows), "--tables", str(args.tables), "--latency", str(args.latency),
+                       "--pages", str(args.pages), "--edits", str(args.edits), "--blob-size", str(args.blob_size),
+                       "--statements", str(args.statements)]
+        ))
+
+    writeResults(
+        "editor", {
+            "tables": args.tables, "latency_ms": args.latency, "pages": args.pages, "edits": args.edits,
+            "blob_size": args.blob_size, "statements": args.statements
+        },
+        results, args.output
+    )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+        return
+
+    print(
+        f"{'rows':>8} {'db list':>8} {'structure':>10} {'data':>8} {'pages':>8} {'query':>8} {'pack':>8} "
+        f"{'grid':>8} {'save':>8} {'blobs':>8} {'script':>8}"
+    )
+
+    for result in results:
+        print(
+            f"{result['rows']:>8} {result['gen_database_list_s']:>8.3f} {result['structure_set_table_s']:>10.3f} "
+            f"{result['data_set_table_s']:>8.3f} {result['data_fetch_pages_s']:>8.3f} {result['query_render_s']:>8.3f} "
+            f"{result['query_pack_s']:>8.3f} {result['query_grid_s']:>8.3f} {result['save_edits_s']:>8.3f} "
+            f"{result.get('blob_data_set_table_s', 0.0):>8.3f} {result['multi_statement_s']:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import argparse
+import datetime
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from common import runIsolated, writeResults
+
+KINDS: Tuple[str, ...] = ("id", "count", "price", "status", "name", "seen", "note")
+
+
+def wideRow(index: int, columns: int) -> Tuple[Any, ...]:
+    values: List[Any] = []
+
+    for col in range(columns):
+        kind: str = KINDS[col % len(KINDS)]
+
+        if kind == "id":
+            values.append(index * 1000 + col)
+
+        elif kind == "count":
+            values.append(None if index % 4 == 0 else index % 5000 + 1000)
+
+        elif kind == "price":
+            values.append(index * 0.25 + col)
+
+        elif kind == "status":
+            values.append(("active", "pending", "closed")[index % 3].encode().decode())
+
+        elif kind == "name":
+            values.append(f"customer {index} {col}")
+
+        elif kind == "seen":
+            values.append(datetime.datetime(2020, 1, 1, index % 24, index % 60, col % 60))
+
+        else:
+            values.append(None)
+
+    return tuple(values)
+
+
+def allocated(build: Callable[[], Any]) -> Tuple[Any, int, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    built = build()
+
+    seconds = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return built, size, seconds
+
+
+def measure(rows: int, columns: int) -> dict:
+    from mysql_editor.row_store import RowStore, toText
+
+    fetched, tupleBytes, _ = allocated(lambda: [wideRow(index, columns) for index in range(rows)])
+    _, textBytes, textSeconds = allocated(lambda: [tuple(map(toText, row)) for row in fetched])
+    _, storeBytes, storeSeconds = allocated(lambda: RowStore(fetched))
+
+    return {
+        "rows": rows,
+        "columns": columns,
+        "tuples_bytes_per_row": tupleBytes / rows,
+        "text_bytes_per_row": textBytes / rows,
+        "row_store_bytes_per_row": storeBytes / rows,
+        "text_build_s": textSeconds,
+        "row_store_build_s": storeSeconds,
+        "reduction_vs_tuples": 1 - storeBytes / tupleBytes,
+        "reduction_vs_text": 1 - storeBytes / textBytes,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Memory per row of fetched tuples, decoded text and the columnar row store on a wide table"
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--columns", type=int, default=40)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--output", help="also write the results with run details to this JSON file")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(measure(args.rows[0], args.columns)))
+
+        return
+
+    results = [runIsolated(__file__, ["--rows", str(rows), "--columns", str(args.columns)]) for rows in args.rows]
+
+    writeResults("row_store", {"columns": args.columns}, results, args.output)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+        return
+
+    print(f"{'rows':>8} {'tuples B/row':>13} {'text B/row':>11} {'store B/row':>12} {'saved':>6} {'pack (s)':>9}")
+
+    for result in results:
+        print(
+            f"{result['rows']:>8} {result['tuples_bytes_per_row']:>13.0f} {result['text_bytes_per_row']:>11.0f} "
+            f"{result['row_store_bytes_per_row']:>12.0f} {result['reduction_vs_tuples']:>6.0%} "
+            f"{result['row_store_build_s']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import time
+
+START = time.perf_counter()
+
+import sys  # noqa: E402
+
+from common import waitForWorkers, writeResults  # noqa: E402
+
+IMPORT_TIME = r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)"
+STAGES = ("session", "window")
+
+
+def sessionDialog() -> dict:
+    from PySide6.QtWidgets import QApplication
+
+    from mysql_editor.session import SessionManager
+
+    app = QApplication.instance() or QApplication([])
+
+    manager = SessionManager()
+    manager.show()
+    app.processEvents()
+
+    return {"seconds": time.perf_counter() - START}
+
+
+def usableWindow() -> dict:
+    from PySide6.QtWidgets import QApplication
+
+    from fake_mysql import FakeServer
+    from mysql_editor.window import openWindow
+
+    app = QApplication.instance() or QApplication([])
+    server = FakeServer(10, 20, 0)
+
+    window = openWindow(server.connect, server.connect())
+
+    waitForWorkers(app)
+
+    return {"seconds": time.perf_counter() - START, "tree_items": window.databaseTree.topLevelItemCount()}
+
+
+def single(stage: str) -> None:
+    result = sessionDialog() if stage == "session" else usableWindow()
+
+    import json
+
+    print(json.dumps(result))
+
+
+def profile(stage: str) -> dict:
+    import json
+    import re
+    import subprocess
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", __file__, "--single", stage], check=True, capture_output=True, text=True
+    )
+
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    imports = []
+
+    for line in process.stderr.splitlines():
+        match = re.match(IMPORT_TIME, line)
+
+        if match is not None:
+            imports.append((match.group(4), int(match.group(1)), int(match.group(2)), len(match.group(3)) // 2))
+
+    result["imported_modules"] = len(imports)
+    result["import_s"] = sum(own for _, own, _, _ in imports) / 1e6
+    result["editor_modules"] = sorted(name for name, _, _, _ in imports if name.startswith("mysql_editor."))
+    result["mysql_connector_loaded"] = any(name == "mysql.connector" for name, _, _, _ in imports)
+    result["top_level_imports"] = {
+        name: cumulative / 1e6 for name, _, cumulative, depth in sorted(imports, key=lambda item: -item[2])
+        if depth == 0
+    }
+
+    return result
+
+
+def main() -> None:
+    import argparse
+    import json
+    import statistics
+
+    parser = argparse.ArgumentParser(
+        description="Time to the session dialog and to a usable window, profiled with -X importtime"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="fresh processes per stage, the median is reported")
+    parser.add_argument("--top", type=int, default=10, help="top-level imports to list per stage")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--output", help="also write the results with run details to this JSON file")
+    args = parser.parse_args()
+
+    results = []
+
+    for stage in STAGES:
+        runs = [profile(stage) for _ in range(args.repeat)]
+        median = sorted(runs, key=lambda run: run["seconds"])[len(runs) // 2]
+
+        results.append({
+            "stage": stage,
+            "median_s": median["seconds"],
+            "min_s": min(run["seconds"] for run in runs),
+            "median_import_s": statistics.median(run["import_s"] for run in runs),
+            "imported_modules": median["imported_modules"],
+            "mysql_connector_loaded": median["mysql_connector_loaded"],
+            "editor_modules": median["editor_modules"],
+            "top_level_imports": dict(list(median["top_level_imports"].items())[:args.top]),
+        })
+
+    writeResults("startup", {"repeat": args.repeat}, results, args.output)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+        return
+
+    for result in results:
+        print(
+            f"{result['stage']}: {result['median_s']:.3f} s (min {result['min_s']:.3f} s), "
+            f"{result['median_import_s']:.3f} s importing {result['imported_modules']} modules"
+        )
+
+        for name, seconds in result["top_level_imports"].items():
+            print(f"    {name:<40} {seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--single"]:
+        single(sys.argv[2])
+
+    else:
+        main()
@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def waitForWorkers(app, timeout: float = 600.0) -> None:
+    from mysql_editor.worker import WorkerPool
+
+    end = time.perf_counter() + timeout
+
+    while time.perf_counter() < end:
+        app.processEvents()
+
+        if not WorkerPool().activeCount():
+            app.processEvents()
+
+            return
+
+        time.sleep(0.0005)
+
+    raise TimeoutError("Workers did not finish")
+
+
+def silenceDialogs() -> List[str]:
+    from PySide6.QtWidgets import QMessageBox
+
+    messages: List[str] = []
+
+    def record(parent, title, text, *args):
+        messages.append(f"{title}: {text}")
+
+        return QMessageBox.StandardButton.Ok
+
+    QMessageBox.information = staticmethod(record)
+    QMessageBox.warning = staticmethod(record)
+    QMessageBox.critical = staticmethod(record)
+
+    return messages
+
+
+def runIsolated(script: str, arguments: List[str]) -> Dict[str, Any]:
+    import json
+    import subprocess
+
+    output = subprocess.run(
+        [sys.executable, script, "--single", *arguments], check=True, capture_output=True, text=True
+    ).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def writeResults(benchmark: str, parameters: Dict[str, Any], results: List[Dict[str, Any]],
+                 output: Optional[str]) -> None:
+    if output is None:
+        return
+
+    import datetime
+    import json
+    import platform
+
+    from PySide6 import __version__ as pyside
+
+    document = {
+        "benchmark": benchmark,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pyside6": pyside,
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "results": results,
+    }
+
+    with open(output, "w") as file:
+        json.dump(document, file, indent=2)
+        file.write("\n")
@@ -0,0 +1,406 @@
+import datetime
+import operator
+import re
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from mysql.connector.errorcode import ER_QUERY_INTERRUPTED, ER_QUERY_TIMEOUT
+from mysql.connector.errors import DatabaseError, Error, ProgrammingError
+
+STRUCTURE: List[Tuple[Any, ...]] = [
+    ("id", "int", "NO", "PRI", None, "auto_increment"),
+    ("name", "varchar(40)", "YES", "", None, ""),
+    ("kind", "enum('a','b','c')", "YES", "", "a", ""),
+    ("born", "date", "YES", "", None, ""),
+    ("seen", "datetime", "YES", "", None, ""),
+]
+
+
+BLOB_COLUMN: Tuple[Any, ...] = ("data", "longblob", "YES", "", None, "")
+
+COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq, "<>": operator.ne, "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge
+}
+
+SELECT_TABLE = r"SELECT (.+?) FROM `(.+?)`\.`(.+?)`"
+SELECT_CHUNK = r"SELECT SUBSTRING\(`(.+?)`, %s, %s\) FROM `(.+?)`\.`(.+?)` WHERE (.+?) LIMIT"
+
+
+def matches(value: Any, compare: Callable[[Any, Any], bool], operand: str) -> bool:
+    if value is None:
+        return False
+
+    if isinstance(value, int):
+        return compare(value, int(operand))
+
+    return compare(f"{value}", operand)
+
+
+def syntheticRow(index: int, blobSize: int = 0) -> Tuple[Any, ...]:
+    row: Tuple[Any, ...] = (
+        index, f"name {index}", "abc"[index % 3], datetime.date(2000, 1, 1 + index % 28),
+        datetime.datetime(2020, 1, 1, index % 24, index % 60, index % 60)
+    )
+
+    return (*row, bytes((index % 256,)) * blobSize) if blobSize else row
+
+
+class SyntheticRows(Sequence):
+    def __init__(self, start: int, stop: int, blobSize: int = 0):
+        self.start: int = start
+        self.stop: int = max(start, stop)
+        self.blobSize: int = blobSize
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(len(self))
+
+            return SyntheticRows(self.start + start, self.start + stop, self.blobSize)
+
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+
+        return syntheticRow(self.start + index % len(self), self.blobSize)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return (syntheticRow(index, self.blobSize) for index in range(self.start, self.stop))
+
+    def after(self, key: Any) -> "SyntheticRows":
+        return SyntheticRows(max(self.start, key + 1), self.stop, self.blobSize)
+
+
+class FakeTable:
+    def __init__(self, rows: int, tableType: str = "BASE TABLE", blobSize: int = 0):
+        self.tableType: str = tableType
+        self.structure: List[Tuple[Any, ...]] = list(STRUCTURE) + ([BLOB_COLUMN] if blobSize else [])
+        self.rows: SyntheticRows = SyntheticRows(1, rows + 1, blobSize)
+
+
+class FakeServer:
+    def __init__(self, schemas: int = 3, tables: int = 3, rows: int = 100, latency: float = 0.0,
+                 blobSize: int = 0):
+        self.latency: float = latency
+        self.roundTrips: int = 0
+        self.killed: Set[int] = set()
+        self.log: List[Tuple[str, Any]] = []
+
+        self.databases: Dict[str, Dict[str, FakeTable]] = {"information_schema": {}, "mysql": {}}
+
+        for schema in range(schemas):
+            self.databases[f"db{schema}"] = {f"t{table}": FakeTable(rows) for table in range(tables)}
+
+        if blobSize and schemas:
+            self.databases["db0"]["blobs"] = FakeTable(rows, blobSize=blobSize)
+
+    def connect(self, **kwargs: Any) -> "FakeConnection":
+        return FakeConnection(self)
+
+
+class FakeCursor:
+    def __init__(self, server: FakeServer, connection: Optional["FakeConnection"] = None):
+        self.__server: FakeServer = server
+        self.__connection: Optional[FakeConnection] = connection
+        self.__rows: Sequence[Tuple[Any, ...]] = []
+        self.__position: int = 0
+        self.__queued: List[str] = []
+
+        self.column_names: Tuple[str, ...] = ()
+        self.rowcount: int = -1
+
+    @property
+    def with_rows(self) -> bool:
+        return bool(self.column_names)
+
+    def execute(self, query: str, params: Optional[Sequence[Any]] = None) -> None:
+        server = self.__server
+        server.roundTrips += 1
+        server.log.append((query, params))
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        self.__queued = query.split("\n;\n")
+
+        self.__runNext(params)
+
+    def nextset(self) -> Optional[bool]:
+        if not self.__queued:
+            self.__rows, self.__position, self.column_names, self.rowcount = [], 0, (), -1
+
+            return None
+
+        self.__runNext(None)
+
+        return True
+
+    def __runNext(self, params: Optional[Sequence[Any]]) -> None:
+        try:
+            self.__run(self.__queued.pop(0), params)
+
+        except Error:
+            self.__queued = []
+
+            raise
+
+    def __run(self, query: str, params: Optional[Sequence[Any]]) -> None:
+        server = self.__server
+        query = query.strip().rstrip(";")
+        params = list(params or ())
+
+        self.__rows, self.__position, self.column_names, self.rowcount = [], 0, (), -1
+
+        call = re.match(r"CALL \w+\((\d*)\)", query, re.IGNORECASE)
+
+        if call is not None:
+            sets = int(call.group(1) or 2)
+            self.__queued[:0] = ["SELECT"] * (sets - 1) + ["DO 0"] if sets else []
+            query = "SELECT" if sets else "DO 0"
+
+        sleep = re.match(r"SELECT SLEEP\((\d+(?:\.\d+)?)\)", query, re.IGNORECASE)
+
+        if sleep is not None:
+            self.__sleep(float(sleep.group(1)))
+            self.__result(("SLEEP",), [(0,)])
+
+        elif re.match(r"KILL QUERY (\d+)", query, re.IGNORECASE):
+            server.killed.add(int(re.match(r"KILL QUERY (\d+)", query, re.IGNORECASE).group(1)))
+            self.rowcount = 0
+
+        elif re.match(r"SET SESSION max_execution_time = %s", query, re.IGNORECASE):
+            if self.__connection is not None:
+                self.__connection.executionTimeout = params[0]
+
+            self.rowcount = 0
+
+        elif re.match(r"SHOW DATABASES", query, re.IGNORECASE):
+            self.__result(("Database",), [(database,) for database in server.databases])
+
+        elif re.match(r"SELECT TABLE_NAME, TABLE_TYPE FROM information_schema.TABLES", query, re.IGNORECASE):
+            tables = server.databases.get(params[0], {})
+
+            self.__result(
+                ("TABLE_NAME", "TABLE_TYPE"), [(name, table.tableType) for name, table in sorted(tables.items())]
+            )
+
+        elif re.match(r"SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE FROM information_schema.TABLES", query,
+                      re.IGNORECASE):
+            self.__result(
+                ("TABLE_SCHEMA", "TABLE_NAME", "TABLE_TYPE"),
+                [(database, name, table.tableType) for database, tables in sorted(server.databases.items())
+                 for name, table in sorted(tables.items())]
+            )
+
+        elif re.match(r"DESC `(.+?)`\.`(.+?)`", query, re.IGNORECASE):
+            table = self.__table(*re.match(r"DESC `(.+?)`\.`(.+?)`", query, re.IGNORECASE).groups())
+
+            self.__result(("Field", "Type", "Null", "Key", "Default", "Extra"), table.structure)
+
+        elif re.match(r"SHOW INDEX FROM `(.+?)`\.`(.+?)`", query, re.IGNORECASE):
+            database, name = re.match(r"SHOW INDEX FROM `(.+?)`\.`(.+?)`", query, re.IGNORECASE).groups()
+            self.__table(database, name)
+
+            self.__result(
+                ("Table", "Non_unique", "Key_name", "Seq_in_index", "Column_name"),
+                [(name, 0, "PRIMARY", 1, "id"), (name, 1, "kind_born", 1, "kind"), (name, 1, "kind_born", 2, "born")]
+            )
+
+        elif re.match(SELECT_CHUNK, query, re.IGNORECASE):
+            column, database, name, where = re.match(SELECT_CHUNK, query, re.IGNORECASE).groups()
+            table = self.__table(database, name)
+            names = [field[0] for field in table.structure]
+            start, size, *values = params
+            keys = [names.index(key) for key in re.findall(r"`(.+?)` <=> %s", where)]
+            rows = [row for row in table.rows if all(row[col] == value for col, value in zip(keys, values))][:1]
+
+            self.__result(("chunk",), [(row[names.index(column)][start - 1:start - 1 + size],) for row in rows])
+
+        elif re.match(SELECT_TABLE, query, re.IGNORECASE):
+            select, database, name = re.match(SELECT_TABLE, query, re.IGNORECASE).groups()
+            table = self.__table(database, name)
+            rows = table.rows
+
+            where = re.search(r" WHERE (.+?)(?: ORDER BY | LIMIT |$)", query)
+            order = re.search(r" ORDER BY `(.+?)`( DESC)?", query)
+            names = [column[0] for column in table.structure]
+
+            if where is not None and re.fullmatch(r"`id` > %s", where.group(1)):
+                rows = rows.after(params.pop(0))
+
+            elif where is not None:
+                rows = self.__filter(names, where.group(1).split(" AND "), params, rows)
+
+            if order is not None and (order.group(1) != "id" or order.group(2)):
+                rows = sorted(rows, key=lambda row: row[names.index(order.group(1))], reverse=bool(order.group(2)))
+
+            if "LIMIT" in query:
+                size = params.pop(0)
+                offset = params.pop(0) if "OFFSET" in query else 0
+                rows = rows[offset:offset + size]
+
+            if select == "*":
+                self.__result(tuple(column[0] for column in table.structure), rows)
+
+            else:
+                self.__result(*self.__project(table, select, rows))
+
+        elif re.match(r"(USE|UPDATE|INSERT|DELETE|CREATE|DROP|RENAME|ALTER|SET|START|COMMIT|ROLLBACK|DO)\b", query,
+                      re.IGNORECASE):
+            self.rowcount = 1
+
+        elif re.match(r"SELECT", query, re.IGNORECASE):
+            self.__result(("a", "b"), [(1, "x")])
+
+        else:
+            raise ProgrammingError(msg=f"You have an error in your SQL syntax near '{query[:20]}'")
+
+    def executemany(self, query: str, seqParams: Sequence[Sequence[Any]]) -> None:
+        for params in seqParams:
+            self.execute(query, params)
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        rows = list(self.__rows[self.__position:])
+        self.__position = len(self.__rows)
+
+        return rows
+
+    def fetchmany(self, size: int = 1) -> List[Tuple[Any, ...]]:
+        rows = list(self.__rows[self.__position:self.__position + size])
+        self.__position += len(rows)
+
+        return rows
+
+    def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        rows = self.fetchmany(1)
+
+        return rows[0] if rows else None
+
+    def close(self) -> None:
+        pass
+
+    def __table(self, database: str, table: str) -> FakeTable:
+        try:
+            return self.__server.databases[database][table]
+
+        except KeyError:
+            raise ProgrammingError(msg=f"Table '{database}.{table}' doesn't exist")
+
+    @staticmethod
+    def __filter(names: List[str], conditions: List[str], params: List[Any],
+                 rows: Sequence[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+        tests: List[Callable[[Tuple[Any, ...]], bool]] = []
+
+        for condition in conditions:
+            column, operator_ = re.match(r"`(.+?)` (IS NOT NULL|IS NULL|LIKE|<>|>=|<=|=|>|<)", condition).groups()
+            col = names.index(column)
+
+            if operator_ in ("IS NULL", "IS NOT NULL"):
+                tests.append(lambda row, col=col, null=operator_ == "IS NULL": (row[col] is None) == null)
+
+                continue
+
+            value = params.pop(0)
+
+            if operator_ == "LIKE":
+                pattern = re.compile(".*".join(map(re.escape, value.split("%"))), re.DOTALL)
+                tests.append(lambda row, col=col, pattern=pattern: pattern.fullmatch(f"{row[col]}") is not None)
+
+                continue
+
+            compare = COMPARISONS[operator_]
+            tests.append(lambda row, col=col, value=value, compare=compare: matches(row[col], compare, value))
+
+        return [row for row in rows if all(test(row) for test in tests)]
+
+    @staticmethod
+    def __project(table: FakeTable, select: str,
+                  rows: Sequence[Tuple[Any, ...]]) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+        names: List[str] = [column[0] for column in table.structure]
+        getters: List[Callable[[Tuple[Any, ...]], Any]] = []
+        columns: List[str] = []
+
+        for expression in re.split(r",\s*(?![^(]*\))", select):
+            left = re.match(r"LEFT\(`(.+?)`, (\d+)\) AS `(.+?)`", expression)
+            length = re.match(r"LENGTH\(`(.+?)`\)", expression)
+
+            if left is not None:
+                col, size = names.index(left.group(1)), int(left.group(2))
+                getters.append(lambda row, col=col, size=size: None if row[col] is None else row[col][:size])
+                columns.append(left.group(3))
+
+            elif length is not None:
+                col = names.index(length.group(1))
+                getters.append(lambda row, col=col: None if row[col] is None else len(row[col]))
+                columns.append(expression)
+
+            else:
+                col = names.index(expression.strip("`"))
+                getters.append(lambda row, col=col: row[col])
+                columns.append(names[col])
+
+        return tuple(columns), [tuple(getter(row) for getter in getters) for row in rows]
+
+    def __sleep(self, seconds: float) -> None:
+        connection = self.__connection
+        start = time.monotonic()
+
+        if connection is not None:
+            self.__server.killed.discard(connection.connection_id)
+
+        while time.monotonic() - start < seconds:
+            if connection is not None and connection.connection_id in self.__server.killed:
+                self.__server.killed.discard(connection.connection_id)
+
+                raise DatabaseError(msg="Query execution was interrupted", errno=ER_QUERY_INTERRUPTED)
+
+            if connection is not None and connection.executionTimeout and \
+                    time.monotonic() - start > connection.executionTimeout / 1000:
+                raise DatabaseError(
+                    msg="Query execution was interrupted, maximum statement execution time exceeded",
+                    errno=ER_QUERY_TIMEOUT
+                )
+
+            time.sleep(0.005)
+
+    def __result(self, columns: Tuple[str, ...], rows: Sequence[Tuple[Any, ...]]) -> None:
+        self.column_names = columns
+        self.__rows = rows
+        self.rowcount = len(self.__rows)
+
+
+class FakeConnection:
+    def __init__(self, server: FakeServer):
+        self.server: FakeServer = server
+        self.autocommit: bool = True
+        self.connection_id: int = id(self) % 100000
+        self.executionTimeout: int = 0
+        self.unread_result: bool = False
+
+    def cursor(self, *args: Any, **kwargs: Any) -> FakeCursor:
+        return FakeCursor(self.server, self)
+
+    def is_connected(self) -> bool:
+        return True
+
+    def ping(self, reconnect: bool = False, attempts: int = 1, delay: int = 0) -> None:
+        pass
+
+    def reconnect(self, attempts: int = 1, delay: int = 0) -> None:
+        pass
+
+    def consume_results(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def start_transaction(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
@@ -6,6 +6,7 @@ from PySide6.QtWidgets import (QDialog, QFormLayout, QLabel, QLayout, QLineEdit,
                                QTreeWidgetItem)
 
 from mysql_editor.backend import Backend
+from mysql_editor.worker import WorkerPool
 
 
 class AddDatabaseWindow(QDialog):
@@ -15,31 +16,42 @@ class AddDatabaseWindow(QDialog):
         self.setWindowTitle("Add database")
 
         self.__backend = Backend()
+        self.__workers = WorkerPool()
         self.databaseTree: QTreeWidget = databaseTree
 
         self.entry = QLineEdit()
-        button = QPushButton("Add")
-        button.clicked.connect(self.add)
+        self.button = QPushButton("Add")
+        self.button.clicked.connect(self.add)
 
         layout = QFormLayout()
         layout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
         layout.addRow(QLabel("Database:"), self.entry)
-        layout.addRow(button)
+        layout.addRow(self.button)
         self.setLayout(layout)
 
     @Slot()
     def add(self):
         database: str = self.entry.text()
 
-        error: Optional[Error] = self.__backend.addDatabase(database)
+        self.button.setEnabled(False)
+
+        self.__workers.run(
+            self.__backend.addDatabase, database, finished=lambda error: self.__databaseAdded(database, error)
+        )
+
+    def __databaseAdded(self, database: str, error: Optional[Error]):
+        self.button.setEnabled(True)
 
         if error is not None:
             QMessageBox.critical(self, "Error", error.msg)
 
             return
 
+        databaseItem = QTreeWidgetItem((database,))
+        databaseItem.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+
         self.databaseTree.blockSignals(True)
-        self.databaseTree.addTopLevelItem(QTreeWidgetItem((database,)))
+        self.databaseTree.addTopLevelItem(databaseItem)
         self.databaseTree.blockSignals(False)
 
         QMessageBox.information(self, "Success", "Successfully Created")
@@ -1,96 +1,921 @@
-from typing import Any, Iterable, List, Optional, Tuple, Union
+import re
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import (Any, Dict, FrozenSet, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple,
+                    Union)
 from typing_extensions import Self
 
 from mysql.connector import MySQLConnection
 from mysql.connector.cursor import MySQLCursor
 from mysql.connector.errors import Error
 
+from mysql_editor.batch import CHUNK_SIZE, BatchReport, WriteBatch
+from mysql_editor.catalog import CatalogCache
+from mysql_editor.data_filter import DataFilter, SortOrder, indexColumns, whereClause
+from mysql_editor.pool import ConnectionPool, PoolMetrics
+from mysql_editor.result_cache import (CachedResult, ResultCache, estimateSize, isCacheable, normalizeQuery,
+                                       referencedNames, writtenTable)
+from mysql_editor.row_store import PREVIEW_LENGTH, Preview
+from mysql_editor.stats import QueryMonitor, QueryStats, rowsSize
+
+SCHEMA_CHANGE = re.compile(r"\s*(ALTER|CREATE|DROP|RENAME)\b", re.IGNORECASE)
+READ_ONLY = re.compile(r"\s*(SELECT|SHOW|WITH|DESC|DESCRIBE|EXPLAIN|TABLE|VALUES)\b", re.IGNORECASE)
+USE_DATABASE = re.compile(r"\s*USE\s+(?:`([^`]+)`|(\S+?))\s*;?\s*$", re.IGNORECASE)
+CALL_PROCEDURE = re.compile(r"\s*CALL\b", re.IGNORECASE)
+
+NULL_TEXT: str = "\\N"
+MULTI_STATEMENT_SIZE: int = 1 << 20
+STATEMENT_SEPARATOR: str = "\n;\n"
+
+
+class DataStream(NamedTuple):
+    connection: MySQLConnection
+    cursor: MySQLCursor
+    query: str
+    parameters: Tuple[Any, ...]
+    position: int = 0
+
+
+class ResultStream(NamedTuple):
+    connection: MySQLConnection
+    cursor: MySQLCursor
+    results: Iterator[MySQLCursor]
+    queries: Tuple[str, ...]
+    index: int = -1
+    finished: bool = True
+
+
+def resultSets(cursor: MySQLCursor, query: str) -> Iterator[MySQLCursor]:
+    try:
+        results: Iterator[MySQLCursor] = cursor.execute(query, multi=True)
+
+    except TypeError:
+        cursor.execute(query)
+
+        yield cursor
+
+        while cursor.nextset():
+            yield cursor
+
+        return
+
+    yield from results
+
 
 class Backend:
-    __cursor: Optional[MySQLCursor] = None
+    __pool: Optional[ConnectionPool] = None
+    __streams: Dict[Optional[Hashable], ResultStream]
+    __positions: Dict[Optional[Hashable], int]
+    __catalog: CatalogCache
+    __databases: Dict[Hashable, str]
+    __sessions: Dict[Hashable, MySQLConnection]
+    __results: ResultCache
+    __pending: Dict[Optional[Hashable], Tuple[Hashable, Tuple[str], List[Tuple[Any]], int, FrozenSet[str]]]
+    __replays: Dict[Optional[Hashable], Tuple[CachedResult, int]]
+    __ages: Dict[Optional[Hashable], float]
+    __stats: Dict[Optional[Hashable], QueryStats]
+    __monitor: QueryMonitor
+    __timeouts: Dict[Hashable, int]
+    __appliedTimeouts: Dict[Hashable, int]
+    __control: Optional[MySQLConnection]
+    __controlLock: Lock
+    __dataStreams: Dict[Optional[Hashable], DataStream]
+    __dataLock: Lock
+    __chunkSize: int = CHUNK_SIZE
     __instance: Optional[Self] = None
 
-    def __new__(cls, connection: Optional[MySQLConnection] = None):
+    def __new__(cls, pool: Optional[ConnectionPool] = None, chunkSize: int = CHUNK_SIZE, resultCacheSize: int = 0):
         if cls.__instance is None:
             cls.__instance = super(Backend, cls).__new__(cls)
-            cls.__instance.__cursor = connection.cursor()
+            cls.__instance.__pool = pool
+            cls.__instance.__chunkSize = max(chunkSize, 1)
+            cls.__instance.__streams = {}
+            cls.__instance.__positions = {}
+            cls.__instance.__catalog = CatalogCache()
+            cls.__instance.__databases = {}
+            cls.__instance.__sessions = {}
+            cls.__instance.__results = ResultCache(max(resultCacheSize, 0))
+            cls.__instance.__pending = {}
+            cls.__instance.__replays = {}
+            cls.__instance.__ages = {}
+            cls.__instance.__stats = {}
+            cls.__instance.__monitor = QueryMonitor()
+            cls.__instance.__timeouts = {}
+            cls.__instance.__appliedTimeouts = {}
+            cls.__instance.__control = None
+            cls.__instance.__controlLock = Lock()
+            cls.__instance.__dataStreams = {}
+            cls.__instance.__dataLock = Lock()
 
         return cls.__instance
 
+    def __acquire(self, affinity: Optional[Hashable]) -> MySQLConnection:
+        connection: MySQLConnection = self.__pool.acquire(affinity)
+
+        if affinity is None or self.__sessions.setdefault(affinity, connection) is connection:
+            return connection
+
+        self.__sessions[affinity] = connection
+        self.__appliedTimeouts.pop(affinity, None)
+
+        database: Optional[str] = self.__databases.get(affinity)
+
+        if database is None:
+            return connection
+
+        cursor: MySQLCursor = connection.cursor()
+
+        try:
+            cursor.execute(f"USE `{database}`;")
+
+        except Error:
+            self.__databases.pop(affinity, None)
+
+        finally:
+            cursor.close()
+
+        return connection
+
+    @contextmanager
+    def __cursor(self, affinity: Optional[Hashable] = None) -> Iterator[MySQLCursor]:
+        connection: MySQLConnection = self.__acquire(affinity)
+
+        try:
+            cursor: MySQLCursor = connection.cursor()
+
+            try:
+                yield cursor
+
+            finally:
+                if connection.unread_result:
+                    connection.consume_results()
+
+                cursor.close()
+
+        finally:
+            self.__pool.release(connection, affinity)
+
+    def getPoolMetrics(self) -> PoolMetrics:
+        return self.__pool.metrics()
+
+    def releaseAffinity(self, affinity: Hashable) -> None:
+        self.__databases.pop(affinity, None)
+        self.__sessions.pop(affinity, None)
+        self.__closeStream(affinity)
+        self.__replays.pop(affinity, None)
+        self.__ages.pop(affinity, None)
+        self.__stats.pop(affinity, None)
+        self.__positions.pop(affinity, None)
+        self.__timeouts.pop(affinity, None)
+        self.__appliedTimeouts.pop(affinity, None)
+        self.__pool.unpin(affinity)
+
+    def invalidateCatalog(self, database: Optional[str] = None, table: Optional[str] = None) -> None:
+        self.__catalog.invalidate(database, table)
+
+    def invalidateResults(self, table: Optional[str] = None) -> None:
+        self.__results.invalidate(None if table is None else table.lower())
+
+    def resultAge(self, affinity: Optional[Hashable] = None) -> Optional[float]:
+        return self.__ages.get(affinity)
+
+    def queryStats(self, affinity: Optional[Hashable] = None) -> Optional[QueryStats]:
+        return self.__stats.get(affinity)
+
+    def __resultKey(self, query: str, database: Optional[str]) -> Optional[Hashable]:
+        if database is None or not self.__results.budget() or not isCacheable(query):
+            return None
+
+        return normalizeQuery(query), database
+
+    def __written(self, query: str) -> None:
+        if READ_ONLY.match(query) or USE_DATABASE.match(query):
+            return
+
+        self.invalidateResults(writtenTable(query))
+
     def getDatabases(self) -> List[str]:
-        self.__cursor.execute("SHOW DATABASES;")
+        return self.__catalog.get(("databases",), lambda: self.__fetchAll("SHOW DATABASES;")[0])
 
-        return self.__cursor.fetchall()
+    def getTables(self, database: str) -> List[Tuple[str, str]]:
+        return self.__catalog.get(
+            ("tables", database),
+            lambda: self.__fetchAll(
+                "SELECT TABLE_NAME, TABLE_TYPE FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s "
+                "ORDER BY TABLE_NAME;", (database,)
+            )[0]
+        )
 
-    def getTables(self, database: str, tableType: str) -> List[str]:
-        self.__cursor.execute(f"SHOW FULL TABLES IN `{database}` WHERE TABLE_TYPE LIKE '{tableType}';")
+    def getCatalog(self) -> Dict[str, List[Tuple[str, str]]]:
+        generation: int = self.__catalog.generation()
+        tables: Dict[str, List[Tuple[str, str]]] = {database: [] for (database,) in self.getDatabases()}
 
-        return self.__cursor.fetchall()
+        rows, _ = self.__fetchAll(
+            "SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE FROM information_schema.TABLES "
+            "ORDER BY TABLE_SCHEMA, TABLE_NAME;"
+        )
+
+        for database, table, tableType in rows:
+            if database in tables:
+                tables[database].append((table, tableType))
+
+        self.__catalog.fill({("tables", database): entries for database, entries in tables.items()}, generation)
+
+        return tables
 
     def getTableStructure(self, database: str, table: str) -> Tuple[List[Tuple[Any]], Tuple[str]]:
-        self.__cursor.execute(f"DESC `{database}`.`{table}`;")
+        return self.__catalog.get(
+            ("structure", database, table), lambda: self.__fetchAll(f"DESC `{database}`.`{table}`;")
+        )
+
+    def __fetchAll(self, query: str, parameters: Iterable = ()) -> Tuple[List[Tuple[Any]], Tuple[str]]:
+        with self.__cursor() as cursor:
+            start: float = perf_counter()
+            cursor.execute(query, parameters)
+            executed: float = perf_counter()
+            rows: List[Tuple[Any]] = cursor.fetchall()
+
+            self.__monitor.publish(
+                QueryStats(query, executed - start, perf_counter() - executed, rows=len(rows), bytes=rowsSize(rows))
+            )
+
+            return rows, cursor.column_names
+
+    def getDataPage(self, database: str, table: str, size: int, key: Optional[str] = None, after: Any = None,
+                    offset: int = 0, columns: Sequence[str] = (), large: FrozenSet[str] = frozenset(),
+                    order: Optional[SortOrder] = None, filters: Sequence[DataFilter] = (),
+                    unique: Sequence[str] = (),
+                    affinity: Optional[Hashable] = None) -> Tuple[List[Tuple[Any]], Tuple[str], Optional[float]]:
+        previews: List[int] = [col for col, column in enumerate(columns) if column in large]
+        select: str = ", ".join(
+            [f"LEFT(`{column}`, {PREVIEW_LENGTH}) AS `{column}`" if column in large else f"`{column}`"
+             for column in columns] + [f"LENGTH(`{columns[col]}`)" for col in previews]
+        ) if previews else "*"
+
+        conditions, values = whereClause(filters)
+
+        if key is None and not unique:
+            ordering: str = "" if order is None else f" ORDER BY {order.clause()}"
+            limit: str = ""
+
+        elif key is None:
+            ordering = ", ".join(([] if order is None else [order.clause()]) + [f"`{column}`" for column in unique])
+            ordering = f" ORDER BY {ordering}"
+            limit = " LIMIT %s OFFSET %s"
+            values += [size, offset]
+
+        elif order is None or order.column == key:
+            descending: bool = order is not None and order.descending
+            ordering = f" ORDER BY `{key}`{' DESC' if descending else ''}"
+            limit = " LIMIT %s"
+
+            if after is not None:
+                conditions.append(f"`{key}` {'<' if descending else '>'} %s")
+                values.append(after)
+
+            values.append(size)
+
+        else:
+            ordering = f" ORDER BY {order.clause()}, `{key}`"
+            limit = " LIMIT %s OFFSET %s"
+            values += [size, offset]
+
+        where: str = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        query: str = f"SELECT {select} FROM `{database}`.`{table}`{where}{ordering}{limit};"
+        parameters: Tuple[Any, ...] = tuple(values)
+
+        if not limit:
+            rows, names = self.__streamData(query, parameters, size, offset, affinity)
+
+            if previews:
+                rows, names = [self.__withPreviews(row, previews, len(columns)) for row in rows], names[:len(columns)]
+
+            return rows, names, None
+
+        cacheKey: Optional[Hashable] = self.__resultKey(query, database)
+
+        if cacheKey is not None:
+            cacheKey = (*cacheKey, parameters)
+            cached: Optional[CachedResult] = self.__results.get(cacheKey)
+
+            if cached is not None:
+                self.__monitor.publish(
+                    QueryStats(query, rows=len(cached.rows), bytes=rowsSize(cached.rows), cached=True)
+                )
+
+                return cached.rows, cached.columns, cached.age()
+
+        rows, names = self.__fetchAll(query, parameters)
+
+        if previews:
+            rows, names = [self.__withPreviews(row, previews, len(columns)) for row in rows], names[:len(columns)]
 
-        return self.__cursor.fetchall(), self.__cursor.column_names
+        if cacheKey is not None:
+            self.__results.put(cacheKey, names, rows, (table.lower(),))
 
-    def getData(self, database: str, table: str) -> Tuple[List[Tuple[Any]], Tuple[str]]:
-        self.__cursor.execute(f"SELECT * FROM `{database}`.`{table}`;")
+        return rows, names, None
 
-        return self.__cursor.fetchall(), self.__cursor.column_names
+    def __streamData(self, query: str, parameters: Tuple[Any, ...], size: int, offset: int,
+                     affinity: Optional[Hashable]) -> Tuple[List[Tuple[Any]], Tuple[str]]:
+        with self.__dataLock:
+            stream: Optional[DataStream] = self.__dataStreams.pop(affinity, None)
 
-    def setDatabase(self, database: str) -> None:
-        self.__cursor.execute(f"USE `{database}`;")
+            if stream is not None and (stream.query, stream.parameters, stream.position) != (query, parameters, offset):
+                self.__closeData(stream)
+
+                stream = None
+
+            start: float = perf_counter()
+
+            try:
+                if stream is None:
+                    connection: MySQLConnection = self.__pool.openConnection()
+                    stream = DataStream(connection, connection.cursor(), query, parameters)
+
+                    stream.cursor.execute(query, parameters)
+
+                    while stream.position < offset:
+                        skipped: int = len(stream.cursor.fetchmany(min(size, offset - stream.position)))
+
+                        if not skipped:
+                            break
+
+                        stream = stream._replace(position=stream.position + skipped)
+
+                executed: float = perf_counter()
+                rows: List[Tuple[Any]] = stream.cursor.fetchmany(size)
+                names: Tuple[str] = stream.cursor.column_names
+
+            except Error:
+                if stream is not None:
+                    self.__closeData(stream)
+
+                raise
+
+            self.__monitor.publish(
+                QueryStats(query, executed - start, perf_counter() - executed, rows=len(rows), bytes=rowsSize(rows))
+            )
+
+            if len(rows) < size:
+                self.__closeData(stream)
+
+            else:
+                self.__dataStreams[affinity] = stream._replace(position=stream.position + len(rows))
+
+            return rows, names
+
+    def closeDataStream(self, affinity: Optional[Hashable] = None) -> None:
+        with self.__dataLock:
+            stream: Optional[DataStream] = self.__dataStreams.pop(affinity, None)
+
+            if stream is not None:
+                self.__closeData(stream)
+
+    def __closeData(self, stream: DataStream) -> None:
+        if stream.connection.unread_result:
+            self.__killQuery(stream.connection.connection_id)
+
+        self.__close(stream.connection)
+
+    @staticmethod
+    def __withPreviews(row: Tuple[Any], previews: List[int], width: int) -> Tuple[Any]:
+        values: List[Any] = list(row[:width])
+
+        for col, length in zip(previews, row[width:]):
+            prefix: Any = values[col]
+
+            if prefix is not None and length > len(prefix.encode("utf-8") if isinstance(prefix, str) else prefix):
+                values[col] = Preview(bytes(prefix) if isinstance(prefix, bytearray) else prefix, length)
+
+        return tuple(values)
+
+    def getIndexes(self, database: str, table: str) -> Dict[str, List[str]]:
+        return self.__catalog.get(
+            ("indexes", database, table),
+            lambda: indexColumns(self.__fetchAll(f"SHOW INDEX FROM `{database}`.`{table}`;")[0])
+        )
+
+    def getValueChunk(self, database: str, table: str, column: str, keys: Sequence[str], values: Sequence[Any],
+                      start: int, size: int) -> Union[str, bytes, None]:
+        rows, _ = self.__fetchAll(
+            f"SELECT SUBSTRING(`{column}`, %s, %s) FROM `{database}`.`{table}` "
+            f"WHERE {' AND '.join(f'`{key}` <=> %s' for key in keys)} LIMIT 1;",
+            (start + 1, size, *values)
+        )
+
+        return rows[0][0] if rows else None
+
+    @contextmanager
+    def streamQuery(self, query: str, parameters: Iterable = (), size: int = CHUNK_SIZE,
+                    database: Optional[str] = None) -> Iterator[Tuple[Tuple[str], Iterator[List[Tuple[Any]]]]]:
+        connection: MySQLConnection = self.__pool.openConnection()
+
+        try:
+            cursor: MySQLCursor = connection.cursor()
+
+            if database is not None:
+                cursor.execute(f"USE `{database}`;")
+
+            start: float = perf_counter()
+            cursor.execute(query, parameters)
+            stats: List[QueryStats] = [QueryStats(query, perf_counter() - start)]
+
+            yield cursor.column_names, self.__batches(cursor, size, stats)
+
+        finally:
+            if connection.unread_result:
+                self.__killQuery(connection.connection_id)
+
+            self.__close(connection)
+
+        self.__monitor.publish(stats[0])
+
+    @staticmethod
+    def __batches(cursor: MySQLCursor, size: int, stats: List[QueryStats]) -> Iterator[List[Tuple[Any]]]:
+        while True:
+            start: float = perf_counter()
+            rows: List[Tuple[Any]] = cursor.fetchmany(size)
+
+            stats[0] = stats[0]._replace(
+                fetch=stats[0].fetch + perf_counter() - start, rows=stats[0].rows + len(rows),
+                bytes=stats[0].bytes + rowsSize(rows)
+            )
+
+            if rows:
+                yield rows
+
+            if len(rows) < size:
+                return
+
+    def getDatabase(self, affinity: Hashable) -> Optional[str]:
+        return self.__databases.get(affinity)
+
+    def setDatabase(self, database: str, affinity: Optional[Hashable] = None) -> None:
+        if affinity is not None and self.__databases.get(affinity) == database:
+            return
+
+        with self.__cursor(affinity) as cursor:
+            cursor.execute(f"USE `{database}`;")
+
+        if affinity is not None:
+            self.__databases[affinity] = database
 
     def addDatabase(self, database: str) -> Optional[Error]:
         try:
-            self.__cursor.execute(f"CREATE DATABASE `{database}`;")
+            with self.__cursor() as cursor:
+                cursor.execute(f"CREATE DATABASE `{database}`;")
 
         except Error as error:
             return error
 
+        self.__catalog.invalidate(database)
+
         return None
 
     def dropDatabase(self, database: str) -> Optional[Error]:
         try:
-            self.__cursor.execute(f"DROP DATABASE `{database}`;")
+            with self.__cursor() as cursor:
+                cursor.execute(f"DROP DATABASE `{database}`;")
 
         except Error as error:
             return error
 
+        self.__catalog.invalidate(database)
+        self.__results.invalidate()
+
         return None
 
     def dropTable(self, database: str, table: str) -> Optional[Error]:
         try:
-            self.__cursor.execute(f"DROP TABLE `{database}`.`{table}`;")
+            with self.__cursor() as cursor:
+                cursor.execute(f"DROP TABLE `{database}`.`{table}`;")
 
         except Error as error:
             return error
 
+        self.__catalog.invalidate(database, table)
+        self.invalidateResults(table)
+
         return None
 
     def renameTable(self, database: str, old: str, new: str) -> Optional[Error]:
         try:
-            self.__cursor.execute(f"RENAME TABLE `{database}`.`{old}` TO `{database}`.`{new}`;")
+            with self.__cursor() as cursor:
+                cursor.execute(f"RENAME TABLE `{database}`.`{old}` TO `{database}`.`{new}`;")
 
         except Error as error:
             return error
 
+        self.__catalog.invalidate(database, old)
+        self.__catalog.invalidate(database, new)
+        self.invalidateResults(old)
+        self.invalidateResults(new)
+
         return None
 
-    def executeQuery(self, query: str) -> Union[Error, Tuple[List[Tuple[Any]], List[str]]]:
+    def __executed(self, query: str, affinity: Optional[Hashable]) -> None:
+        if SCHEMA_CHANGE.match(query):
+            self.__catalog.invalidate()
+
+        self.__written(query)
+
+        database = USE_DATABASE.match(query)
+
+        if database is not None and affinity is not None:
+            self.__databases[affinity] = database.group(1) or database.group(2)
+
+    def startQuery(self, query: str, affinity: Optional[Hashable] = None) -> Union[Error, Tuple[str]]:
+        self.__resetStream(affinity)
+
+        key: Optional[Hashable] = self.__resultKey(query, self.__databases.get(affinity))
+
+        if key is not None:
+            cached: Optional[CachedResult] = self.__results.get(key)
+
+            if cached is not None:
+                self.__replays[affinity] = (cached, 0)
+                self.__ages[affinity] = cached.age()
+                self.__stats[affinity] = QueryStats(query, cached=True)
+
+                return cached.columns
+
+        result: Union[Error, Tuple[str]] = self.__openStream((query,), affinity)
+
+        if key is not None and result and not isinstance(result, Error):
+            self.__pending[affinity] = (key, result, [], 0, referencedNames(query))
+
+        return result
+
+    def startBatch(self, queries: Sequence[str], affinity: Optional[Hashable] = None) -> Union[Error, Tuple[str]]:
+        self.__resetStream(affinity)
+
+        return self.__openStream(tuple(queries), affinity)
+
+    def nextResult(self, affinity: Optional[Hashable] = None) -> Union[Error, Tuple[str], None]:
+        self.__pending.pop(affinity, None)
+        self.__replays.pop(affinity, None)
+        self.__ages.pop(affinity, None)
+
+        if affinity not in self.__streams:
+            return None
+
+        return self.__advance(affinity)
+
+    def setExecutionTimeout(self, milliseconds: int, affinity: Hashable) -> None:
+        self.__timeouts[affinity] = max(milliseconds, 0)
+
+    def cancelQuery(self, affinity: Hashable) -> Optional[Error]:
+        connectionId: Optional[int] = self.__pool.connectionId(affinity)
+
+        if connectionId is None:
+            return None
+
+        return self.__killQuery(connectionId)
+
+    def __killQuery(self, connectionId: int) -> Optional[Error]:
+        try:
+            with self.__controlLock:
+                if self.__control is None:
+                    self.__control = self.__pool.openConnection()
+
+                else:
+                    self.__control.ping(reconnect=True, attempts=2)
+
+                cursor: MySQLCursor = self.__control.cursor()
+
+                try:
+                    cursor.execute(f"KILL QUERY {int(connectionId)};")
+
+                finally:
+                    cursor.close()
+
+        except Error as error:
+            return error
+
+        return None
+
+    def statementIndex(self, affinity: Optional[Hashable] = None) -> int:
+        return self.__positions.get(affinity, 0)
+
+    def canBatch(self, query: str) -> bool:
+        return not self.__results.budget() or not isCacheable(query)
+
+    def __resetStream(self, affinity: Optional[Hashable]) -> None:
+        self.__closeStream(affinity)
+        self.__replays.pop(affinity, None)
+        self.__ages.pop(affinity, None)
+        self.__stats.pop(affinity, None)
+        self.__positions.pop(affinity, None)
+
+    def __openStream(self, queries: Tuple[str, ...], affinity: Optional[Hashable]) -> Union[Error, Tuple[str]]:
+        try:
+            connection: MySQLConnection = self.__acquire(affinity)
+
+        except Error as error:
+            return error
+
+        cursor: MySQLCursor = connection.cursor()
+        timeout: int = self.__timeouts.get(affinity, 0)
+
+        if self.__appliedTimeouts.get(affinity, 0) != timeout:
+            try:
+                cursor.execute("SET SESSION max_execution_time = %s;", (timeout,))
+
+            except Error as error:
+                cursor.close()
+                self.__pool.release(connection, affinity)
+
+                return error
+
+            self.__appliedTimeouts[affinity] = timeout
+
+        self.__streams[affinity] = ResultStream(
+            connection, cursor, resultSets(cursor, STATEMENT_SEPARATOR.join(queries)), queries
+        )
+
+        result: Union[Error, Tuple[str], None] = self.__advance(affinity)
+
+        return () if result is None else result
+
+    def __advance(self, affinity: Optional[Hashable]) -> Union[Error, Tuple[str], None]:
+        stream: ResultStream = self.__streams[affinity]
+        index: int = min(stream.index + stream.finished, len(stream.queries) - 1)
+
+        start: float = perf_counter()
+
+        try:
+            stream.connection.consume_results()
+
+            cursor: Optional[MySQLCursor] = next(stream.results, None)
+
+        except Error as error:
+            self.__positions[affinity] = index
+            self.__closeStream(affinity)
+
+            return error
+
+        if cursor is None:
+            self.__closeStream(affinity)
+
+            return None
+
+        query: str = stream.queries[index]
+        finished: bool = not cursor.with_rows or not CALL_PROCEDURE.match(query)
+
+        self.__positions[affinity] = index
+        self.__streams[affinity] = stream._replace(index=index, finished=finished)
+        self.__stats[affinity] = QueryStats(query, perf_counter() - start)
+
+        if finished:
+            self.__executed(query, affinity)
+
+        if not cursor.with_rows:
+            self.__stats[affinity] = self.__stats[affinity]._replace(rows=max(cursor.rowcount, 0))
+
+            if index == len(stream.queries) - 1:
+                self.__closeStream(affinity)
+
+            return ()
+
+        return cursor.column_names
+
+    def fetchRows(self, size: int, affinity: Optional[Hashable] = None) -> Union[Error, List[Tuple[Any]]]:
+        replay: Optional[Tuple[CachedResult, int]] = self.__replays.get(affinity)
+
+        if replay is not None:
+            cached, position = replay
+            rows: List[Tuple[Any]] = cached.rows[position:position + size]
+
+            if len(rows) < size:
+                del self.__replays[affinity]
+
+            else:
+                self.__replays[affinity] = (cached, position + size)
+
+            self.__countRows(affinity, rows, 0.0)
+
+            return rows
+
+        stream: ResultStream = self.__streams[affinity]
+        start: float = perf_counter()
+
+        try:
+            rows: List[Tuple[Any]] = stream.cursor.fetchmany(size)
+
+        except Error as error:
+            self.__closeStream(affinity)
+
+            return error
+
+        self.__countRows(affinity, rows, perf_counter() - start)
+
+        pending = self.__pending.get(affinity)
+
+        if pending is not None:
+            key, columns, buffered, used, names = pending
+            used += estimateSize(rows)
+
+            if used > self.__results.budget():
+                del self.__pending[affinity]
+
+            else:
+                buffered.extend(rows)
+
+                self.__pending[affinity] = (key, columns, buffered, used, names)
+
+                if len(rows) < size:
+                    self.__results.put(key, columns, buffered, names, used)
+
+        if len(rows) < size and stream.finished and stream.index == len(stream.queries) - 1:
+            self.__closeStream(affinity)
+
+        return rows
+
+    def __countRows(self, affinity: Optional[Hashable], rows: List[Tuple[Any]], seconds: float) -> None:
+        stats: Optional[QueryStats] = self.__stats.get(affinity)
+
+        if stats is not None:
+            self.__stats[affinity] = stats._replace(
+                fetch=stats.fetch + seconds, rows=stats.rows + len(rows), bytes=stats.bytes + rowsSize(rows)
+            )
+
+    def __closeStream(self, affinity: Optional[Hashable]) -> None:
+        self.__pending.pop(affinity, None)
+
+        stream: Optional[ResultStream] = self.__streams.pop(affinity, None)
+
+        if stream is None:
+            return
+
+        try:
+            stream.connection.consume_results()
+
+            for _ in stream.results:
+                stream.connection.consume_results()
+
+            stream.cursor.close()
+
+        except Error:
+            pass
+
+        self.__pool.release(stream.connection, affinity)
+
+    def insertRows(self, database: str, table: str, columns: Sequence[str],
+                   rows: Sequence[Sequence[Any]]) -> Optional[Error]:
+        row: str = f"({', '.join('%s' for _ in columns)})"
+
+        return self.executeQueries(
+            [
+                f"INSERT INTO `{database}`.`{table}` ({', '.join(f'`{column}`' for column in columns)}) "
+                f"VALUES {', '.join(row for _ in rows)}"
+            ],
+            [[value for values in rows for value in values]]
+        )
+
+    def localInfileEnabled(self) -> bool:
         try:
-            self.__cursor.execute(query)
+            with self.__cursor() as cursor:
+                cursor.execute("SELECT @@GLOBAL.local_infile;")
+
+                return bool(cursor.fetchone()[0])
+
+        except (Error, TypeError, ValueError):
+            return False
+
+    def loadDataFile(self, database: str, table: str, columns: Sequence[str], fileName: str,
+                     lineTerminator: str = "\n") -> Union[Error, Tuple[int, int]]:
+        variables: List[str] = [f"@column{index}" for index in range(len(columns))]
+        assignments: str = ", ".join(
+            f"`{column}` = NULLIF({variable}, %s)" for column, variable in zip(columns, variables)
+        )
+
+        query: str = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE `{database}`.`{table}` CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' LINES TERMINATED BY %s "
+            f"IGNORE 1 LINES ({', '.join(variables)}) "
+            f"SET {assignments};"
+        )
+
+        try:
+            with self.__cursor() as cursor:
+                start: float = perf_counter()
+                cursor.execute(query, (fileName, lineTerminator, *(NULL_TEXT for _ in columns)))
+
+                result: Tuple[int, int] = cursor.rowcount, cursor.warning_count or 0
+
+                self.__monitor.publish(QueryStats(query, perf_counter() - start, rows=max(cursor.rowcount, 0)))
 
         except Error as error:
             return error
 
-        return self.__cursor.fetchall(), self.__cursor.column_names
+        self.invalidateResults(table)
+
+        return result
 
     def executeQueries(self, queries: List[str], parameters: List[Iterable]) -> Optional[Error]:
         try:
+            connection: MySQLConnection = self.__pool.acquire()
+
+        except Error as error:
+            return error
+
+        cursor: MySQLCursor = connection.cursor()
+        executed: List[QueryStats] = []
+
+        try:
+            connection.start_transaction()
+
             for query, parameter in zip(queries, parameters):
-                self.__cursor.execute(query, parameter)
+                start: float = perf_counter()
+                cursor.execute(query, parameter)
+
+                executed.append(QueryStats(query, perf_counter() - start, rows=max(cursor.rowcount, 0)))
+
+            connection.commit()
 
         except Error as error:
+            self.__rollback(connection)
+
             return error
 
+        finally:
+            cursor.close()
+            self.__pool.release(connection)
+
+        for query in queries:
+            self.__written(query)
+
+        for stats in executed:
+            self.__monitor.publish(stats)
+
         return None
+
+    def executeBatch(self, batch: WriteBatch) -> BatchReport:
+        start: float = perf_counter()
+        applied: int = 0
+        chunks: int = 0
+
+        try:
+            connection: MySQLConnection = self.__pool.acquire()
+
+        except Error as error:
+            return BatchReport(applied, len(batch), chunks, perf_counter() - start, error)
+
+        cursor: MySQLCursor = connection.cursor()
+
+        try:
+            for size, statements in batch.chunks(self.__chunkSize):
+                executed: List[QueryStats] = []
+
+                try:
+                    connection.start_transaction()
+
+                    for query, parameters, many in statements:
+                        statementStart: float = perf_counter()
+
+                        if many:
+                            cursor.executemany(query, parameters)
+
+                        else:
+                            cursor.execute(query, parameters)
+
+                        executed.append(
+                            QueryStats(query, perf_counter() - statementStart, rows=max(cursor.rowcount, 0))
+                        )
+
+                    connection.commit()
+
+                except Error as error:
+                    self.__rollback(connection)
+
+                    return BatchReport(applied, len(batch), chunks, perf_counter() - start, error)
+
+                applied += size
+                chunks += 1
+
+                for stats in executed:
+                    self.__monitor.publish(stats)
+
+        finally:
+            cursor.close()
+            self.__pool.release(connection)
+            self.invalidateResults(batch.table)
+
+        return BatchReport(applied, len(batch), chunks, perf_counter() - start)
+
+    @staticmethod
+    def __close(connection: MySQLConnection) -> None:
+        try:
+            connection.close()
+
+        except Error:
+            pass
+
+    @staticmethod
+    def __rollback(connection: MySQLConnection) -> None:
+        try:
+            connection.rollback()
+
+        except Error:
+            pass
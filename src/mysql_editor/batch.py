@@ -0,0 +1,138 @@
+from itertools import islice
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from mysql.connector.errors import Error
+
+CHUNK_SIZE: int = 500
+
+
+class BatchReport(NamedTuple):
+    applied: int
+    total: int
+    chunks: int
+    seconds: float
+    error: Optional[Error] = None
+
+    def rowsPerSecond(self) -> float:
+        return self.applied / self.seconds if self.seconds else 0.0
+
+
+class WriteBatch:
+    def __init__(self, database: str, table: str, columns: Tuple[str], unique: Tuple[str, ...]):
+        self.database: str = database
+        self.table: str = table
+        self.columns: Tuple[str] = columns
+        self.unique: Tuple[str, ...] = unique
+
+        self.deletes: List[Tuple[Any, ...]] = []
+        self.updates: List[Tuple[Tuple[Any, ...], Dict[int, str]]] = []
+        self.inserts: List[Sequence[Optional[str]]] = []
+
+    def __len__(self) -> int:
+        return len(self.deletes) + len(self.updates) + len(self.inserts)
+
+    def chunks(self, size: int) -> Iterator[Tuple[int, List[Tuple[str, Sequence[Any], bool]]]]:
+        operations = self.__operations()
+
+        while True:
+            chunk: List[Tuple[str, Any]] = list(islice(operations, max(size, 1)))
+
+            if not chunk:
+                return
+
+            yield len(chunk), self.__statements(chunk)
+
+    def __operations(self) -> Iterator[Tuple[str, Any]]:
+        for key in self.deletes:
+            yield "delete", key
+
+        for update in self.updates:
+            yield "update", update
+
+        for row in self.inserts:
+            yield "insert", row
+
+    def __statements(self, chunk: List[Tuple[str, Any]]) -> List[Tuple[str, Sequence[Any], bool]]:
+        name: str = f"`{self.database}`.`{self.table}`"
+
+        keyCols: Set[int] = {self.columns.index(column) for column in self.unique}
+
+        deletes: List[Tuple[Any, ...]] = []
+        updates: List[Tuple[Tuple[Any, ...], Dict[int, str]]] = []
+        keyUpdates: Dict[Tuple[int, ...], List[Tuple[Any, ...]]] = {}
+        inserts: List[Sequence[Any]] = []
+
+        for kind, operation in chunk:
+            if kind == "delete":
+                deletes.append(operation)
+
+            elif kind == "update":
+                key, values = operation
+
+                if keyCols.isdisjoint(values):
+                    updates.append(operation)
+
+                else:
+                    keyUpdates.setdefault(tuple(values), []).append((*values.values(), *key))
+
+            else:
+                inserts.append(operation)
+
+        statements: List[Tuple[str, Sequence[Any], bool]] = []
+
+        if deletes:
+            statements.append((
+                f"DELETE FROM {name} WHERE {self.__matchesAny(len(deletes))}",
+                [value for key in deletes for value in key], False
+            ))
+
+        if updates:
+            statements.append(self.__caseUpdate(name, updates))
+
+        for cols, parameters in keyUpdates.items():
+            statements.append((
+                f"UPDATE {name} SET {', '.join(f'`{self.columns[col]}` = %s' for col in cols)} "
+                f"WHERE {' AND '.join(f'`{column}` = %s' for column in self.unique)}", parameters, True
+            ))
+
+        if inserts:
+            cols: List[int] = [
+                col for col in range(len(self.columns)) if any(insert[col] is not None for insert in inserts)
+            ]
+            rows: str = ", ".join(
+                f"({', '.join('DEFAULT' if insert[col] is None else '%s' for col in cols)})" for insert in inserts
+            )
+
+            statements.append((
+                f"INSERT INTO {name} ({', '.join(f'`{self.columns[col]}`' for col in cols)}) VALUES {rows}",
+                [insert[col] for insert in inserts for col in cols if insert[col] is not None], False
+            ))
+
+        return statements
+
+    def __caseUpdate(self, name: str,
+                     updates: List[Tuple[Tuple[Any, ...], Dict[int, str]]]) -> Tuple[str, Sequence[Any], bool]:
+        match: str = " AND ".join(f"`{column}` = %s" for column in self.unique)
+        assignments: List[str] = []
+        parameters: List[Any] = []
+
+        for col in sorted({col for _, values in updates for col in values}):
+            cases: List[Tuple[Tuple[Any, ...], str]] = [(key, values[col]) for key, values in updates if col in values]
+
+            assignments.append(
+                f"`{self.columns[col]}` = CASE {' '.join(f'WHEN {match} THEN %s' for _ in cases)} "
+                f"ELSE `{self.columns[col]}` END"
+            )
+            parameters.extend(value for key, text in cases for value in (*key, text))
+
+        parameters.extend(value for key, _ in updates for value in key)
+
+        return f"UPDATE {name} SET {', '.join(assignments)} WHERE {self.__matchesAny(len(updates))}", parameters, False
+
+    def __matchesAny(self, count: int) -> str:
+        if len(self.unique) == 1:
+            return f"`{self.unique[0]}` IN ({', '.join('%s' for _ in range(count))})"
+
+        key: str = f"({', '.join('%s' for _ in self.unique)})"
+
+        return f"({', '.join(f'`{column}`' for column in self.unique)}) IN ({', '.join(key for _ in range(count))})"
@@ -0,0 +1,99 @@
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+CATALOG_TTL: float = 300.0
+
+
+class CatalogCache:
+    def __init__(self, ttl: float = CATALOG_TTL):
+        self.__ttl: float = ttl
+
+        self.__lock = Lock()
+        self.__entries: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+        self.__loading: Dict[Tuple[Hashable, ...], Lock] = {}
+        self.__generation: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: Tuple[Hashable, ...], loader: Callable[[], Any]) -> Any:
+        with self.__lock:
+            value: Optional[Tuple[float, Any]] = self.__lookup(key)
+
+            if value is not None:
+                return value[1]
+
+            keyLock: Lock = self.__loading.setdefault(key, Lock())
+
+        with keyLock:
+            with self.__lock:
+                value = self.__lookup(key)
+
+                if value is not None:
+                    return value[1]
+
+                self.misses += 1
+
+                generation: int = self.__generation
+
+            try:
+                result: Any = loader()
+
+            except Exception:
+                with self.__lock:
+                    self.__loading.pop(key, None)
+
+                raise
+
+            with self.__lock:
+                self.__loading.pop(key, None)
+
+                if generation == self.__generation:
+                    self.__entries[key] = (monotonic(), result)
+
+        return result
+
+    def generation(self) -> int:
+        with self.__lock:
+            return self.__generation
+
+    def fill(self, entries: Dict[Tuple[Hashable, ...], Any], generation: int) -> None:
+        with self.__lock:
+            if generation != self.__generation:
+                return
+
+            now: float = monotonic()
+
+            for key, value in entries.items():
+                self.__entries[key] = (now, value)
+
+    def invalidate(self, database: Optional[str] = None, table: Optional[str] = None) -> None:
+        with self.__lock:
+            self.__generation += 1
+
+            if database is None:
+                self.__entries.clear()
+
+                return
+
+            for key in list(self.__entries):
+                if len(key) == 1:
+                    if table is None:
+                        del self.__entries[key]
+
+                elif key[1] != database:
+                    continue
+
+                elif table is None or key[0] == "tables" or key[2] == table:
+                    del self.__entries[key]
+
+    def __lookup(self, key: Tuple[Hashable, ...]) -> Optional[Tuple[float, Any]]:
+        entry: Optional[Tuple[float, Any]] = self.__entries.get(key)
+
+        if entry is None or monotonic() - entry[0] >= self.__ttl:
+            return None
+
+        self.hits += 1
+
+        return entry
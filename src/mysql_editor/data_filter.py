@@ -0,0 +1,129 @@
+import re
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+COMPARISON = re.compile(r"\s*(>=|<=|<>|!=|=|>|<)\s*(.*?)\s*$", re.DOTALL)
+NOT_NULL = re.compile(r"\s*(NOT\s+NULL|!\s*NULL)\s*$", re.IGNORECASE)
+IS_NULL = re.compile(r"\s*NULL\s*$", re.IGNORECASE)
+
+
+class SortOrder(NamedTuple):
+    column: str
+    descending: bool = False
+
+    def clause(self) -> str:
+        return f"`{self.column}`{' DESC' if self.descending else ''}"
+
+
+class DataFilter(NamedTuple):
+    column: str
+    text: str
+
+    def condition(self) -> Tuple[str, Tuple[Any, ...]]:
+        column: str = f"`{self.column}`"
+
+        if IS_NULL.match(self.text):
+            return f"{column} IS NULL", ()
+
+        if NOT_NULL.match(self.text):
+            return f"{column} IS NOT NULL", ()
+
+        comparison = COMPARISON.match(self.text)
+
+        if comparison is not None:
+            operator, value = comparison.groups()
+
+            return f"{column} {'<>' if operator == '!=' else operator} %s", (value,)
+
+        if "%" in self.text:
+            return f"{column} LIKE %s", (self.text,)
+
+        return f"{column} = %s", (self.text,)
+
+    def isEquality(self) -> bool:
+        return self.condition()[0].endswith((" = %s", " IS NULL"))
+
+    def canUseIndex(self) -> bool:
+        condition, parameters = self.condition()
+
+        if condition.endswith(("<> %s", "IS NOT NULL")):
+            return False
+
+        return not condition.endswith("LIKE %s") or not parameters[0].startswith("%")
+
+
+def whereClause(filters: Sequence[DataFilter]) -> Tuple[List[str], List[Any]]:
+    conditions: List[str] = []
+    parameters: List[Any] = []
+
+    for filter_ in filters:
+        condition, values = filter_.condition()
+
+        conditions.append(condition)
+        parameters.extend(values)
+
+    return conditions, parameters
+
+
+def indexColumns(rows: Sequence[Tuple[Any, ...]]) -> Dict[str, List[str]]:
+    indexes: Dict[str, List[Tuple[int, str]]] = {}
+
+    for row in rows:
+        indexes.setdefault(row[2], []).append((row[3], row[4]))
+
+    return {name: [column for _, column in sorted(columns)] for name, columns in indexes.items()}
+
+
+def usableIndex(indexes: Dict[str, List[str]], filters: Sequence[DataFilter],
+                order: Optional[SortOrder]) -> Tuple[Optional[str], Optional[str]]:
+    equal: Dict[str, bool] = {filter_.column: filter_.isEquality() for filter_ in filters if filter_.canUseIndex()}
+    filterIndex: Optional[str] = None
+    filterColumns: int = 0
+    orderIndex: Optional[str] = None
+
+    for name, columns in indexes.items():
+        used: int = 0
+
+        while used < len(columns) and equal.get(columns[used]):
+            used += 1
+
+        if used < len(columns) and columns[used] in equal:
+            ranged: int = used + 1
+
+        else:
+            ranged = used
+
+        if ranged > filterColumns:
+            filterIndex, filterColumns = name, ranged
+
+        if order is not None and orderIndex is None and (
+                (used < len(columns) and columns[used] == order.column) or order.column in columns[:used]
+        ):
+            orderIndex = name
+
+    return filterIndex, orderIndex
+
+
+def describeIndexUse(indexes: Dict[str, List[str]], filters: Sequence[DataFilter],
+                     order: Optional[SortOrder]) -> str:
+    filterIndex, orderIndex = usableIndex(indexes, filters, order)
+    parts: List[str] = []
+
+    if filters:
+        columns: str = ", ".join(f"`{filter_.column}`" for filter_ in filters)
+
+        if filterIndex is not None:
+            parts.append(f"Filtering on {columns} can use index `{filterIndex}`")
+
+        else:
+            parts.append(f"Filtering on {columns} reads the whole table, no usable index starts with these columns")
+
+    if order is not None:
+        if orderIndex is not None:
+            parts.append(f"sorting by `{order.column}` can use index `{orderIndex}`")
+
+        else:
+            parts.append(f"sorting by `{order.column}` sorts every matching row, no index covers it")
+
+    text: str = "; ".join(parts)
+
+    return text[:1].upper() + text[1:]
@@ -0,0 +1,214 @@
+import csv
+import datetime
+import gzip
+import io
+import json
+import os.path
+from decimal import Decimal
+from threading import Event
+from time import perf_counter
+from typing import Any, BinaryIO, Callable, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+from PySide6.QtCore import Slot
+from PySide6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog, QWidget
+from mysql.connector.errors import Error
+
+from mysql_editor.backend import NULL_TEXT, Backend
+from mysql_editor.settings import getIntSetting
+from mysql_editor.worker import WorkerPool
+
+try:
+    import zstandard
+
+except ImportError:
+    zstandard = None
+
+EXPORT_BATCH_SIZE: int = 5000
+EXPORT_PROGRESS_INTERVAL: float = 0.25
+
+FILTERS: List[Tuple[str, str]] = [
+    ("CSV (*.csv)", ".csv"),
+    ("CSV, gzip compressed (*.csv.gz)", ".csv.gz"),
+    ("JSON Lines (*.jsonl)", ".jsonl"),
+    ("JSON Lines, gzip compressed (*.jsonl.gz)", ".jsonl.gz"),
+]
+
+if zstandard is not None:
+    FILTERS += [
+        ("CSV, zstd compressed (*.csv.zst)", ".csv.zst"),
+        ("JSON Lines, zstd compressed (*.jsonl.zst)", ".jsonl.zst"),
+    ]
+
+
+class ExportReport(NamedTuple):
+    rows: int
+    bytesWritten: int
+    seconds: float
+    stopped: bool = False
+
+    def rowsPerSecond(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def textValue(value: Any) -> str:
+    if value is None:
+        return NULL_TEXT
+
+    if isinstance(value, (bytes, bytearray)):
+        try:
+            return value.decode("utf-8")
+
+        except UnicodeDecodeError:
+            return f"0x{value.hex()}"
+
+    return f"{value}"
+
+
+def jsonValue(value: Any) -> Any:
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+
+    if isinstance(value, (bytes, bytearray, Decimal, datetime.timedelta)):
+        return textValue(value)
+
+    if isinstance(value, set):
+        return sorted(value)
+
+    raise TypeError(f"Cannot export values of type {type(value).__name__}")
+
+
+def exportFormat(fileName: str) -> Tuple[str, Optional[str]]:
+    name: str = fileName.lower()
+    compression: Optional[str] = None
+
+    if name.endswith(".gz"):
+        name, compression = name[:-3], "gzip"
+
+    elif name.endswith(".zst"):
+        name, compression = name[:-4], "zstd"
+
+    return ("jsonl" if name.endswith((".jsonl", ".json")) else "csv"), compression
+
+
+def openOutput(raw: BinaryIO, compression: Optional[str]) -> TextIO:
+    if compression == "gzip":
+        raw = gzip.GzipFile(fileobj=raw, mode="wb")
+
+    elif compression == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd compression needs the zstandard package")
+
+        raw = zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def exportQuery(query: str, database: Optional[str], fileName: str, batchSize: int, stop: Event,
+                progress: Callable[[ExportReport], None]) -> Union[Error, ExportReport]:
+    kind, compression = exportFormat(fileName)
+    start: float = perf_counter()
+    reported: float = start
+    rows: int = 0
+    stopped: bool = False
+
+    with Backend().streamQuery(query, size=batchSize, database=database) as (columns, batches):
+        if not columns:
+            return Error(msg="The query does not return any rows to export")
+
+        try:
+            with open(fileName, "wb") as raw, openOutput(raw, compression) as output:
+                if kind == "csv":
+                    writer = csv.writer(output)
+                    writer.writerow(columns)
+
+                for batch in batches:
+                    if stop.is_set():
+                        stopped = True
+
+                        break
+
+                    if kind == "csv":
+                        writer.writerows([textValue(value) for value in row] for row in batch)
+
+                    else:
+                        output.writelines(
+                            f"{json.dumps(dict(zip(columns, row)), default=jsonValue, ensure_ascii=False)}\n"
+                            for row in batch
+                        )
+
+                    rows += len(batch)
+                    now: float = perf_counter()
+
+                    if now - reported >= EXPORT_PROGRESS_INTERVAL:
+                        reported = now
+
+                        progress(ExportReport(rows, raw.tell(), now - start))
+
+        except (OSError, TypeError, ValueError) as error:
+            return Error(msg=f"{error}")
+
+    return ExportReport(rows, os.path.getsize(fileName), perf_counter() - start, stopped)
+
+
+class ExportDialog(QProgressDialog):
+    def __init__(self, parent: QWidget, query: str, database: Optional[str] = None):
+        super().__init__("Exporting", "Stop", 0, 0, parent)
+
+        self.setWindowTitle("Export")
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+        self.setMinimumDuration(0)
+
+        self.__query: str = query
+        self.__database: Optional[str] = database
+        self.__fileName: str = ""
+        self.__stop = Event()
+
+        self.canceled.connect(self.__stop.set)
+
+    def start(self, name: str) -> None:
+        filters: str = ";;".join(label for label, _ in FILTERS)
+        fileName, selected = QFileDialog.getSaveFileName(self.parentWidget(), "Export", name, filters)
+
+        if not fileName:
+            self.deleteLater()
+
+            return
+
+        extension: str = dict(FILTERS).get(selected, "")
+
+        if extension and not fileName.lower().endswith(extension):
+            fileName += extension
+
+        self.__fileName = fileName
+        self.setLabelText(f"Exporting to {fileName}")
+        self.show()
+
+        WorkerPool().run(
+            exportQuery, self.__query, self.__database, fileName,
+            getIntSetting("ExportBatchSize", EXPORT_BATCH_SIZE), self.__stop, finished=self.__exported,
+            progress=self.__showProgress
+        )
+
+    @Slot(object)
+    def __showProgress(self, report: ExportReport) -> None:
+        self.setLabelText(
+            f"Exporting to {self.__fileName}\n{report.rows} rows, {report.bytesWritten / 1048576:.1f} MiB written "
+            f"({report.rowsPerSecond():.0f} rows/s)"
+        )
+
+    @Slot(object)
+    def __exported(self, report: Union[Error, ExportReport]) -> None:
+        self.close()
+        self.deleteLater()
+
+        if isinstance(report, Error):
+            QMessageBox.critical(self.parentWidget(), "Error", report.msg)
+
+            return
+
+        QMessageBox.information(
+            self.parentWidget(), "Export",
+            f"{'Stopped after exporting' if report.stopped else 'Exported'} {report.rows} rows to {self.__fileName} "
+            f"in {report.seconds:.2f} s ({report.rowsPerSecond():.0f} rows/s, {report.bytesWritten / 1048576:.1f} MiB)"
+        )
@@ -1,12 +1,15 @@
+import os.path
+from codecs import getincrementaldecoder
 from io import TextIOWrapper
-from typing import Optional
+from typing import Iterator, Optional
+
+READ_CHUNK_SIZE: int = 1 << 20
 
 
 class File:
     def __init__(self):
         self.name: str = ""
         self.file: Optional[TextIOWrapper] = None
-        self.contents: str = ""
 
     def open(self, name: str, mode: str):
         if self.file is not None and not self.file.closed:
@@ -15,12 +18,41 @@ class File:
         self.name = name
         self.file = open(name, mode)
 
-        if "r" in mode:
-            self.contents = self.file.read()
+    def read(self) -> str:
+        self.file.seek(0)
+
+        return self.file.read()
 
     def save(self, content: str):
         self.file.truncate(0)
         self.file.seek(0)
-        self.contents = content
         self.file.write(content)
         self.file.flush()
+
+
+class ScriptReader:
+    def __init__(self, name: str, chunkSize: int = READ_CHUNK_SIZE):
+        self.name: str = name
+        self.size: int = os.path.getsize(name)
+        self.bytesRead: int = 0
+
+        self.__chunkSize: int = chunkSize
+
+    def __iter__(self) -> Iterator[str]:
+        decoder = getincrementaldecoder("utf-8")(errors="replace")
+
+        with open(self.name, "rb") as file:
+            while True:
+                block: bytes = file.read(self.__chunkSize)
+
+                if not block:
+                    break
+
+                self.bytesRead += len(block)
+
+                yield decoder.decode(block)
+
+        tail: str = decoder.decode(b"", True)
+
+        if tail:
+            yield tail
@@ -0,0 +1,94 @@
+import re
+from typing import Dict, FrozenSet, Optional, Pattern
+
+from PySide6.QtGui import QColor, QFont, QSyntaxHighlighter, QTextCharFormat, QTextDocument
+
+KEYWORDS: FrozenSet[str] = frozenset((
+    "ADD", "ALL", "ALTER", "AND", "AS", "ASC", "AUTO_INCREMENT", "BEGIN", "BETWEEN", "BY", "CALL", "CASE", "CHECK",
+    "COLUMN", "COMMIT", "CONSTRAINT", "CREATE", "CROSS", "DATABASE", "DATABASES", "DECLARE", "DEFAULT", "DELETE",
+    "DELIMITER", "DESC", "DESCRIBE", "DISTINCT", "DROP", "ELSE", "END", "ENGINE", "EXISTS", "EXPLAIN", "FOREIGN",
+    "FROM", "FULL", "FUNCTION", "GRANT", "GROUP", "HAVING", "IF", "IN", "INDEX", "INNER", "INSERT", "INTO", "IS",
+    "JOIN", "KEY", "LEFT", "LIKE", "LIMIT", "NOT", "NULL", "OFFSET", "ON", "OR", "ORDER", "OUTER", "PRIMARY",
+    "PROCEDURE", "REFERENCES", "RENAME", "REPLACE", "RETURN", "RETURNS", "REVOKE", "RIGHT", "ROLLBACK", "SELECT", "SET",
+    "SHOW", "START", "TABLE", "TABLES", "THEN", "TO", "TRANSACTION", "TRIGGER", "TRUNCATE", "UNION", "UNIQUE",
+    "UNSIGNED", "UPDATE", "USE", "USING", "VALUES", "VIEW", "WHEN", "WHERE", "WITH",
+))
+
+TOKENS: Pattern = re.compile(
+    r"(?P<comment>(?:--(?=\s|$)|#).*)|(?P<open>/\*|['\"`])|(?P<number>\b\d+(?:\.\d+)?\b)|(?P<word>\b[A-Za-z_]\w*\b)"
+)
+CLOSES: Dict[str, Pattern] = {
+    "/*": re.compile(r"\*/"),
+    "'": re.compile(r"(?:[^'\\]|\\.)*'"),
+    '"': re.compile(r'(?:[^"\\]|\\.)*"'),
+    "`": re.compile(r"[^`]*`"),
+}
+STATES: Dict[str, int] = {"/*": 1, "'": 2, '"': 3, "`": 4}
+OPENERS: Dict[int, str] = {state: opener for opener, state in STATES.items()}
+
+
+def textFormat(color: str, bold: bool = False, italic: bool = False) -> QTextCharFormat:
+    format_ = QTextCharFormat()
+    format_.setForeground(QColor(color))
+
+    if bold:
+        format_.setFontWeight(QFont.Weight.Bold)
+
+    format_.setFontItalic(italic)
+
+    return format_
+
+
+class SqlHighlighter(QSyntaxHighlighter):
+    def __init__(self, document: Optional[QTextDocument] = None):
+        super().__init__(document)
+
+        self.__formats: Dict[str, QTextCharFormat] = {
+            "keyword": textFormat("#0033b3", bold=True),
+            "comment": textFormat("#8c8c8c", italic=True),
+            "/*": textFormat("#8c8c8c", italic=True),
+            "'": textFormat("#067d17"),
+            '"': textFormat("#067d17"),
+            "`": textFormat("#871094"),
+            "number": textFormat("#1750eb"),
+        }
+
+    def highlightBlock(self, text: str) -> None:
+        self.setCurrentBlockState(0)
+
+        position: int = 0
+        opener: Optional[str] = OPENERS.get(self.previousBlockState())
+
+        if opener is not None:
+            position = self.__close(text, opener, 0, 0)
+
+        while position < len(text):
+            match = TOKENS.search(text, position)
+
+            if match is None:
+                return
+
+            kind: str = match.lastgroup
+            position = match.end()
+
+            if kind == "open":
+                position = self.__close(text, match.group(), match.start(), position)
+
+            elif kind != "word":
+                self.setFormat(match.start(), position - match.start(), self.__formats[kind])
+
+            elif match.group().upper() in KEYWORDS:
+                self.setFormat(match.start(), position - match.start(), self.__formats["keyword"])
+
+    def __close(self, text: str, opener: str, start: int, position: int) -> int:
+        match = CLOSES[opener].search(text, position) if opener == "/*" else CLOSES[opener].match(text, position)
+
+        if match is None:
+            self.setFormat(start, len(text) - start, self.__formats[opener])
+            self.setCurrentBlockState(STATES[opener])
+
+            return len(text)
+
+        self.setFormat(start, match.end() - start, self.__formats[opener])
+
+        return match.end()
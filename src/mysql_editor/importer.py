@@ -0,0 +1,342 @@
+import csv
+import io
+import json
+from queue import Queue
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any, BinaryIO, Callable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from PySide6.QtCore import Signal, Slot
+from PySide6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog, QWidget
+from mysql.connector.errors import Error
+
+from mysql_editor.backend import NULL_TEXT, Backend
+from mysql_editor.settings import getIntSetting
+from mysql_editor.worker import WorkerPool
+
+IMPORT_BATCH_SIZE: int = 1000
+IMPORT_QUEUE_DEPTH: int = 4
+IMPORT_PROGRESS_INTERVAL: float = 0.25
+IMPORT_ERRORS_SHOWN: int = 10
+
+Batch = List[Tuple[int, List[Any]]]
+
+
+class ImportReport(NamedTuple):
+    inserted: int
+    rejected: int
+    bytesRead: int
+    size: int
+    seconds: float
+    errors: List[Tuple[int, str]]
+    method: str = "INSERT"
+    stopped: bool = False
+    warnings: int = 0
+
+    def rowsPerSecond(self) -> float:
+        return self.inserted / self.seconds if self.seconds else 0.0
+
+
+def importValue(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+
+    if isinstance(value, bool):
+        return int(value)
+
+    return value
+
+
+class RowReader:
+    def __init__(self, raw: BinaryIO, fileName: str, fields: Sequence[str]):
+        self.columns: List[str] = []
+        self.rejected: int = 0
+        self.errors: List[Tuple[int, str]] = []
+
+        self.__raw: BinaryIO = raw
+        self.__text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        self.__json: bool = fileName.lower().endswith((".jsonl", ".json"))
+        self.__fields = {field.lower(): field for field in fields}
+
+    def bytesRead(self) -> int:
+        return self.__raw.tell()
+
+    def rows(self) -> Iterator[Tuple[int, List[Any]]]:
+        return self.__jsonRows() if self.__json else self.__csvRows()
+
+    def __reject(self, line: int, message: str) -> None:
+        self.rejected += 1
+
+        if len(self.errors) < IMPORT_ERRORS_SHOWN:
+            self.errors.append((line, message))
+
+    def __mapColumns(self, names: Sequence[str]) -> None:
+        unknown: List[str] = [name for name in names if name.lower() not in self.__fields]
+
+        if unknown:
+            raise ValueError(f"The table has no column named {', '.join(unknown)}")
+
+        self.columns = [self.__fields[name.lower()] for name in names]
+
+    def __csvRows(self) -> Iterator[Tuple[int, List[Any]]]:
+        reader = csv.reader(self.__text)
+
+        self.__mapColumns(next(reader, []))
+
+        for row in reader:
+            if len(row) != len(self.columns):
+                self.__reject(reader.line_num, f"Expected {len(self.columns)} fields, found {len(row)}")
+
+                continue
+
+            yield reader.line_num, [None if value == NULL_TEXT else value for value in row]
+
+    def __jsonRows(self) -> Iterator[Tuple[int, List[Any]]]:
+        keys: Optional[List[str]] = None
+
+        for line, text in enumerate(self.__text, 1):
+            if not text.strip():
+                continue
+
+            try:
+                record: Any = json.loads(text)
+
+            except ValueError as error:
+                self.__reject(line, f"{error}")
+
+                continue
+
+            if not isinstance(record, dict):
+                self.__reject(line, "Expected a JSON object")
+
+                continue
+
+            if keys is None:
+                keys = list(record)
+
+                self.__mapColumns(keys)
+
+            if record.keys() != set(keys):
+                self.__reject(line, "The keys do not match the first record")
+
+                continue
+
+            yield line, [importValue(record[key]) for key in keys]
+
+
+def parseBatches(reader: RowReader, batchSize: int, batches: Queue, stop: Event) -> None:
+    batch: Batch = []
+
+    try:
+        for row in reader.rows():
+            if stop.is_set():
+                break
+
+            batch.append(row)
+
+            if len(batch) >= batchSize:
+                batches.put(batch)
+                batch = []
+
+        if batch:
+            batches.put(batch)
+
+        batches.put(None)
+
+    except (OSError, ValueError, csv.Error) as error:
+        batches.put(error)
+
+
+def importFile(database: str, table: str, fileName: str, batchSize: int, stop: Event,
+               progress: Callable[[ImportReport], None]) -> Union[Error, ImportReport]:
+    backend = Backend()
+    start: float = perf_counter()
+
+    fields: List[str] = [field[0] for field in backend.getTableStructure(database, table)[0]]
+
+    with open(fileName, "rb") as raw:
+        size: int = raw.seek(0, io.SEEK_END)
+        raw.seek(0)
+
+        if not fileName.lower().endswith((".jsonl", ".json")) and backend.localInfileEnabled():
+            report: Optional[ImportReport] = loadFile(database, table, fileName, fields, raw, size, start)
+
+            if report is not None:
+                return report
+
+            raw.seek(0)
+
+        reader = RowReader(raw, fileName, fields)
+        batches: Queue = Queue(IMPORT_QUEUE_DEPTH)
+        parser = Thread(target=parseBatches, args=(reader, batchSize, batches, stop), daemon=True)
+        parser.start()
+
+        inserted: int = 0
+        rejected: int = 0
+        errors: List[Tuple[int, str]] = []
+        reported: float = start
+
+        while True:
+            batch: Union[None, Batch, Exception] = batches.get()
+
+            if batch is None or stop.is_set():
+                break
+
+            if isinstance(batch, Exception):
+                return Error(msg=f"{batch}")
+
+            if backend.insertRows(database, table, reader.columns, [row for _, row in batch]) is None:
+                inserted += len(batch)
+
+            else:
+                for line, row in batch:
+                    error: Optional[Error] = backend.insertRows(database, table, reader.columns, [row])
+
+                    if error is None:
+                        inserted += 1
+
+                        continue
+
+                    rejected += 1
+
+                    if len(errors) < IMPORT_ERRORS_SHOWN:
+                        errors.append((line, error.msg))
+
+            now: float = perf_counter()
+
+            if now - reported >= IMPORT_PROGRESS_INTERVAL:
+                reported = now
+
+                progress(ImportReport(
+                    inserted, rejected + reader.rejected, reader.bytesRead(), size, now - start, errors
+                ))
+
+        while batch is not None and not isinstance(batch, Exception):
+            batch = batches.get()
+
+        parser.join()
+
+        errors = sorted(errors + reader.errors)[:IMPORT_ERRORS_SHOWN]
+
+        return ImportReport(
+            inserted, rejected + reader.rejected, reader.bytesRead(), size, perf_counter() - start, errors,
+            stopped=stop.is_set()
+        )
+
+
+def loadFile(database: str, table: str, fileName: str, fields: Sequence[str], raw: BinaryIO, size: int,
+             start: float) -> Optional[ImportReport]:
+    header: bytes = raw.readline()
+
+    try:
+        columns: List[str] = next(csv.reader([header.decode("utf-8")]), [])
+
+    except (UnicodeDecodeError, csv.Error):
+        return None
+
+    lookup = {field.lower(): field for field in fields}
+
+    if not columns or any(column.lower() not in lookup for column in columns):
+        return None
+
+    result: Union[Error, Tuple[int, int]] = Backend().loadDataFile(
+        database, table, [lookup[column.lower()] for column in columns], fileName,
+        "\r\n" if header.endswith(b"\r\n") else "\n"
+    )
+
+    if isinstance(result, Error):
+        return None
+
+    inserted, warnings = result
+    text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+    try:
+        records: int = sum(1 for row in csv.reader(text) if row)
+
+    except (UnicodeDecodeError, csv.Error):
+        records = inserted
+
+    text.detach()
+
+    return ImportReport(
+        inserted, max(records - inserted, 0), size, size, perf_counter() - start, [], "LOAD DATA", warnings=warnings
+    )
+
+
+class ImportDialog(QProgressDialog):
+    imported = Signal()
+
+    def __init__(self, parent: QWidget, database: str, table: str):
+        super().__init__("Importing", "Stop", 0, 1000, parent)
+
+        self.setWindowTitle("Import")
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+        self.setMinimumDuration(0)
+
+        self.__database: str = database
+        self.__table: str = table
+        self.__fileName: str = ""
+        self.__stop = Event()
+
+        self.canceled.connect(self.__stop.set)
+
+    def start(self) -> None:
+        fileName: str = QFileDialog.getOpenFileName(
+            self.parentWidget(), "Import", "", "CSV or JSON Lines (*.csv *.jsonl *.json)"
+        )[0]
+
+        if not fileName:
+            self.deleteLater()
+
+            return
+
+        self.__fileName = fileName
+        self.setLabelText(f"Importing {fileName}")
+        self.show()
+
+        WorkerPool().run(
+            importFile, self.__database, self.__table, fileName, getIntSetting("ImportBatchSize", IMPORT_BATCH_SIZE),
+            self.__stop, finished=self.__imported, progress=self.__showProgress
+        )
+
+    @Slot(object)
+    def __showProgress(self, report: ImportReport) -> None:
+        self.setValue(int(report.bytesRead * 1000 / max(report.size, 1)))
+        self.setLabelText(
+            f"Importing {self.__fileName}\n{report.inserted} rows inserted, {report.rejected} rejected "
+            f"({report.rowsPerSecond():.0f} rows/s)"
+        )
+
+    @Slot(object)
+    def __imported(self, report: Union[Error, ImportReport]) -> None:
+        self.close()
+        self.deleteLater()
+
+        if isinstance(report, Error):
+            QMessageBox.critical(self.parentWidget(), "Error", report.msg)
+
+            return
+
+        summary: str = (
+            f"{'Stopped after inserting' if report.stopped else 'Inserted'} {report.inserted} rows into "
+            f"`{self.__database}`.`{self.__table}` with {report.method} in {report.seconds:.2f} s "
+            f"({report.rowsPerSecond():.0f} rows/s)"
+        )
+
+        if report.warnings:
+            summary += f"\n\nThe server raised {report.warnings} warnings"
+
+        if report.rejected:
+            summary += f"\n\n{report.rejected} rows were rejected"
+
+            if report.errors:
+                summary += ":\n" + "\n".join(f"Line {line}: {message}" for line, message in report.errors)
+
+        if report.rejected or report.warnings:
+            QMessageBox.warning(self.parentWidget(), "Import", summary)
+
+        else:
+            QMessageBox.information(self.parentWidget(), "Import", summary)
+
+        self.imported.emit()
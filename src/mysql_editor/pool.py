@@ -0,0 +1,197 @@
+from threading import Condition
+from time import monotonic
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Set
+
+from mysql.connector import MySQLConnection
+from mysql.connector.errors import Error
+
+POOL_SIZE: int = 4
+HEALTH_CHECK_INTERVAL: float = 30.0
+
+
+class PoolMetrics(NamedTuple):
+    size: int
+    open: int
+    inUse: int
+    pinned: int
+    acquisitions: int
+    waits: int
+    totalWait: float
+    maxWait: float
+
+
+class ConnectionPool:
+    def __init__(self, factory: Callable[[], MySQLConnection], size: int = POOL_SIZE,
+                 connection: Optional[MySQLConnection] = None, healthCheckInterval: float = HEALTH_CHECK_INTERVAL):
+        self.__factory: Callable[[], MySQLConnection] = factory
+        self.__size: int = max(size, 1)
+        self.__healthCheckInterval: float = healthCheckInterval
+
+        self.__condition = Condition()
+
+        self.__idle: List[MySQLConnection] = []
+        self.__open: int = 0
+        self.__inUse: Set[int] = set()
+        self.__pinned: Dict[Hashable, MySQLConnection] = {}
+        self.__connecting: Set[Hashable] = set()
+        self.__lastUsed: Dict[int, float] = {}
+
+        self.__acquisitions: int = 0
+        self.__waits: int = 0
+        self.__totalWait: float = 0.0
+        self.__maxWait: float = 0.0
+
+        if connection is not None:
+            self.__idle.append(connection)
+            self.__lastUsed[id(connection)] = monotonic()
+            self.__open = 1
+
+    def size(self) -> int:
+        return self.__size
+
+    def acquire(self, affinity: Optional[Hashable] = None) -> MySQLConnection:
+        start: float = monotonic()
+
+        connection: Optional[MySQLConnection] = None
+
+        with self.__condition:
+            if affinity is not None:
+                connection = self.__pinned.get(affinity)
+
+                while affinity in self.__connecting or (connection is not None and id(connection) in self.__inUse):
+                    self.__condition.wait()
+
+                    connection = self.__pinned.get(affinity)
+
+                if connection is None:
+                    self.__connecting.add(affinity)
+
+            else:
+                while not self.__idle and self.__open >= self.__size:
+                    self.__condition.wait()
+
+                if self.__idle:
+                    connection = self.__idle.pop()
+
+                else:
+                    self.__open += 1
+
+            if connection is not None:
+                self.__inUse.add(id(connection))
+
+            self.__recordWait(monotonic() - start)
+
+        if connection is None:
+            return self.__connect(affinity)
+
+        return self.__check(connection, affinity)
+
+    def release(self, connection: MySQLConnection, affinity: Optional[Hashable] = None) -> None:
+        with self.__condition:
+            self.__inUse.discard(id(connection))
+            self.__lastUsed[id(connection)] = monotonic()
+
+            if affinity is None:
+                self.__idle.append(connection)
+
+            elif self.__pinned.get(affinity) is not connection:
+                self.__lastUsed.pop(id(connection), None)
+
+                self.__close(connection)
+
+            self.__condition.notify_all()
+
+    def unpin(self, affinity: Hashable) -> None:
+        with self.__condition:
+            connection: Optional[MySQLConnection] = self.__pinned.pop(affinity, None)
+
+            if connection is None or id(connection) in self.__inUse:
+                return
+
+            self.__lastUsed.pop(id(connection), None)
+
+        self.__close(connection)
+
+    def connectionId(self, affinity: Hashable) -> Optional[int]:
+        with self.__condition:
+            connection: Optional[MySQLConnection] = self.__pinned.get(affinity)
+
+        return None if connection is None else connection.connection_id
+
+    def openConnection(self) -> MySQLConnection:
+        return self.__factory()
+
+    def metrics(self) -> PoolMetrics:
+        with self.__condition:
+            return PoolMetrics(
+                self.__size, self.__open + len(self.__pinned), len(self.__inUse), len(self.__pinned),
+                self.__acquisitions, self.__waits, self.__totalWait, self.__maxWait
+            )
+
+    def __connect(self, affinity: Optional[Hashable]) -> MySQLConnection:
+        try:
+            connection: MySQLConnection = self.__factory()
+
+        except Error:
+            with self.__condition:
+                if affinity is None:
+                    self.__open -= 1
+
+                else:
+                    self.__connecting.discard(affinity)
+
+                self.__condition.notify_all()
+
+            raise
+
+        with self.__condition:
+            if affinity is not None:
+                self.__pinned[affinity] = connection
+                self.__connecting.discard(affinity)
+
+            self.__inUse.add(id(connection))
+            self.__lastUsed[id(connection)] = monotonic()
+
+        return connection
+
+    def __check(self, connection: MySQLConnection, affinity: Optional[Hashable]) -> MySQLConnection:
+        if monotonic() - self.__lastUsed.get(id(connection), 0.0) < self.__healthCheckInterval:
+            return connection
+
+        try:
+            connection.ping(reconnect=False)
+
+        except Error:
+            with self.__condition:
+                self.__inUse.discard(id(connection))
+                self.__lastUsed.pop(id(connection), None)
+
+                if affinity is None:
+                    self.__open -= 1
+
+                else:
+                    self.__pinned.pop(affinity, None)
+
+                self.__condition.notify_all()
+
+            self.__close(connection)
+
+            return self.acquire(affinity)
+
+        return connection
+
+    def __recordWait(self, wait: float) -> None:
+        self.__acquisitions += 1
+        self.__totalWait += wait
+        self.__maxWait = max(self.__maxWait, wait)
+
+        if wait > 0.001:
+            self.__waits += 1
+
+    @staticmethod
+    def __close(connection: MySQLConnection) -> None:
+        try:
+            connection.close()
+
+        except Error:
+            pass
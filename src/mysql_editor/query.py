@@ -1,15 +1,23 @@
 from typing import Optional
 
 from PySide6.QtCore import Slot
-from PySide6.QtWidgets import QFileDialog, QMessageBox, QPushButton, QTabWidget, QTextEdit, QVBoxLayout, QWidget
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import (QFileDialog, QHBoxLayout, QLabel, QMessageBox, QPlainTextEdit, QPushButton, QSpinBox,
+                               QTabWidget, QVBoxLayout, QWidget)
 
+from mysql_editor.backend import Backend
 from mysql_editor.files import File
+from mysql_editor.highlighter import SqlHighlighter
+from mysql_editor.settings import STATEMENT_TIMEOUT_LIMIT
+from mysql_editor.worker import WorkerPool
 
 
 class QueryTabViewer(QTabWidget):
     def __init__(self, parent: Optional[QWidget]):
         super().__init__(parent)
 
+        self.__timeout: int = 0
+
         addButton = QPushButton("+")
         addButton.clicked.connect(self.__addQueryTab)
 
@@ -32,12 +40,32 @@ class QueryTabViewer(QTabWidget):
         while count in tabs:
             count += 1
 
-        self.addTab(QueryTab(self), f"Tab - {count}")
+        tab = QueryTab(self)
+        tab.timeout.setValue(self.__timeout)
+
+        self.addTab(tab, f"Tab - {count}")
 
     @Slot(int)
     def __removeQueryTab(self, index):
-        if self.count() != 1:
-            self.removeTab(index)
+        if self.count() == 1:
+            return
+
+        if self.widget(index).running:
+            QMessageBox.information(
+                self, "Query Running", "This tab is still running a query. Cancel the query before closing the tab"
+            )
+
+            return
+
+        WorkerPool().run(Backend().releaseAffinity, self.widget(index))
+
+        self.removeTab(index)
+
+    def setDefaultTimeout(self, seconds: int) -> None:
+        self.__timeout = seconds
+
+        for index in range(self.count()):
+            self.widget(index).timeout.setValue(seconds)
 
     def checkSave(self) -> bool:
         for index in range(self.count()):
@@ -55,7 +83,7 @@ class QueryTabViewer(QTabWidget):
                 return False
 
             if option == QMessageBox.StandardButton.Save:
-                self.widget(index).save()
+                self.widget(index).saveFile()
 
         return True
 
@@ -66,30 +94,43 @@ class QueryTab(QWidget):
 
         self.tabs = tabs
 
-        self.queryBox = QTextEdit()
+        self.queryBox = QPlainTextEdit()
+        self.queryBox.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.highlighter = SqlHighlighter(self.queryBox.document())
         self.results = QTabWidget()
 
+        self.timeout = QSpinBox()
+        self.timeout.setRange(0, STATEMENT_TIMEOUT_LIMIT)
+        self.timeout.setSuffix(" s")
+        self.timeout.setSpecialValueText("None")
+        self.timeout.setToolTip("SELECT statements running longer than this are stopped by the server")
+
         self.file: Optional[File] = None
+        self.running: bool = False
+
+        self.queryBox.modificationChanged.connect(self.checkIfEdited)
 
-        self.queryBox.textChanged.connect(self.checkIfEdited)
+        options = QHBoxLayout()
+        options.addWidget(QLabel("Timeout:"))
+        options.addWidget(self.timeout)
+        options.addStretch()
 
         layout = QVBoxLayout()
         layout.addWidget(self.queryBox)
+        layout.addLayout(options)
         layout.addWidget(self.results)
         self.setLayout(layout)
 
         self.results.hide()
 
-    @Slot()
-    def checkIfEdited(self):
+    @Slot(bool)
+    def checkIfEdited(self, modified: bool):
         if self.file is None:
             return
 
-        contents = self.queryBox.toPlainText()
-
-        index = self.tabs.currentIndex()
+        index = self.tabs.indexOf(self)
 
-        if contents != self.file.contents:
+        if modified:
             self.tabs.setTabText(index, f"* {self.file.name}")
 
         elif self.tabs.tabText(index)[:2] == "* ":
@@ -106,7 +147,8 @@ class QueryTab(QWidget):
             self.file = File()
 
         self.file.open(fileName, "r+")
-        self.queryBox.setText(self.file.contents)
+        self.queryBox.setPlainText(self.file.read())
+        self.queryBox.document().setModified(False)
 
         self.tabs.setTabText(self.tabs.currentIndex(), fileName)
 
@@ -123,6 +165,7 @@ class QueryTab(QWidget):
             self.file.open(fileName, "w+")
 
         self.file.save(self.queryBox.toPlainText())
+        self.queryBox.document().setModified(False)
 
         self.tabs.setTabText(self.tabs.currentIndex(), self.file.name)
 
@@ -138,5 +181,6 @@ class QueryTab(QWidget):
 
         self.file.open(fileName, "w+")
         self.file.save(self.queryBox.toPlainText())
+        self.queryBox.document().setModified(False)
 
         self.tabs.setTabText(self.tabs.currentIndex(), fileName)
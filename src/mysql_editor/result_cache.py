@@ -0,0 +1,142 @@
+import re
+import sys
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, FrozenSet, Hashable, Iterable, List, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+CACHEABLE: Pattern = re.compile(r"\s*(SELECT|WITH|TABLE)\b", re.IGNORECASE)
+VOLATILE: Pattern = re.compile(
+    r"\b(NOW|RAND|UUID|UUID_SHORT|SYSDATE|CURRENT_TIMESTAMP|CURRENT_DATE|CURRENT_TIME|CURDATE|CURTIME|"
+    r"UNIX_TIMESTAMP|UTC_TIMESTAMP|UTC_DATE|UTC_TIME|LOCALTIME|LOCALTIMESTAMP|CONNECTION_ID|LAST_INSERT_ID|"
+    r"FOUND_ROWS|ROW_COUNT|SLEEP|BENCHMARK|GET_LOCK|RELEASE_LOCK|IS_FREE_LOCK|NEXTVAL|INTO|FOR\s+UPDATE|FOR\s+SHARE|"
+    r"LOCK\s+IN\s+SHARE\s+MODE)\b|@",
+    re.IGNORECASE
+)
+TOKENS: Pattern = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`(?:[^`]|``)*`|\s+|[^\s'\"`]+", re.DOTALL)
+NAMES: Pattern = re.compile(r"`((?:[^`]|``)+)`|([A-Za-z_$][\w$]*)")
+
+NAME: str = r"(?:`(?:[^`]|``)+`|[\w$]+)"
+TABLE: str = rf"(?:{NAME}\s*\.\s*)?({NAME})"
+WRITES: Pattern = re.compile(
+    rf"\s*(?:(?:INSERT|REPLACE)(?:\s+(?:LOW_PRIORITY|DELAYED|HIGH_PRIORITY|IGNORE))*\s+(?:INTO\s+)?{TABLE}|"
+    rf"UPDATE(?:\s+(?:LOW_PRIORITY|IGNORE))*\s+{TABLE}|"
+    rf"DELETE(?:\s+(?:LOW_PRIORITY|QUICK|IGNORE))*\s+FROM\s+{TABLE}|"
+    rf"TRUNCATE(?:\s+TABLE)?\s+{TABLE}|"
+    rf"(?:ALTER|CREATE|DROP)(?:\s+TEMPORARY)?\s+TABLE(?:\s+IF(?:\s+NOT)?\s+EXISTS)?\s+{TABLE}|"
+    rf"RENAME\s+TABLE\s+{TABLE}|"
+    rf"LOAD\s+DATA\b.*?\bINTO\s+TABLE\s+{TABLE})",
+    re.IGNORECASE | re.DOTALL
+)
+HARMLESS: Pattern = re.compile(r"\s*(USE|SHOW|DESC|DESCRIBE|EXPLAIN|START|BEGIN|COMMIT)\b", re.IGNORECASE)
+
+
+class CachedResult(NamedTuple):
+    columns: Tuple[str]
+    rows: List[Tuple[Any]]
+    size: int
+    created: float
+    names: FrozenSet[str]
+
+    def age(self) -> float:
+        return monotonic() - self.created
+
+
+def normalizeQuery(query: str) -> str:
+    return " ".join(token for token in TOKENS.findall(query.strip().rstrip(";").strip()) if not token.isspace())
+
+
+def isCacheable(query: str) -> bool:
+    return CACHEABLE.match(query) is not None and VOLATILE.search(query) is None
+
+
+def referencedNames(query: str) -> FrozenSet[str]:
+    return frozenset((quoted.replace("``", "`") or plain).lower() for quoted, plain in NAMES.findall(query))
+
+
+def writtenTable(query: str) -> Optional[str]:
+    match = WRITES.match(query)
+
+    if match is None:
+        return None
+
+    name: str = next(group for group in match.groups() if group is not None)
+
+    return (name[1:-1].replace("``", "`") if name.startswith("`") else name).lower()
+
+
+def estimateSize(rows: Sequence[Tuple[Any]]) -> int:
+    return sum(sys.getsizeof(row) + sum(map(sys.getsizeof, row)) for row in rows)
+
+
+class ResultCache:
+    def __init__(self, budget: int = 0):
+        self.__budget: int = budget
+        self.__size: int = 0
+
+        self.__lock = Lock()
+        self.__entries: "OrderedDict[Hashable, CachedResult]" = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def budget(self) -> int:
+        return self.__budget
+
+    def setBudget(self, budget: int) -> None:
+        with self.__lock:
+            self.__budget = budget
+
+            self.__evict()
+
+    def get(self, key: Hashable) -> Optional[CachedResult]:
+        with self.__lock:
+            entry: Optional[CachedResult] = self.__entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+
+            return entry
+
+    def put(self, key: Hashable, columns: Tuple[str], rows: List[Tuple[Any]], names: Iterable[str],
+            size: Optional[int] = None) -> bool:
+        size = estimateSize(rows) if size is None else size
+
+        with self.__lock:
+            if size > self.__budget:
+                return False
+
+            previous: Optional[CachedResult] = self.__entries.pop(key, None)
+
+            if previous is not None:
+                self.__size -= previous.size
+
+            self.__entries[key] = CachedResult(columns, rows, size, monotonic(), frozenset(names))
+            self.__size += size
+
+            self.__evict()
+
+        return True
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        with self.__lock:
+            if table is None:
+                self.__entries.clear()
+                self.__size = 0
+
+                return
+
+            for key, entry in list(self.__entries.items()):
+                if table in entry.names:
+                    del self.__entries[key]
+                    self.__size -= entry.size
+
+    def __evict(self) -> None:
+        while self.__entries and self.__size > self.__budget:
+            _, entry = self.__entries.popitem(last=False)
+            self.__size -= entry.size
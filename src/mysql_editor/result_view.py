@@ -0,0 +1,161 @@
+from time import perf_counter
+from typing import Any, List, Optional, Tuple, Union
+
+from PySide6.QtCore import QAbstractTableModel, QElapsedTimer, QModelIndex, QPersistentModelIndex, Qt, Slot
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QLabel, QTableView, QVBoxLayout, QWidget
+
+from mysql_editor.row_store import PREVIEW_LENGTH, RowStore, isBinary
+from mysql_editor.stats import QueryMonitor, QueryStats
+
+ModelIndex = Union[QModelIndex, QPersistentModelIndex]
+
+BATCH_SIZE: int = 1000
+SAMPLE_ROWS: int = 200
+
+
+def packRows(rows: List[Tuple[Any]]) -> RowStore:
+    return RowStore(rows)
+
+
+class ResultModel(QAbstractTableModel):
+    def __init__(self, columns: Tuple[str], parent: Optional[QWidget] = None):
+        super().__init__(parent)
+
+        self.__columns: Tuple[str] = columns
+        self.__rows = RowStore()
+
+    def appendRows(self, rows: RowStore) -> None:
+        if not len(rows):
+            return
+
+        first = len(self.__rows)
+
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.__rows.merge(rows)
+        self.endInsertRows()
+
+    def rowCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self.__rows)
+
+    def columnCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self.__columns)
+
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.__rows.displayText(index.row(), index.column())
+
+        if role == Qt.ItemDataRole.ToolTipRole and self.isLargeValue(index.row(), index.column()):
+            return "Double-click to view the full value"
+
+        return None
+
+    def value(self, row: int, col: int) -> Any:
+        return self.__rows.value(row, col)
+
+    def isLargeValue(self, row: int, col: int) -> bool:
+        value: Any = self.__rows.value(row, col)
+
+        return (isinstance(value, (str, bytes)) and len(value) > PREVIEW_LENGTH) or isBinary(value)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if orientation == Qt.Orientation.Horizontal:
+            return self.__columns[section]
+
+        return f"{section + 1}"
+
+
+class ResultView(QWidget):
+    def __init__(self, columns: Tuple[str], cachedAge: Optional[float] = None):
+        super().__init__(None)
+
+        self.__model = ResultModel(columns, self)
+        self.__sized: bool = False
+        self.__cachedAge: Optional[float] = cachedAge
+        self.__render: float = 0.0
+
+        self.__elapsed = QElapsedTimer()
+        self.__elapsed.start()
+
+        self.__table = QTableView(self)
+        self.__table.setModel(self.__model)
+        self.__table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.__table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.__table.horizontalHeader().setResizeContentsPrecision(SAMPLE_ROWS)
+        self.__table.doubleClicked.connect(self.viewValue)
+
+        self.__status = QLabel()
+        self.__stats = QLabel()
+        self.__stats.hide()
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.__table)
+        layout.addWidget(self.__status)
+        layout.addWidget(self.__stats)
+
+        self.__updateStatus("Fetching")
+
+    def appendRows(self, rows: RowStore) -> None:
+        start: float = perf_counter()
+
+        self.__model.appendRows(rows)
+
+        if not self.__sized and self.__model.rowCount() >= SAMPLE_ROWS:
+            self.__resizeColumns()
+
+        self.__updateStatus("Fetching")
+
+        self.__render += perf_counter() - start
+
+    def finish(self, stats: Optional[QueryStats] = None) -> None:
+        start: float = perf_counter()
+
+        if not self.__sized:
+            self.__resizeColumns()
+
+        self.__updateStatus("Fetched")
+
+        if stats is None:
+            return
+
+        stats = stats._replace(render=self.__render + perf_counter() - start)
+
+        self.__stats.setText(f"Query stats: {stats.summary()}")
+        self.__stats.show()
+
+        QueryMonitor().publish(stats)
+
+    @Slot(QModelIndex)
+    def viewValue(self, index: QModelIndex) -> None:
+        if not self.__model.isLargeValue(index.row(), index.column()):
+            return
+
+        from mysql_editor.value_viewer import ValueViewer
+
+        column: str = self.__model.headerData(index.column(), Qt.Orientation.Horizontal)
+
+        ValueViewer(self, f"{column}, row {index.row() + 1}", self.__model.value(index.row(), index.column())).show()
+
+    def __resizeColumns(self) -> None:
+        self.__table.resizeColumnsToContents()
+
+        self.__sized = True
+
+    def __updateStatus(self, state: str) -> None:
+        status: str = f"{state} {self.__model.rowCount()} rows in {self.__elapsed.elapsed() / 1000:.2f} s"
+
+        if self.__cachedAge is not None:
+            status += f" from the result cache (cached {self.__cachedAge:.0f} s ago, press F5 to refresh)"
+
+        self.__status.setText(status)
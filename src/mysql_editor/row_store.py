@@ -0,0 +1,233 @@
+import codecs
+import sys
+from array import array
+from typing import Any, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+INTERN_LENGTH: int = 64
+PREVIEW_LENGTH: int = 256
+COMPACTED: FrozenSet[type] = frozenset((str, bytearray))
+LARGE_TYPES: FrozenSet[str] = frozenset(("blob", "mediumblob", "longblob", "text", "mediumtext", "longtext"))
+
+
+class Preview(NamedTuple):
+    prefix: Union[str, bytes]
+    length: int
+
+
+def formatSize(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+
+    if size < 1024 ** 2:
+        return f"{size / 1024:.1f} KiB"
+
+    return f"{size / 1024 ** 2:.1f} MiB"
+
+
+def decodeText(value: Union[bytes, bytearray], final: bool = True) -> Optional[str]:
+    try:
+        if final:
+            return value.decode("utf-8")
+
+        return codecs.getincrementaldecoder("utf-8")().decode(value)
+
+    except UnicodeDecodeError:
+        return None
+
+
+def isBinary(value: Any) -> bool:
+    if isinstance(value, Preview):
+        return isinstance(value.prefix, bytes) and decodeText(value.prefix, False) is None
+
+    return isinstance(value, (bytes, bytearray)) and decodeText(value) is None
+
+
+def toText(value: Any) -> str:
+    if isinstance(value, Preview):
+        prefix: Union[str, bytes] = value.prefix
+
+        if isinstance(prefix, bytes):
+            text: Optional[str] = decodeText(prefix, False)
+            prefix = f"0x{prefix.hex()}" if text is None else text
+
+        return f"{prefix}\u2026 [{formatSize(value.length)}]"
+
+    if isinstance(value, (bytes, bytearray)):
+        text = decodeText(value)
+
+        return f"0x{value.hex()}" if text is None else text
+
+    return f"{value}"
+
+
+def displayText(value: Any) -> str:
+    if isinstance(value, (str, bytes, bytearray)) and len(value) > PREVIEW_LENGTH:
+        return toText(Preview(value[:PREVIEW_LENGTH], len(value)))
+
+    return toText(value)
+
+
+def compact(value: Any) -> Any:
+    if type(value) is str:
+        return sys.intern(value) if len(value) <= INTERN_LENGTH else value
+
+    if type(value) is bytearray:
+        return bytes(value)
+
+    return value
+
+
+class Column:
+    __slots__ = ("values", "nulls")
+
+    def __init__(self, sample: Any = None):
+        self.values: Union[array, List[Any]]
+        self.nulls: Optional[bytearray] = None
+
+        if type(sample) is int:
+            self.values = array("q")
+
+        elif type(sample) is float:
+            self.values = array("d")
+
+        else:
+            self.values = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def value(self, row: int) -> Any:
+        if self.nulls is not None and self.nulls[row]:
+            return None
+
+        return self.values[row]
+
+    def pyValues(self) -> List[Any]:
+        if self.nulls is None:
+            return list(self.values)
+
+        return [None if null else value for value, null in zip(self.values, self.nulls)]
+
+    def extend(self, values: Sequence[Any]) -> None:
+        if isinstance(self.values, list):
+            if COMPACTED.isdisjoint(map(type, values)):
+                self.values.extend(values)
+
+            else:
+                self.values.extend(map(compact, values))
+
+            return
+
+        length: int = len(self.values)
+
+        try:
+            self.values.extend(values)
+
+        except (TypeError, OverflowError):
+            del self.values[length:]
+
+            self.__extendSlow(values)
+
+            return
+
+        if self.nulls is not None:
+            self.nulls.extend(bytes(len(values)))
+
+    def merge(self, other: "Column") -> None:
+        if not self.values and self.nulls is None:
+            self.values = other.values[:]
+            self.nulls = None if other.nulls is None else bytearray(other.nulls)
+
+            return
+
+        if not isinstance(self.values, array) or not isinstance(other.values, array) or \
+                self.values.typecode != other.values.typecode:
+            self.extend(other.pyValues())
+
+            return
+
+        if self.nulls is not None or other.nulls is not None:
+            self.nulls = (self.nulls or bytearray(len(self.values))) + (other.nulls or bytes(len(other.values)))
+
+        self.values.extend(other.values)
+
+    def __extendSlow(self, values: Sequence[Any]) -> None:
+        kind: type = int if self.values.typecode == "q" else float
+
+        for index, value in enumerate(values):
+            if value is None:
+                if self.nulls is None:
+                    self.nulls = bytearray(len(self.values))
+
+                self.values.append(0)
+                self.nulls.append(1)
+
+                continue
+
+            if type(value) is not kind or (kind is int and not -2 ** 63 <= value < 2 ** 63):
+                self.values = self.pyValues()
+                self.nulls = None
+                self.extend(values[index:])
+
+                return
+
+            self.values.append(value)
+
+            if self.nulls is not None:
+                self.nulls.append(0)
+
+
+class RowStore:
+    __slots__ = ("__columns", "__length")
+
+    def __init__(self, rows: Iterable[Tuple[Any]] = ()):
+        self.__columns: List[Column] = []
+        self.__length: int = 0
+
+        self.extend(rows)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def columnCount(self) -> int:
+        return len(self.__columns)
+
+    def extend(self, rows: Iterable[Tuple[Any]]) -> None:
+        columns: List[Tuple[Any]] = list(zip(*rows))
+
+        if not columns:
+            return
+
+        if not self.__columns:
+            self.__columns = [
+                Column(next((value for value in values if value is not None), None)) for values in columns
+            ]
+
+        for column, values in zip(self.__columns, columns):
+            column.extend(values)
+
+        self.__length += len(columns[0])
+
+    def merge(self, other: "RowStore") -> None:
+        if not other.__length:
+            return
+
+        if not self.__columns:
+            self.__columns = [Column() for _ in range(other.columnCount())]
+
+        for column, values in zip(self.__columns, other.__columns):
+            column.merge(values)
+
+        self.__length += other.__length
+
+    def value(self, row: int, col: int) -> Any:
+        return self.__columns[col].value(row)
+
+    def text(self, row: int, col: int) -> str:
+        return toText(self.__columns[col].value(row))
+
+    def displayText(self, row: int, col: int) -> str:
+        return displayText(self.__columns[col].value(row))
+
+    def row(self, row: int) -> Tuple[Any]:
+        return tuple(column.value(row) for column in self.__columns)
@@ -1,6 +1,4 @@
-import os.path
-import sys
-from typing import List
+from typing import Any, Callable, List
 
 from PySide6.QtCore import Slot, Qt, QSettings, QKeyCombination
 from PySide6.QtWidgets import (
@@ -8,26 +6,12 @@ from PySide6.QtWidgets import (
     QStyleFactory,
     QApplication, QListWidget, QListWidgetItem
 )
-from mysql.connector import connect
-from mysql.connector.errors import Error
 
-from mysql_editor.window import WindowUI
+from mysql_editor.settings import SESSION_FILE, SETTINGS, STATEMENT_TIMEOUT_LIMIT, getIntSetting
 
-global connection
-
-if sys.platform == "linux":
-    CONFIG_PATH = os.path.join(os.getenv("HOME"), ".config", "MySQL Editor")
-
-elif sys.platform == "win32":
-    CONFIG_PATH = os.path.join(os.getenv("LOCALAPPDATA"), "MySQL Editor")
-
-else:
-    CONFIG_PATH = ""
-
-CONFIG_FILE = os.path.join(CONFIG_PATH, "config.ini")
-SESSION_FILE = os.path.join(CONFIG_PATH, "sessions.ini")
+CONNECT_TIMEOUT: int = 10
 
-SETTINGS = QSettings(CONFIG_FILE, QSettings.Format.IniFormat)
+global connection
 
 
 def updateTheme(theme: str):
@@ -51,7 +35,7 @@ class SessionFileHandler(object):
         return sessionNames
 
     @classmethod
-    def getSessionDetails(cls, session: str) -> (str, str, int):
+    def getSessionDetails(cls, session: str) -> (str, str, int, int):
         cls.__sessions.beginGroup(session)
 
         host: str = cls.__sessions.value("host")
@@ -63,9 +47,15 @@ class SessionFileHandler(object):
         except (ValueError, TypeError):
             port: int = 3306
 
+        try:
+            timeout: int = int(cls.__sessions.value("timeout", 0))
+
+        except (ValueError, TypeError):
+            timeout: int = 0
+
         cls.__sessions.endGroup()
 
-        return host, user, port
+        return host, user, port, timeout
 
     @classmethod
     def renameSession(cls, old: str, new: str) -> None:
@@ -73,22 +63,25 @@ class SessionFileHandler(object):
         host = cls.__sessions.value("host")
         user = cls.__sessions.value("user")
         port = cls.__sessions.value("port")
+        timeout = cls.__sessions.value("timeout", 0)
         cls.__sessions.endGroup()
 
         cls.__sessions.beginGroup(new)
         cls.__sessions.setValue("host", host)
         cls.__sessions.setValue("user", user)
         cls.__sessions.setValue("port", port)
+        cls.__sessions.setValue("timeout", timeout)
         cls.__sessions.endGroup()
 
         cls.__sessions.remove(old)
 
     @classmethod
-    def updateSession(cls, session: str, host: str, user: str, port: int):
+    def updateSession(cls, session: str, host: str, user: str, port: int, timeout: int):
         cls.__sessions.beginGroup(session)
         cls.__sessions.setValue("host", host)
         cls.__sessions.setValue("user", user)
         cls.__sessions.setValue("port", port)
+        cls.__sessions.setValue("timeout", timeout)
         cls.__sessions.endGroup()
 
     @classmethod
@@ -97,6 +90,7 @@ class SessionFileHandler(object):
         cls.__sessions.setValue("host", "")
         cls.__sessions.setValue("user", "")
         cls.__sessions.setValue("port", 3306)
+        cls.__sessions.setValue("timeout", 0)
         cls.__sessions.endGroup()
 
     @classmethod
@@ -127,7 +121,11 @@ class SessionManager(QDialog):
         self.__user = QLineEdit()
         self.__password = QLineEdit()
         self.__port = QSpinBox(self)
+        self.__timeout = QSpinBox(self)
         self.__connect = QPushButton("Connect")
+        self.__status = QLabel()
+        self.__attempt: int = 0
+        self.__connecting: bool = False
 
         self.__host.setMaxLength(15)
         self.__host.setEnabled(False)
@@ -140,8 +138,13 @@ class SessionManager(QDialog):
         self.__port.setEnabled(False)
         self.__port.setMinimum(0)
         self.__port.setMaximum(65535)
+        self.__timeout.setEnabled(False)
+        self.__timeout.setRange(0, STATEMENT_TIMEOUT_LIMIT)
+        self.__timeout.setSuffix(" s")
+        self.__timeout.setSpecialValueText("None")
+        self.__timeout.setToolTip("Default statement timeout for the query tabs of this session")
         self.__connect.setEnabled(False)
-        self.__connect.clicked.connect(self.__openWindow)
+        self.__connect.clicked.connect(self.__connectClicked)
         self.__sessions.itemSelectionChanged.connect(self.__showCredentials)
         self.__sessions.itemDoubleClicked.connect(self.__sessions.editItem)
         self.__sessions.itemChanged.connect(self.__renameSession)
@@ -156,7 +159,10 @@ class SessionManager(QDialog):
         credential_layout.addWidget(self.__password, 2, 1)
         credential_layout.addWidget(QLabel("Port:"), 3, 0)
         credential_layout.addWidget(self.__port, 3, 1)
-        credential_layout.addWidget(self.__connect, 4, 0, 1, 2)
+        credential_layout.addWidget(QLabel("Timeout:"), 4, 0)
+        credential_layout.addWidget(self.__timeout, 4, 1)
+        credential_layout.addWidget(self.__connect, 5, 0, 1, 2)
+        credential_layout.addWidget(self.__status, 6, 0, 1, 2)
 
         self.__menubar = QMenuBar()
         self.__menubar.addAction("New Session", QKeyCombination(Qt.Modifier.CTRL, Qt.Key.Key_N), self.__newSession)
@@ -179,6 +185,9 @@ class SessionManager(QDialog):
         self.__remove.setEnabled(False)
 
     def __toggleConnectButton(self):
+        if self.__connecting:
+            return
+
         self.__connect.setEnabled(
             bool(self.__host.text()) and bool(self.__user.text()) and bool(self.__password.text()))
 
@@ -239,11 +248,13 @@ class SessionManager(QDialog):
         self.__user.clear()
         self.__password.clear()
         self.__port.setValue(3306)
+        self.__timeout.setValue(0)
 
         self.__host.setEnabled(False)
         self.__user.setEnabled(False)
         self.__password.setEnabled(False)
         self.__port.setEnabled(False)
+        self.__timeout.setEnabled(False)
         self.__connect.setEnabled(False)
 
         SessionFileHandler.removeSession(session)
@@ -262,11 +273,13 @@ class SessionManager(QDialog):
             self.__user.clear()
             self.__password.clear()
             self.__port.setValue(3306)
+            self.__timeout.setValue(0)
 
             self.__host.setEnabled(True)
             self.__user.setEnabled(True)
             self.__password.setEnabled(True)
             self.__port.setEnabled(False)
+            self.__timeout.setEnabled(False)
             self.__connect.setEnabled(False)
 
             return
@@ -275,38 +288,99 @@ class SessionManager(QDialog):
         self.__user.setEnabled(True)
         self.__password.setEnabled(True)
         self.__port.setEnabled(True)
+        self.__timeout.setEnabled(True)
         self.__connect.setEnabled(len(self.__password.text()) != 0)
 
-        host, user, port = SessionFileHandler.getSessionDetails(item.text())
+        host, user, port, timeout = SessionFileHandler.getSessionDetails(item.text())
 
         self.__host.setText(host)
         self.__user.setText(user)
         self.__port.setValue(port)
+        self.__timeout.setValue(timeout)
 
         self.__remove.setEnabled(True)
 
     @Slot()
+    def __connectClicked(self):
+        if self.__connecting:
+            self.__attempt += 1
+
+            self.__setConnecting(False)
+
+            return
+
+        self.__openWindow()
+
+    def __setConnecting(self, connecting: bool):
+        self.__connecting = connecting
+
+        for widget in (self.__sessions, self.__host, self.__user, self.__password, self.__port, self.__timeout,
+                       self.__menubar):
+            widget.setEnabled(not connecting)
+
+        self.__connect.setText("Cancel" if connecting else "Connect")
+        self.__status.setText(f"Connecting to {self.__host.text()}:{self.__port.value()}..." if connecting else "")
+
+        if not connecting:
+            self.__toggleConnectButton()
+
     def __openWindow(self):
-        global connection
+        from mysql.connector import connect
+
+        from mysql_editor.worker import WorkerPool
 
         host = self.__host.text()
         user = self.__user.text()
         password = self.__password.text()
         port = self.__port.value()
+        session = self.__sessions.currentItem().text()
 
-        try:
-            connection = connect(host=host, user=user, password=password, port=port)
+        def newConnection():
+            connection_ = connect(
+                host=host, user=user, password=password, port=port,
+                allow_local_infile=bool(getIntSetting("LocalInfile", 0)),
+                connection_timeout=getIntSetting("ConnectTimeout", CONNECT_TIMEOUT)
+            )
+            connection_.autocommit = True
+
+            return connection_
+
+        self.__attempt += 1
+        attempt: int = self.__attempt
+
+        self.__setConnecting(True)
+
+        WorkerPool().run(
+            newConnection, finished=lambda result: self.__connected(attempt, session, newConnection, result)
+        )
 
-        except Error as error:
-            QMessageBox.critical(self, "Error", error.msg)
+    def __connected(self, attempt: int, session: str, newConnection: Callable[[], Any], result: Any):
+        from mysql.connector.errors import Error
+
+        from mysql_editor.window import openWindow
+        from mysql_editor.worker import WorkerPool
+
+        global connection
+
+        if attempt != self.__attempt:
+            if not isinstance(result, Error):
+                WorkerPool().run(result.close)
 
             return
 
-        connection.autocommit = True
+        self.__setConnecting(False)
+
+        if isinstance(result, Error):
+            QMessageBox.critical(self, "Error", result.msg)
 
-        SessionFileHandler.updateSession(self.__sessions.currentItem().text(), host, user, port)
+            return
+
+        connection = result
+
+        SessionFileHandler.updateSession(
+            session, self.__host.text(), self.__user.text(), self.__port.value(), self.__timeout.value()
+        )
 
         self.close()
 
-        window = WindowUI(connection)
-        window.show()
+        self.__window = openWindow(newConnection, connection, self.__timeout.value())
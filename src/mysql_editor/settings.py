@@ -0,0 +1,34 @@
+import os.path
+import sys
+
+from PySide6.QtCore import QSettings
+
+if sys.platform == "linux":
+    CONFIG_PATH = os.path.join(os.getenv("HOME"), ".config", "MySQL Editor")
+
+elif sys.platform == "win32":
+    CONFIG_PATH = os.path.join(os.getenv("LOCALAPPDATA"), "MySQL Editor")
+
+else:
+    CONFIG_PATH = ""
+
+CONFIG_FILE = os.path.join(CONFIG_PATH, "config.ini")
+SESSION_FILE = os.path.join(CONFIG_PATH, "sessions.ini")
+
+SETTINGS = QSettings(CONFIG_FILE, QSettings.Format.IniFormat)
+
+STATEMENT_TIMEOUT_LIMIT = 86400
+
+
+def getIntSetting(name: str, default: int) -> int:
+    SETTINGS.beginGroup("Settings")
+
+    try:
+        value: int = int(SETTINGS.value(name, default))
+
+    except (ValueError, TypeError):
+        value: int = default
+
+    SETTINGS.endGroup()
+
+    return value
@@ -0,0 +1,220 @@
+import re
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Pattern, Union
+
+DELIMITER: str = ";"
+
+NON_SPACE: Pattern = re.compile(r"\S")
+DELIMITER_COMMAND: Pattern = re.compile(r"DELIMITER[ \t]+", re.IGNORECASE)
+LOOKAHEAD: int = len("DELIMITER ")
+
+LITERALS: Dict[str, Pattern] = {
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*", re.DOTALL),
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL),
+    "`": re.compile(r"[^`]*"),
+}
+
+
+class Statement(NamedTuple):
+    text: str
+    offset: int
+    line: int
+
+    def sourceLine(self, line: int) -> int:
+        return self.line + line - 1
+
+
+class StatementSplitter:
+    def __init__(self, delimiter: str = DELIMITER):
+        self.__buffer: str = ""
+        self.__position: int = 0
+        self.__state: Optional[str] = None
+        self.__start: Optional[int] = None
+
+        self.__offset: int = 0
+        self.__line: int = 1
+        self.__counted: int = 0
+
+        self.__delimiter: str = ""
+        self.__tokens: Optional[Pattern] = None
+        self.__lookahead: int = LOOKAHEAD
+
+        self.setDelimiter(delimiter)
+
+    def delimiter(self) -> str:
+        return self.__delimiter
+
+    def setDelimiter(self, delimiter: str) -> None:
+        self.__delimiter = delimiter
+        self.__tokens = re.compile(rf"['\"`#]|--|/\*|{re.escape(delimiter)}")
+        self.__lookahead = max(LOOKAHEAD, len(delimiter) + 1)
+
+    def feed(self, chunk: str) -> Iterator[Statement]:
+        keep: int = self.__position if self.__start is None else self.__start
+
+        self.__line += self.__buffer.count("\n", self.__counted, keep)
+        self.__offset += keep
+        self.__buffer = self.__buffer[keep:] + chunk
+        self.__position -= keep
+        self.__counted = 0
+
+        if self.__start is not None:
+            self.__start = 0
+
+        return self.__scan(False)
+
+    def finish(self) -> Iterator[Statement]:
+        yield from self.__scan(True)
+
+        if self.__start is not None:
+            yield self.__statement(len(self.__buffer))
+
+        self.__offset += len(self.__buffer)
+        self.__buffer = ""
+        self.__position = 0
+        self.__state = None
+        self.__counted = 0
+
+    def __scan(self, final: bool) -> Iterator[Statement]:
+        buffer: str = self.__buffer
+        end: int = len(buffer)
+        limit: int = end if final else end - self.__lookahead
+
+        while self.__position < end:
+            position: int = self.__position
+
+            if self.__state is not None:
+                if not self.__skipLiteral(final):
+                    return
+
+                continue
+
+            if self.__start is None:
+                match = NON_SPACE.search(buffer, position)
+
+                if match is None:
+                    self.__position = end
+
+                    return
+
+                position = self.__position = match.start()
+
+                if position >= limit and not final:
+                    return
+
+                if buffer.startswith(self.__delimiter, position):
+                    self.__position = position + len(self.__delimiter)
+
+                    continue
+
+                command = DELIMITER_COMMAND.match(buffer, position)
+
+                if command is not None:
+                    newline: int = buffer.find("\n", command.end())
+
+                    if newline == -1:
+                        if not final:
+                            return
+
+                        newline = end
+
+                    delimiter: str = buffer[command.end():newline].strip()
+
+                    if delimiter:
+                        self.setDelimiter(delimiter.split()[0])
+
+                        limit = end if final else end - self.__lookahead
+
+                    self.__position = newline
+
+                    continue
+
+                if not self.__isComment(buffer, position) or buffer.startswith(("/*!", "/*+"), position):
+                    self.__line += buffer.count("\n", self.__counted, position)
+                    self.__counted = position
+                    self.__start = position
+
+            match = self.__tokens.search(buffer, position)
+
+            if match is None or (match.start() >= limit and not final):
+                self.__position = max(position, limit) if match is None else match.start()
+
+                return
+
+            token: str = match.group()
+
+            if token == self.__delimiter:
+                self.__position = match.end()
+
+                if self.__start is not None:
+                    yield self.__statement(match.start())
+
+                continue
+
+            if token == "--" and not self.__isComment(buffer, match.start()):
+                self.__position = match.start() + 1
+
+                continue
+
+            self.__state = token
+            self.__position = match.end()
+
+    def __skipLiteral(self, final: bool) -> bool:
+        buffer: str = self.__buffer
+
+        if self.__state in ("#", "--"):
+            close: int = buffer.find("\n", self.__position)
+
+        elif self.__state == "/*":
+            close: int = buffer.find("*/", self.__position)
+
+            if close != -1:
+                close += 1
+
+        else:
+            close: int = LITERALS[self.__state].match(buffer, self.__position).end()
+
+            if close == len(buffer):
+                close = -1
+
+            elif buffer[close] == "\\":
+                if not final:
+                    self.__position = close
+
+                    return False
+
+                close = -1
+
+        if close == -1:
+            self.__position = len(buffer) if final else max(self.__position, len(buffer) - 1)
+
+            return final
+
+        self.__state = None
+        self.__position = close + 1
+
+        return True
+
+    @staticmethod
+    def __isComment(buffer: str, position: int) -> bool:
+        if buffer.startswith(("#", "/*"), position):
+            return True
+
+        return buffer.startswith("--", position) and (position + 2 >= len(buffer) or buffer[position + 2] <= " ")
+
+    def __statement(self, end: int) -> Statement:
+        start: int = self.__start
+        self.__start = None
+
+        return Statement(self.__buffer[start:end].rstrip(), self.__offset + start, self.__line)
+
+
+def splitStatements(source: Union[str, Iterable[str]], delimiter: str = DELIMITER) -> Iterator[Statement]:
+    splitter = StatementSplitter(delimiter)
+
+    chunks: Iterable[str] = (source,) if isinstance(source, str) else source
+
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+
+    yield from splitter.finish()
+
@@ -0,0 +1,84 @@
+from threading import Lock
+from typing import Any, Callable, FrozenSet, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing_extensions import Self
+
+StatsListener = Callable[["QueryStats"], None]
+
+SIZED_TYPES: FrozenSet[type] = frozenset((bytes, bytearray, str))
+TEXT_TYPES: FrozenSet[type] = SIZED_TYPES | {type(None)}
+
+
+class QueryStats(NamedTuple):
+    query: str
+    server: float = 0.0
+    fetch: float = 0.0
+    pack: float = 0.0
+    render: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    cached: bool = False
+
+    def total(self) -> float:
+        return self.server + self.fetch + self.pack + self.render
+
+    def summary(self) -> str:
+        source: str = "cache" if self.cached else f"server {self.server * 1000:.1f} ms"
+
+        return (
+            f"{source}, fetch {self.fetch * 1000:.1f} ms, pack {self.pack * 1000:.1f} ms, "
+            f"render {self.render * 1000:.1f} ms, {self.rows} rows, {self.bytes / 1024:.1f} KiB"
+        )
+
+
+def valueSize(value: Any) -> int:
+    if value is None:
+        return 0
+
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+
+    return 8
+
+
+def rowsSize(rows: Sequence[Tuple[Any]]) -> int:
+    size: int = 0
+
+    for values in zip(*rows):
+        types: Set[type] = set(map(type, values))
+
+        if types.isdisjoint(SIZED_TYPES):
+            size += 8 * (len(values) - values.count(None))
+
+        elif types <= TEXT_TYPES:
+            size += sum(map(len, filter(None, values)))
+
+        else:
+            size += sum(map(valueSize, values))
+
+    return size
+
+
+class QueryMonitor:
+    __instance: Optional[Self] = None
+    __listeners: List[StatsListener]
+    __lock: Lock
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super(QueryMonitor, cls).__new__(cls)
+            cls.__instance.__listeners = []
+            cls.__instance.__lock = Lock()
+
+        return cls.__instance
+
+    def addListener(self, listener: StatsListener) -> None:
+        with self.__lock:
+            self.__listeners = [*self.__listeners, listener]
+
+    def removeListener(self, listener: StatsListener) -> None:
+        with self.__lock:
+            self.__listeners = [item for item in self.__listeners if item != listener]
+
+    def publish(self, stats: QueryStats) -> None:
+        for listener in self.__listeners:
+            listener(stats)
@@ -1,36 +1,522 @@
-from typing import Iterable, List, Optional, Union
-
-from PySide6.QtCore import QDate, QDateTime, Slot
-from PySide6.QtGui import QAction
-from PySide6.QtWidgets import (QAbstractItemView, QComboBox, QDateEdit, QDateTimeEdit, QHeaderView, QMenuBar,
-                               QMessageBox, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget)
+import re
+from functools import partial
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from PySide6.QtCore import (QAbstractItemModel, QAbstractTableModel, QDate, QDateTime, QModelIndex,
+                            QPersistentModelIndex, Qt, Signal, Slot)
+from PySide6.QtGui import QAction, QResizeEvent, QShowEvent
+from PySide6.QtWidgets import (QAbstractItemView, QComboBox, QDateEdit, QDateTimeEdit, QHeaderView, QLabel, QLineEdit,
+                               QMenuBar, QMessageBox, QStyledItemDelegate, QStyleOptionViewItem, QTableView,
+                               QVBoxLayout, QWidget)
 from mysql.connector.errors import Error
 
 from mysql_editor.backend import Backend
+from mysql_editor.batch import BatchReport, WriteBatch
+from mysql_editor.data_filter import DataFilter, SortOrder, describeIndexUse
+from mysql_editor.row_store import LARGE_TYPES, Preview, RowStore, displayText, isBinary, toText
+from mysql_editor.worker import WorkerPool
+
+ModelIndex = Union[QModelIndex, QPersistentModelIndex]
+
+PAGE_SIZE: int = 1000
+ENUM_OPTION = re.compile(r"'((?:[^'\\]|''|\\.)*)'", re.DOTALL)
+ENUM_ESCAPE = re.compile(r"''|\\(.)", re.DOTALL)
+ENUM_ESCAPES: Dict[str, str] = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+FILTER_HELP: str = (
+    "Filter this column by a value, a comparison such as >10 or !=x, a LIKE pattern containing %, NULL or NOT NULL.\n"
+    "Press Enter to apply"
+)
+
+
+def enumOptions(columnType: str) -> List[str]:
+    return [
+        ENUM_ESCAPE.sub(lambda match: ENUM_ESCAPES.get(match[1], match[1]) if match[1] else "'", option)
+        for option in ENUM_OPTION.findall(columnType)
+    ]
+
+
+class EditJournal:
+    def __init__(self):
+        self.updates: Dict[Tuple[Any, ...], Dict[int, str]] = {}
+        self.deletes: Dict[Tuple[Any, ...], None] = {}
+        self.inserts: List[List[Optional[str]]] = []
+
+    def clear(self) -> None:
+        self.updates.clear()
+        self.deletes.clear()
+        self.inserts.clear()
+
+    def isEmpty(self) -> bool:
+        return not self.updates and not self.deletes and not self.inserts
+
+    def value(self, key: Tuple[Any, ...], col: int) -> Optional[str]:
+        updates: Optional[Dict[int, str]] = self.updates.get(key)
+
+        if updates is None:
+            return None
+
+        return updates.get(col)
+
+    def setCell(self, key: Tuple[Any, ...], col: int, value: str, original: str) -> None:
+        if value != original:
+            self.updates.setdefault(key, {})[col] = value
+
+            return
+
+        updates: Optional[Dict[int, str]] = self.updates.get(key)
+
+        if updates is None:
+            return
+
+        updates.pop(col, None)
+
+        if not updates:
+            del self.updates[key]
+
+    def toggleDeleted(self, key: Tuple[Any, ...]) -> None:
+        if key in self.deletes:
+            del self.deletes[key]
+
+        else:
+            self.deletes[key] = None
+
+    def batch(self, database: str, table: str, columns: Tuple[str], unique: Tuple[str, ...]) -> WriteBatch:
+        batch = WriteBatch(database, table, columns, unique)
+        batch.deletes.extend(self.deletes)
+        batch.updates.extend((key, updates) for key, updates in self.updates.items() if key not in self.deletes)
+        batch.inserts.extend(self.inserts)
+
+        return batch
+
+    def discard(self, count: int) -> None:
+        for key in list(self.deletes)[:count]:
+            del self.deletes[key]
+            self.updates.pop(key, None)
+
+            count -= 1
+
+        for key in [key for key in self.updates if key not in self.deletes][:max(count, 0)]:
+            del self.updates[key]
+
+            count -= 1
+
+        del self.inserts[:max(count, 0)]
+
+
+class TableDataModel(QAbstractTableModel):
+    def __init__(self, parent: Optional[QWidget] = None, pageSize: int = PAGE_SIZE):
+        super().__init__(parent)
+
+        self.__data = RowStore()
+        self.__columns: Tuple[str] = ()
+        self.__structure: List[Tuple[Any]] = []
+        self.__keyCols: Tuple[int, ...] = ()
+        self.__fetch: Optional[Callable[[], None]] = None
+        self.__exhausted: bool = True
+        self.__fetching: bool = False
+
+        self.pageSize: int = pageSize
+        self.journal = EditJournal()
+        self.editable: bool = False
+
+    def setTable(self, columns: Tuple[str], structure: List[Tuple[Any]], keyCols: Tuple[int, ...] = (),
+                 fetch: Optional[Callable[[], None]] = None) -> None:
+        self.beginResetModel()
+
+        self.__data = RowStore()
+        self.__columns = columns
+        self.__structure = structure
+        self.__keyCols = keyCols
+        self.__fetch = fetch
+        self.__exhausted = fetch is None
+        self.__fetching = False
+        self.journal.clear()
+
+        self.endResetModel()
+
+        self.fetchMore()
+
+    def clear(self) -> None:
+        self.setTable((), [])
+
+    def resetRows(self) -> None:
+        self.beginResetModel()
+
+        self.__data = RowStore()
+        self.__exhausted = self.__fetch is None
+        self.__fetching = False
+
+        self.endResetModel()
+
+        self.fetchMore()
+
+    def canFetchMore(self, parent: ModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self.__exhausted and not self.__fetching
+
+    def fetchMore(self, parent: ModelIndex = QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+
+        self.__fetching = True
+
+        self.__fetch()
+
+    def appendPage(self, rows: List[Tuple[Any]]) -> None:
+        self.__fetching = False
+        self.__exhausted = len(rows) < self.pageSize
+
+        if not rows:
+            return
+
+        first = len(self.__data)
+        last = first + len(rows) - 1
+
+        self.beginInsertRows(QModelIndex(), first, last)
+        self.__data.extend(rows)
+        self.endInsertRows()
+
+    def fetchedRowCount(self) -> int:
+        return len(self.__data)
+
+    def fetchedValue(self, row: int, col: int) -> Any:
+        return self.__data.value(row, col)
+
+    def columns(self) -> Tuple[str]:
+        return self.__columns
+
+    def columnType(self, col: int) -> str:
+        return toText(self.__structure[col][1])
+
+    def columnDefault(self, col: int) -> Optional[str]:
+        default = self.__structure[col][4]
+
+        return None if default is None else toText(default)
+
+    def text(self, row: int, col: int) -> str:
+        if row >= len(self.__data):
+            value: Optional[str] = self.journal.inserts[row - len(self.__data)][col]
+
+            return (self.columnDefault(col) or "") if value is None else value
+
+        if self.journal.updates:
+            edit: Optional[str] = self.journal.value(self.__rowKey(row), col)
+
+            if edit is not None:
+                return edit
+
+        return self.__data.text(row, col)
+
+    def originalText(self, row: int, col: int) -> str:
+        return self.__data.text(row, col)
+
+    def isLargeValue(self, row: int, col: int) -> bool:
+        if row >= len(self.__data):
+            return False
+
+        value: Any = self.__data.value(row, col)
+
+        return isinstance(value, Preview) or isBinary(value)
+
+    def isDeleted(self, row: int) -> bool:
+        return row < len(self.__data) and self.__rowKey(row) in self.journal.deletes
+
+    def __rowKey(self, row: int) -> Tuple[Any, ...]:
+        return tuple(self.__data.value(row, col) for col in self.__keyCols)
+
+    def addRow(self) -> None:
+        row = self.rowCount()
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.journal.inserts.append([None for _ in self.__columns])
+        self.endInsertRows()
+
+    def discardApplied(self, count: int) -> None:
+        self.beginResetModel()
+        self.journal.discard(count)
+        self.endResetModel()
+
+    def toggleDeleted(self, row: int) -> None:
+        if row >= len(self.__data):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self.journal.inserts.pop(row - len(self.__data))
+            self.endRemoveRows()
+
+            return
+
+        self.journal.toggleDeleted(self.__rowKey(row))
+
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def rowCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self.__data) + len(self.journal.inserts)
+
+    def columnCount(self, parent: ModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self.__columns)
+
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return displayText(self.text(index.row(), index.column()))
+
+        if role == Qt.ItemDataRole.EditRole:
+            return self.text(index.row(), index.column())
+
+        if role == Qt.ItemDataRole.ToolTipRole and self.isLargeValue(index.row(), index.column()):
+            return "Double-click to view the full value"
+
+        return None
+
+    def setData(self, index: ModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+
+        row, col = index.row(), index.column()
+
+        if row >= len(self.__data):
+            insert: List[Optional[str]] = self.journal.inserts[row - len(self.__data)]
+
+            if insert[col] is not None or f"{value}" != self.text(row, col):
+                insert[col] = f"{value}"
+
+        else:
+            self.journal.setCell(self.__rowKey(row), col, f"{value}", self.originalText(row, col))
+
+        self.dataChanged.emit(index, index, [role])
+
+        return True
+
+    def flags(self, index: ModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        if self.isDeleted(index.row()):
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+        if self.editable and not self.isLargeValue(index.row(), index.column()):
+            flags |= Qt.ItemFlag.ItemIsEditable
+
+        return flags
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if orientation == Qt.Orientation.Horizontal:
+            return self.__columns[section]
+
+        return f"{section + 1}"
+
+
+class TableDataDelegate(QStyledItemDelegate):
+    def createEditor(self, parent: QWidget, option: QStyleOptionViewItem, index: ModelIndex) -> QWidget:
+        model: TableDataModel = index.model()
+
+        columnType: str = model.columnType(index.column())
+        default: Optional[str] = model.columnDefault(index.column())
+
+        if columnType[:4] == "enum":
+            editor = QComboBox(parent)
+            editor.addItems(enumOptions(columnType))
+
+            return editor
+
+        if columnType == "date":
+            editor = QDateEdit(parent)
+            editor.setDisplayFormat("yyyy-MM-dd")
+            editor.setCalendarPopup(True)
+
+            if default:
+                self.__extendRange(editor, QDateTime(QDate.fromString(default, "yyyy-MM-dd"), editor.time()))
+
+            return editor
+
+        if columnType == "datetime":
+            editor = QDateTimeEdit(parent)
+            editor.setDisplayFormat("yyyy-MM-dd hh:mm:ss")
+            editor.setCalendarPopup(True)
+
+            if default:
+                self.__extendRange(editor, QDateTime.fromString(default, "yyyy-MM-dd hh:mm:ss"))
+
+            return editor
+
+        return super().createEditor(parent, option, index)
+
+    def setEditorData(self, editor: QWidget, index: ModelIndex) -> None:
+        value: str = index.data(Qt.ItemDataRole.EditRole)
+
+        if isinstance(editor, QComboBox):
+            editor.setCurrentText(value)
+
+        elif isinstance(editor, QDateEdit):
+            date = QDate.fromString(value, "yyyy-MM-dd")
+
+            self.__extendRange(editor, QDateTime(date, editor.time()))
+
+            editor.setDate(date)
+
+        elif isinstance(editor, QDateTimeEdit):
+            date = QDateTime.fromString(value, "yyyy-MM-dd hh:mm:ss")
+
+            self.__extendRange(editor, date)
+
+            editor.setDateTime(date)
+
+        else:
+            super().setEditorData(editor, index)
+
+    def setModelData(self, editor: QWidget, model: QAbstractItemModel, index: ModelIndex) -> None:
+        if isinstance(editor, QComboBox):
+            model.setData(index, editor.currentText())
+
+        elif isinstance(editor, QDateEdit):
+            model.setData(index, editor.date().toString("yyyy-MM-dd"))
+
+        elif isinstance(editor, QDateTimeEdit):
+            model.setData(index, editor.dateTime().toString("yyyy-MM-dd hh:mm:ss"))
+
+        else:
+            super().setModelData(editor, model, index)
+
+    @staticmethod
+    def __extendRange(editor: QDateTimeEdit, date: QDateTime) -> None:
+        if not date.isValid():
+            return
+
+        if date < editor.minimumDateTime():
+            editor.setMinimumDateTime(date)
+
+        elif date > editor.maximumDateTime():
+            editor.setMaximumDateTime(date)
+
+
+class FilterBar(QWidget):
+    changed = Signal()
+
+    def __init__(self, table: QTableView):
+        super().__init__(None)
+
+        self.__table: QTableView = table
+        self.__edits: List[QLineEdit] = []
+
+        self.setFixedHeight(QLineEdit().sizeHint().height())
+
+        header: QHeaderView = table.horizontalHeader()
+        header.sectionResized.connect(self.__place)
+        header.sectionMoved.connect(self.__place)
+        header.geometriesChanged.connect(self.__place)
+        table.verticalHeader().geometriesChanged.connect(self.__place)
+        table.horizontalScrollBar().valueChanged.connect(self.__place)
+
+    def setColumns(self, columns: Tuple[str]) -> None:
+        for edit in self.__edits:
+            edit.deleteLater()
+
+        self.__edits = []
+
+        for column in columns:
+            edit = QLineEdit(self)
+            edit.setPlaceholderText(f"Filter {column}")
+            edit.setToolTip(FILTER_HELP)
+            edit.returnPressed.connect(self.changed)
+            edit.show()
+
+            self.__edits.append(edit)
+
+        self.__place()
+
+    def filters(self, columns: Tuple[str]) -> List[DataFilter]:
+        return [DataFilter(column, edit.text()) for column, edit in zip(columns, self.__edits) if edit.text().strip()]
+
+    def clear(self) -> None:
+        for edit in self.__edits:
+            edit.clear()
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        super().resizeEvent(event)
+
+        self.__place()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+
+        self.__place()
+
+    @Slot()
+    def __place(self) -> None:
+        header: QHeaderView = self.__table.horizontalHeader()
+        left: int = header.x() + self.__table.x()
+
+        for col, edit in enumerate(self.__edits):
+            position: int = header.sectionViewportPosition(col)
+
+            edit.setGeometry(left + position, 0, header.sectionSize(col), self.height())
+            edit.setVisible(not header.isSectionHidden(col) and position >= 0)
 
 
 class TableDataView(QWidget):
     def __init__(self):
         self.__backend = Backend()
-
-        self.deleted: List[int] = []
+        self.__workers = WorkerPool()
 
         super().__init__(None)
 
         self.__database: str = ""
         self.__table: str = ""
-
-        self.__data = QTableWidget(self)
+        self.__structure: List[Tuple[Any]] = []
+        self.__generation: int = 0
+        self.__key: Optional[str] = None
+        self.__keyCol: int = 0
+        self.__unique: Tuple[int, ...] = ()
+        self.__large: FrozenSet[str] = frozenset()
+        self.__order: Optional[SortOrder] = None
+        self.__filters: List[DataFilter] = []
+        self.__indexes: Dict[str, List[str]] = {}
+        self.__resize: bool = False
+
+        self.__model = TableDataModel(self)
+
+        self.__data = QTableView(self)
+        self.__data.setModel(self.__model)
+        self.__data.setItemDelegate(TableDataDelegate(self.__data))
 
         self.__data.verticalHeader().setToolTip("Click to remove row")
         self.__data.verticalHeader().sectionClicked.connect(self.updateDeleted)
+        self.__data.doubleClicked.connect(self.viewValue)
+
+        self.__data.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.__data.horizontalHeader().setSectionsClickable(True)
+        self.__data.horizontalHeader().setSortIndicatorShown(True)
+        self.__data.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.__data.horizontalHeader().setToolTip("Click to sort on the server")
+        self.__data.horizontalHeader().sortIndicatorChanged.connect(self.sortBy)
+
+        self.__filterBar = FilterBar(self.__data)
+        self.__filterBar.changed.connect(self.applyFilters)
+
+        self.__cached = QLabel()
+        self.__cached.hide()
 
-        self.__data.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.__indexUse = QLabel()
+        self.__indexUse.hide()
 
         menubar = QMenuBar()
-        menubar.addAction("Add New Entry", lambda: self.__data.setRowCount(self.__data.rowCount() + 1))
+        menubar.addAction("Add New Entry", self.__model.addRow)
         menubar.addAction("Save Changes", lambda: self.saveEdits(self.__database, self.__table))
         menubar.addAction("Cancel Changes", lambda: self.setTable(self.__database, self.__table))
+        menubar.addAction("Import Rows", self.importRows)
+        menubar.addAction("Export Table", self.exportTable)
+        menubar.addAction("Clear Sort and Filters", self.clearSortAndFilters)
 
         self.__tableActions: List[QAction] = menubar.actions()
 
@@ -38,230 +524,298 @@ class TableDataView(QWidget):
 
         layout = QVBoxLayout(self)
         layout.setMenuBar(menubar)
+        layout.addWidget(self.__filterBar)
         layout.addWidget(self.__data)
+        layout.addWidget(self.__cached)
+        layout.addWidget(self.__indexUse)
 
     def setTable(self, database: str, table: str) -> None:
-        data, columns = self.__backend.getData(database, table)
-        structure, _ = self.__backend.getTableStructure(database, table)
+        self.__generation += 1
+
+        generation: int = self.__generation
 
         self.__database = database
         self.__table = table
 
-        self.__data.clear()
-        self.__data.setRowCount(len(data))
-        self.__data.setColumnCount(len(columns))
-        self.__data.setHorizontalHeaderLabels(columns)
-
-        for row, tuple_ in enumerate(data):
-            self.__data.setRowHidden(row, False)
-
-            for col, value in enumerate(tuple_):
-                if isinstance(value, bytes):
-                    value = value.decode("utf-8")
-
-                if structure[col][1][:4] == "enum":
-                    options = QComboBox()
-                    options.addItems(eval(structure[col][1][4:]))
-                    options.setCurrentText(f"{value}")
-
-                    self.__data.setCellWidget(row, col, options)
-
-                elif structure[col][1] == "date":
-                    currentDate = QDate.fromString(f"{value}", "yyyy-MM-dd")
+        self.setActionsClickable(False)
 
-                    date = QDateEdit()
-                    date.setDisplayFormat("yyyy-MM-dd")
-                    date.setCalendarPopup(True)
+        self.__workers.run(self.__backend.closeDataStream, self)
+        self.__workers.run(
+            self.__backend.getTableStructure, database, table,
+            finished=lambda result: self.__showTable(generation, result)
+        )
 
-                    if currentDate < date.minimumDate():
-                        date.setMinimumDate(currentDate)
+    def __showTable(self, generation: int, result: Union[Error, Tuple[List[Tuple[Any]], Tuple[str]]]) -> None:
+        if generation != self.__generation:
+            return
 
-                    elif currentDate > date.maximumDate():
-                        date.setMaximumDate(currentDate)
+        if isinstance(result, Error):
+            QMessageBox.critical(self, "Error", result.msg)
 
-                    if structure[col][2] != "":
-                        default = QDate.fromString(f"{structure[col][2]}", "yyyy-MM-dd")
+            return
 
-                        if default < date.minimumDate():
-                            date.setMinimumDate(default)
+        structure, _ = result
 
-                        elif default > date.maximumDate():
-                            date.setMaximumDate(default)
+        self.__structure = structure
 
-                    date.setDate(currentDate)
+        primary: List[int] = [col for col, tuple_ in enumerate(structure) if tuple_[3] == "PRI"]
 
-                    self.__data.setCellWidget(row, col, date)
+        if len(primary) == 1:
+            self.__key, self.__keyCol = structure[primary[0]][0], primary[0]
 
-                elif structure[col][1] == "datetime":
-                    currentDate = QDateTime.fromString(f"{value}", "yyyy-MM-dd hh:mm:ss")
+        else:
+            self.__key, self.__keyCol = None, 0
 
-                    date = QDateTimeEdit()
-                    date.setDisplayFormat("yyyy-MM-dd hh:mm:ss")
-                    date.setCalendarPopup(True)
+        unique: List[int] = [
+            col for col, tuple_ in enumerate(structure) if tuple_[3] == "UNI" and tuple_[2] == "NO"
+        ]
 
-                    if currentDate < date.minimumDate():
-                        date.setMinimumDateTime(currentDate)
+        self.__unique = tuple(primary) if primary else tuple(unique[:1])
 
-                    elif currentDate > date.maximumDate():
-                        date.setMaximumDateTime(currentDate)
+        self.__large = frozenset(tuple_[0] for tuple_ in structure if toText(tuple_[1]).lower() in LARGE_TYPES)
+        self.__order, self.__filters, self.__indexes = None, [], {}
+        self.__resize = True
 
-                    if structure[col][2] != "":
-                        default = QDateTime.fromString(f"{structure[col][2]}", "yyyy-MM-dd hh:mm:ss")
+        self.__cached.hide()
+        self.__indexUse.hide()
 
-                        if default < date.minimumDate():
-                            date.setMinimumDateTime(default)
+        self.__data.horizontalHeader().blockSignals(True)
+        self.__data.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.__data.horizontalHeader().blockSignals(False)
 
-                        elif default > date.maximumDate():
-                            date.setMaximumDateTime(default)
+        self.__model.editable = bool(self.__unique) and \
+            self.__database not in ("information_schema", "mysql", "sys", "performance")
+        self.__model.setTable(tuple(tuple_[0] for tuple_ in structure), structure, self.__unique, self.__fetchPage)
 
-                    date.setDateTime(currentDate)
+        self.__filterBar.setColumns(self.__model.columns())
 
-                    self.__data.setCellWidget(row, col, date)
+        database, table = self.__database, self.__table
 
-                else:
-                    self.__data.setItem(row, col, QTableWidgetItem(f"{value}"))
+        self.__workers.run(
+            self.__backend.getIndexes, database, table,
+            finished=lambda indexes: self.__showIndexes(database, table, indexes)
+        )
 
         self.setActionsClickable(True)
 
-        if database in ("information_schema", "mysql", "sys", "performance"):
-            self.__data.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-            self.__data.verticalHeader().setToolTip("")
-            self.__data.verticalHeader().sectionClicked.disconnect(self.updateDeleted)
-
-        else:
+        if self.__model.editable:
             self.__data.setEditTriggers(
                 QAbstractItemView.EditTrigger.DoubleClicked |
                 QAbstractItemView.EditTrigger.EditKeyPressed |
                 QAbstractItemView.EditTrigger.AnyKeyPressed
             )
             self.__data.verticalHeader().setToolTip("Click to remove row")
-            self.__data.verticalHeader().sectionClicked.connect(self.updateDeleted)
+
+        else:
+            self.__data.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+            self.__data.verticalHeader().setToolTip("")
+
+    def structure(self) -> List[Tuple[Any]]:
+        return self.__structure
 
     def clearData(self) -> None:
-        self.__data.setRowCount(0)
-        self.__data.setColumnCount(0)
+        self.__generation += 1
 
-    def setActionsClickable(self, clickable: bool) -> None:
-        for action in self.__tableActions:
-            action.setEnabled(clickable)
+        self.__workers.run(self.__backend.closeDataStream, self)
 
-    @Slot(int)
-    def updateDeleted(self, row: int):
-        deleted = row in self.deleted
+        self.__model.clear()
+        self.__filterBar.setColumns(())
+        self.__cached.hide()
+        self.__indexUse.hide()
 
-        if deleted:
-            self.deleted.remove(row)
+    def __fetchPage(self) -> None:
+        generation: int = self.__generation
+        fetched: int = self.__model.fetchedRowCount()
 
-        else:
-            self.deleted.append(row)
+        after: Any = self.__model.fetchedValue(-1, self.__keyCol) if fetched and self.__key is not None else None
 
-        for col in range(self.__data.columnCount()):
-            try:
-                self.__data.cellWidget(row, col).setEnabled(deleted)
+        self.__workers.run(
+            self.__backend.getDataPage, self.__database, self.__table, self.__model.pageSize, self.__key, after,
+            fetched, self.__model.columns(), self.__large, self.__order, self.__filters,
+            tuple(self.__structure[col][0] for col in self.__unique), self,
+            finished=lambda result: self.__showPage(generation, result)
+        )
 
-            except AttributeError:
-                self.__data.item(row, col).setEnabled(deleted)
+    def __showPage(self, generation: int,
+                   result: Union[Error, Tuple[List[Tuple[Any]], Tuple[str], Optional[float]]]) -> None:
+        if generation != self.__generation:
+            return
 
-    def saveEdits(self, database: str, table: str):
-        structure, _ = self.__backend.getTableStructure(database, table)
+        if isinstance(result, Error):
+            QMessageBox.critical(self, "Error", result.msg)
+
+            return
+
+        rows, _, cachedAge = result
+        first: bool = not self.__model.fetchedRowCount()
+
+        self.__model.appendPage(rows)
+
+        if first:
+            self.__cached.setVisible(cachedAge is not None)
 
-        for row, tuple_ in enumerate(structure):
-            if tuple_[3] not in ("PRI", "UNI"):
-                continue
+        if first and self.__resize:
+            self.__data.resizeColumnsToContents()
+            self.__resize = False
 
-            unique, uniqueCol = tuple_[0], row
+        if cachedAge is not None:
+            self.__cached.setText(
+                f"Showing rows from the result cache (cached {cachedAge:.0f} s ago, press F5 to refresh)"
+            )
+
+    def __showIndexes(self, database: str, table: str, indexes: Union[Error, Dict[str, List[str]]]) -> None:
+        if (database, table) != (self.__database, self.__table) or isinstance(indexes, Error):
+            return
 
-            break
+        self.__indexes = indexes
+
+        self.__updateIndexUse()
+
+    def __updateIndexUse(self) -> None:
+        text: str = describeIndexUse(self.__indexes, self.__filters, self.__order)
+
+        self.__indexUse.setText(text)
+        self.__indexUse.setVisible(bool(text))
+
+    @Slot(int, Qt.SortOrder)
+    def sortBy(self, col: int, order: Qt.SortOrder) -> None:
+        columns: Tuple[str] = self.__model.columns()
+
+        if not 0 <= col < len(columns):
+            self.__order = None
 
         else:
-            unique, uniqueCol = structure[0][0], 0
+            self.__order = SortOrder(columns[col], order == Qt.SortOrder.DescendingOrder)
 
-        rowCount = 0
+        self.__requery()
 
-        queries: List[str] = []
-        parameters: List[Iterable] = []
+    @Slot()
+    def applyFilters(self) -> None:
+        filters: List[DataFilter] = self.__filterBar.filters(self.__model.columns())
 
-        data, columns = self.__backend.getData(database, table)
+        if filters == self.__filters:
+            return
 
-        for row, tuple_ in enumerate(data):
-            uniqueValue = self.__data.item(row, uniqueCol).text()
+        self.__filters = filters
 
-            if row in self.deleted:
-                queries.append(f"DELETE FROM `{database}`.`{table}` WHERE `{unique}` = %s")
-                parameters.append((uniqueValue,))
+        self.__requery()
 
-                continue
+    @Slot()
+    def clearSortAndFilters(self) -> None:
+        self.__filterBar.clear()
 
-            changedValues: List[str] = []
+        self.__data.horizontalHeader().blockSignals(True)
+        self.__data.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.__data.horizontalHeader().blockSignals(False)
 
-            query: List[str] = []
+        if self.__order is None and not self.__filters:
+            return
 
-            for col in range(self.__data.columnCount()):
-                cell = self.__data.item(row, col)
+        self.__order, self.__filters = None, []
 
-                if cell is not None:
-                    value = cell.text()
+        self.__requery()
 
-                else:
-                    cell: Union[QComboBox, QDateEdit, QDateTimeEdit] = self.__data.cellWidget(row, col)
+    def __requery(self) -> None:
+        self.__generation += 1
 
-                    if isinstance(cell, QComboBox):
-                        value = cell.currentText()
+        self.__cached.hide()
+        self.__updateIndexUse()
 
-                    elif isinstance(cell, QDateTimeEdit):
-                        value = cell.dateTime().toString("yyyy-MM-dd hh:mm:ss")
+        self.__model.resetRows()
 
-                    else:
-                        value = cell.date().toString("yyyy-MM-dd")
+    def setActionsClickable(self, clickable: bool) -> None:
+        for action in self.__tableActions:
+            action.setEnabled(clickable)
 
-                if value == f"{tuple_[col]}":
-                    continue
+    @Slot(int)
+    def updateDeleted(self, row: int):
+        if not self.__model.editable:
+            return
 
-                changedValues.append(value)
-                query.append(f"`{columns[col]}` = %s")
+        self.__model.toggleDeleted(row)
 
-            if query:
-                queries.append(
-                    f"UPDATE `{database}`.`{table}` SET {', '.join(query)} WHERE `{unique}` = '{uniqueValue}'")
-                parameters.append(changedValues)
+    @Slot(QModelIndex)
+    def viewValue(self, index: QModelIndex):
+        row, col = index.row(), index.column()
 
-            rowCount += 1
+        if not self.__model.isLargeValue(row, col):
+            return
 
-        for row in range(rowCount, self.__data.rowCount()):
-            query: str = ""
-            changedValues: List[str] = []
+        from mysql_editor.value_viewer import ValueViewer
 
-            for col in range(self.__data.columnCount()):
-                cell: QTableWidgetItem = self.__data.item(row, col)
+        database, table, column = self.__database, self.__table, self.__model.columns()[col]
+        value: Any = self.__model.fetchedValue(row, col)
+        keyCols: Tuple[int, ...] = self.__unique or tuple(
+            keyCol for keyCol, tuple_ in enumerate(self.__structure) if tuple_[0] not in self.__large
+        )
 
-                if cell is not None:
-                    value = cell.text()
+        fetch: Optional[Callable[[int, int], Any]] = None
 
-                else:
-                    cell: Union[QComboBox, QDateEdit, QDateTimeEdit] = self.__data.cellWidget(row, col)
+        if isinstance(value, Preview):
+            fetch = partial(
+                self.__backend.getValueChunk, database, table, column,
+                tuple(self.__structure[keyCol][0] for keyCol in keyCols),
+                tuple(self.__model.fetchedValue(row, keyCol) for keyCol in keyCols)
+            )
+
+        ValueViewer(self, f"{table}.{column}", value, fetch).show()
+
+    @Slot()
+    def importRows(self):
+        database, table = self.__database, self.__table
+
+        from mysql_editor.importer import ImportDialog
 
-                    if isinstance(cell, QComboBox):
-                        value = cell.currentText()
+        dialog = ImportDialog(self, database, table)
+        dialog.imported.connect(lambda: self.__reload(database, table))
+        dialog.start()
 
-                    elif isinstance(cell, QDateTimeEdit):
-                        value = cell.dateTime().toString("yyyy-MM-dd hh:mm:ss")
+    def __reload(self, database: str, table: str):
+        if (self.__database, self.__table) == (database, table):
+            self.setTable(database, table)
 
-                    else:
-                        value = cell.date().toString("yyyy-MM-dd")
+    @Slot()
+    def exportTable(self):
+        from mysql_editor.export import ExportDialog
 
-                changedValues.append(value)
-                query += "%s, "
+        ExportDialog(self, f"SELECT * FROM `{self.__database}`.`{self.__table}`;").start(f"{self.__table}.csv")
+
+    def saveEdits(self, database: str, table: str):
+        if self.__model.journal.isEmpty() or not self.__unique:
+            return
+
+        batch: WriteBatch = self.__model.journal.batch(
+            database, table, self.__model.columns(), tuple(self.__structure[col][0] for col in self.__unique)
+        )
+
+        self.setActionsClickable(False)
+
+        self.__workers.run(
+            self.__backend.executeBatch, batch, finished=lambda report: self.__editsSaved(database, table, report)
+        )
+
+    def __editsSaved(self, database: str, table: str, report: BatchReport):
+        self.setActionsClickable(True)
 
-            queries.append(f"INSERT INTO `{database}`.`{table}` VALUES ({query[:-2]});")
-            parameters.append(changedValues)
+        if report.error is not None:
+            if report.applied:
+                self.__model.discardApplied(report.applied)
+                self.__requery()
 
-        error: Optional[Error] = self.__backend.executeQueries(queries, parameters)
+                QMessageBox.critical(
+                    self, "Error",
+                    f"{report.error.msg}\n\n{report.applied} of {report.total} changes were saved before the error, "
+                    f"the remaining changes were rolled back and are kept for editing"
+                )
 
-        if error is not None:
-            QMessageBox.critical(self, "Error", error.msg)
+            else:
+                QMessageBox.critical(self, "Error", report.error.msg)
 
             return
 
-        QMessageBox.information(self, "Success", "Successfully Executed")
+        QMessageBox.information(
+            self, "Success",
+            f"Saved {report.total} changes in {report.seconds:.3f} s ({report.rowsPerSecond():.0f} changes/s)"
+        )
 
-        self.__data.resizeColumnsToContents()
+        self.setTable(database, table)
@@ -1,6 +1,11 @@
-from PySide6.QtWidgets import QLabel, QTableWidget, QHeaderView, QTableWidgetItem
+from typing import Any, List, Tuple, Union
+
+from PySide6.QtWidgets import QLabel, QMessageBox, QTableWidget, QHeaderView, QTableWidgetItem
+from mysql.connector.errors import Error
 
 from mysql_editor.backend import Backend
+from mysql_editor.row_store import toText
+from mysql_editor.worker import WorkerPool
 
 
 class TableStructureView(QTableWidget):
@@ -8,11 +13,31 @@ class TableStructureView(QTableWidget):
         super().__init__(None)
 
         self.__backend = Backend()
+        self.__workers = WorkerPool()
+
+        self.__requested: Tuple[str, str] = ("", "")
 
         self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
 
     def setTable(self, database: str, table: str) -> None:
-        structure, columns = self.__backend.getTableStructure(database, table)
+        self.__requested = (database, table)
+
+        self.__workers.run(
+            self.__backend.getTableStructure, database, table,
+            finished=lambda result: self.__showStructure(database, table, result)
+        )
+
+    def __showStructure(self, database: str, table: str,
+                        result: Union[Error, Tuple[List[Tuple[Any]], Tuple[str]]]) -> None:
+        if (database, table) != self.__requested:
+            return
+
+        if isinstance(result, Error):
+            QMessageBox.critical(self, "Error", result.msg)
+
+            return
+
+        structure, columns = result
 
         self.clear()
         self.setColumnCount(len(structure))
@@ -21,13 +46,12 @@ class TableStructureView(QTableWidget):
 
         for row, tuple_ in enumerate(structure):
             for col, value in enumerate(tuple_[1:]):
-                if isinstance(value, bytes):
-                    value = value.decode("utf-8")
-
-                self.setCellWidget(col, row, QLabel(value))
+                self.setCellWidget(col, row, QLabel(None if value is None else toText(value)))
 
             self.setHorizontalHeaderItem(row, QTableWidgetItem(tuple_[0]))
 
     def clearData(self) -> None:
+        self.__requested = ("", "")
+
         self.setRowCount(0)
         self.setColumnCount(0)
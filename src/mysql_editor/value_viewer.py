@@ -0,0 +1,161 @@
+import codecs
+from typing import Any, Callable, List, Optional, Union
+
+from PySide6.QtCore import Qt, Slot
+from PySide6.QtGui import QFontDatabase, QTextCursor
+from PySide6.QtWidgets import (QCheckBox, QDialog, QHBoxLayout, QLabel, QMessageBox, QPlainTextEdit, QPushButton,
+                               QVBoxLayout, QWidget)
+from mysql.connector.errors import Error
+
+from mysql_editor.row_store import Preview, formatSize, isBinary
+from mysql_editor.worker import WorkerPool
+
+VALUE_CHUNK_SIZE: int = 65536
+HEX_WIDTH: int = 16
+
+Chunk = Union[str, bytes]
+
+
+def hexDump(data: bytes, offset: int = 0) -> str:
+    return "\n".join(
+        f"{offset + start:08x}  {data[start:start + HEX_WIDTH].hex(' '):<{HEX_WIDTH * 3 - 1}}  "
+        f"{''.join(chr(byte) if 32 <= byte < 127 else '.' for byte in data[start:start + HEX_WIDTH])}"
+        for start in range(0, len(data), HEX_WIDTH)
+    )
+
+
+class ValueViewer(QDialog):
+    def __init__(self, parent: QWidget, title: str, value: Any,
+                 fetch: Optional[Callable[[int, int], Optional[Chunk]]] = None):
+        super().__init__(parent)
+
+        self.setWindowTitle(title)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.resize(720, 480)
+
+        self.__workers = WorkerPool()
+        self.__fetch: Optional[Callable[[int, int], Optional[Chunk]]] = fetch
+        self.__chunks: List[Chunk] = []
+        self.__position: int = 0
+        self.__loaded: int = 0
+        self.__length: Optional[int] = value.length if isinstance(value, Preview) else None
+        self.__complete: bool = fetch is None
+        self.__loadAll: bool = False
+        self.__hexPending: bytes = b""
+        self.__hexOffset: int = 0
+        self.__decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+        self.__text = QPlainTextEdit()
+        self.__text.setReadOnly(True)
+        self.__text.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+
+        self.__hex = QCheckBox("Hex")
+        self.__hex.setChecked(isBinary(value))
+        self.__hex.toggled.connect(self.__render)
+
+        self.__status = QLabel()
+
+        self.__more = QPushButton("Load More")
+        self.__more.clicked.connect(self.loadMore)
+
+        self.__all = QPushButton("Load All")
+        self.__all.clicked.connect(self.loadAll)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.__hex)
+        buttons.addWidget(self.__status, 1)
+        buttons.addWidget(self.__more)
+        buttons.addWidget(self.__all)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.__text)
+        layout.addLayout(buttons)
+
+        if fetch is None:
+            self.__addChunk(bytes(value) if isinstance(value, bytearray) else value)
+
+        else:
+            self.loadMore()
+
+        self.__updateStatus()
+
+    @Slot()
+    def loadMore(self) -> None:
+        if self.__complete:
+            return
+
+        self.__more.setEnabled(False)
+        self.__all.setEnabled(False)
+
+        self.__workers.run(self.__fetch, self.__position, VALUE_CHUNK_SIZE, finished=self.__chunkLoaded)
+
+    @Slot()
+    def loadAll(self) -> None:
+        self.__loadAll = True
+
+        self.loadMore()
+
+    @Slot(object)
+    def __chunkLoaded(self, chunk: Union[Error, Chunk, None]) -> None:
+        if isinstance(chunk, Error):
+            self.__loadAll = False
+            self.__updateStatus()
+
+            QMessageBox.critical(self, "Error", chunk.msg)
+
+            return
+
+        if chunk is None:
+            chunk = b""
+
+        self.__position += len(chunk)
+        self.__complete = len(chunk) < VALUE_CHUNK_SIZE
+
+        self.__addChunk(bytes(chunk) if isinstance(chunk, bytearray) else chunk)
+        self.__updateStatus()
+
+        if self.__loadAll:
+            self.loadMore()
+
+    def __addChunk(self, chunk: Chunk) -> None:
+        self.__chunks.append(chunk)
+        self.__loaded += len(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+        self.__append(chunk, self.__complete)
+
+    def __append(self, chunk: Chunk, final: bool) -> None:
+        if self.__hex.isChecked():
+            data: bytes = self.__hexPending + (chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            whole: int = len(data) if final else len(data) - len(data) % HEX_WIDTH
+
+            self.__hexPending = data[whole:]
+            text: str = hexDump(data[:whole], self.__hexOffset)
+            self.__hexOffset += whole
+
+            if text and self.__text.document().characterCount() > 1:
+                text = f"\n{text}"
+
+        else:
+            text = chunk if isinstance(chunk, str) else self.__decoder.decode(chunk, final)
+
+        cursor: QTextCursor = self.__text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+
+    @Slot()
+    def __render(self) -> None:
+        self.__text.clear()
+        self.__hexPending = b""
+        self.__hexOffset = 0
+        self.__decoder.reset()
+
+        for index, chunk in enumerate(self.__chunks):
+            self.__append(chunk, self.__complete and index == len(self.__chunks) - 1)
+
+    def __updateStatus(self) -> None:
+        total: str = "" if self.__length is None else f" of {formatSize(self.__length)}"
+
+        self.__status.setText(f"{'Loaded' if self.__complete else 'Showing'} {formatSize(self.__loaded)}{total}")
+
+        self.__more.setEnabled(not self.__complete)
+        self.__all.setEnabled(not self.__complete)
@@ -1,49 +1,113 @@
-from typing import Any, List, Optional, Tuple, Union
+import re
+from threading import Event
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 from PySide6.QtCore import QKeyCombination, QPoint, Qt, Slot
-from PySide6.QtWidgets import (QHeaderView, QLabel, QMainWindow, QMenu, QMessageBox, QSplitter, QTabWidget,
-                               QTableWidget, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
+from PySide6.QtWidgets import (QFileDialog, QLabel, QMainWindow, QMenu, QMessageBox, QProgressBar, QProgressDialog,
+                               QSplitter, QTabWidget, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget)
 from mysql.connector import MySQLConnection
+from mysql.connector.errorcode import ER_QUERY_INTERRUPTED
 from mysql.connector.errors import Error
 
 from mysql_editor.add_database import AddDatabaseWindow
-from mysql_editor.backend import Backend
+from mysql_editor.backend import MULTI_STATEMENT_SIZE, READ_ONLY, SCHEMA_CHANGE, USE_DATABASE, Backend
+from mysql_editor.batch import CHUNK_SIZE
+from mysql_editor.files import ScriptReader
+from mysql_editor.pool import POOL_SIZE, ConnectionPool, PoolMetrics
 from mysql_editor.query import QueryTab, QueryTabViewer
+from mysql_editor.result_view import BATCH_SIZE, ResultView, packRows
+from mysql_editor.row_store import RowStore
+from mysql_editor.settings import getIntSetting
+from mysql_editor.splitter import Statement, splitStatements
+from mysql_editor.stats import QueryMonitor, QueryStats
 from mysql_editor.table_data_view import TableDataView
 from mysql_editor.table_structure_view import TableStructureView
+from mysql_editor.worker import WorkerPool
+
+ERROR_LINE = re.compile(r"at line (\d+)")
+
+SCRIPT_PROGRESS_INTERVAL: float = 0.25
+SCRIPT_ERRORS_SHOWN: int = 10
+
+
+class QueryEvent(NamedTuple):
+    kind: str
+    index: int
+    statement: Statement
+    payload: Any
+
+
+class ScriptProgress(NamedTuple):
+    bytesRead: int
+    size: int
+    statements: int
+    failures: int
+    errors: List[Tuple[Statement, Error]]
+    seconds: float
+    schemaChanged: bool = False
+    stopped: bool = False
 
 
 class WindowUI(QMainWindow):
-    def __init__(self, connection: MySQLConnection):
+    def __init__(self, pool: ConnectionPool, chunkSize: int = CHUNK_SIZE, resultCacheSize: int = 0, timeout: int = 0):
         super().__init__(None)
 
         self.setWindowTitle("MySQL Editor")
         self.setWindowState(Qt.WindowState.WindowMaximized)
         self.setCentralWidget(QWidget())
 
-        self.__backend = Backend(connection)
+        self.__backend = Backend(pool, chunkSize, resultCacheSize)
+        self.__workers = WorkerPool()
 
         self.queryTabs = QueryTabViewer(self)
+        self.queryTabs.setDefaultTimeout(timeout)
         self.database = QLabel("Current Database:")
         self.databaseTree = QTreeWidget()
         self.table = QLabel("Current Table:")
         self.tableStructure = TableStructureView()
-        self.tableData = TableDataView()
+        self.__tableData: Optional[TableDataView] = None
+        self.__dataTab = QWidget()
         self.displayedTable: str = ''
         self.displayedDatabase: str = ''
 
+        self.__executing: bool = False
+        self.__runningTab: Optional[QueryTab] = None
+        self.__deferredDatabase: Optional[str] = None
+        self.__cancelled: bool = False
+        self.__schemaChanged: bool = False
+        self.__refreshes: int = 0
+
+        self.__busy = QProgressBar()
+        self.__busy.setRange(0, 0)
+        self.__busy.setMaximumWidth(200)
+        self.__busy.hide()
+
+        self.__poolStatus = QLabel()
+
+        self.statusBar().addPermanentWidget(self.__poolStatus)
+        self.statusBar().addPermanentWidget(self.__busy)
+
+        self.__workers.activeChanged.connect(self.__updateStatus)
+        self.__workers.failed.connect(self.__workerFailed)
+
         self.genDatabaseList()
+        self.__workers.run(self.__backend.getCatalog)
 
         self.databaseTree.setHeaderHidden(True)
         self.databaseTree.itemSelectionChanged.connect(self.prepareTableInfo)
         self.databaseTree.itemChanged.connect(self.itemEdited)
+        self.databaseTree.itemExpanded.connect(self.loadTables)
 
         self.databaseTree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.databaseTree.customContextMenuRequested.connect(self.prepareMenu)
 
         self.tableDetails = QTabWidget()
         self.tableDetails.addTab(self.tableStructure, "Structure")
-        self.tableDetails.addTab(self.tableData, "Data")
+        self.tableDetails.addTab(self.__dataTab, "Data")
+
+        dataLayout = QVBoxLayout(self.__dataTab)
+        dataLayout.setContentsMargins(0, 0, 0, 0)
 
         self.fileMenu = self.menuBar().addMenu("File")
         self.fileMenu.addAction("Open File", self.queryTabs.currentWidget().openFile,
@@ -52,11 +116,24 @@ class WindowUI(QMainWindow):
                                 QKeyCombination(Qt.Modifier.CTRL, Qt.Key.Key_S))
         self.fileMenu.addAction("Save File As", self.queryTabs.currentWidget().saveFileAs,
                                 QKeyCombination(Qt.Modifier.CTRL | Qt.Modifier.SHIFT, Qt.Key.Key_S))
+        self.fileMenu.addSeparator()
+        self.runScriptAction = self.fileMenu.addAction(
+            "Run Script File", QKeyCombination(Qt.Modifier.CTRL | Qt.Modifier.SHIFT, Qt.Key.Key_R), self.runScriptFile
+        )
+        self.fileMenu.addAction(
+            "Export Query Result", QKeyCombination(Qt.Modifier.CTRL | Qt.Modifier.SHIFT, Qt.Key.Key_E),
+            self.exportQueryResult
+        )
 
         self.executeAction = self.menuBar().addAction(
             "Execute Query", QKeyCombination(Qt.Modifier.SHIFT, Qt.Key.Key_F10),
-            lambda: self.executeQueries(self.queryTabs.currentWidget().queryBox.toPlainText().replace('\n', ' '))
+            lambda: self.executeQueries(self.queryTabs.currentWidget().queryBox.toPlainText())
+        )
+
+        self.cancelAction = self.menuBar().addAction(
+            "Cancel Query", QKeyCombination(Qt.Modifier.CTRL, Qt.Key.Key_Period), self.cancelQuery
         )
+        self.cancelAction.setEnabled(False)
 
         self.refreshAction = self.menuBar().addAction("Refresh", Qt.Key.Key_F5, self.refresh)
 
@@ -129,8 +206,12 @@ class WindowUI(QMainWindow):
         ) != QMessageBox.StandardButton.Yes:
             return
 
-        error: Optional[Error] = self.__backend.dropTable(database, table)
+        self.__workers.run(
+            self.__backend.dropTable, database, table,
+            finished=lambda error: self.__tableDropped(database, table, error)
+        )
 
+    def __tableDropped(self, database: str, table: str, error: Optional[Error]):
         if error is not None:
             QMessageBox.critical(self, "Error", error.msg)
 
@@ -138,28 +219,39 @@ class WindowUI(QMainWindow):
 
         QMessageBox.information(self, "Success", "Successfully dropped!")
 
-        self.tableStructure.clearData()
-        self.tableData.clearData()
+        self.__clearTableInfo()
+
+        tableItem: Optional[QTreeWidgetItem] = self.__findTable(database, table)
+
+        if tableItem is not None:
+            self.databaseTree.blockSignals(True)
+            tableItem.parent().removeChild(tableItem)
+            self.databaseTree.blockSignals(False)
 
+        self.table.setText(f"Current Table: ")
+        self.displayedTable = ""
+
+    def __findDatabase(self, database: str) -> Optional[QTreeWidgetItem]:
         for i in range(self.databaseTree.topLevelItemCount()):
-            if self.databaseTree.topLevelItem(i).text(0) != database:
-                continue
+            if self.databaseTree.topLevelItem(i).text(0) == database:
+                return self.databaseTree.topLevelItem(i)
 
-            for j in range(self.databaseTree.topLevelItem(i).childCount()):
-                if self.databaseTree.topLevelItem(i).child(j).text(0) != table:
-                    continue
+        return None
 
-                self.databaseTree.topLevelItem(i).takeChild(j)
+    def __findTable(self, database: str, table: str) -> Optional[QTreeWidgetItem]:
+        databaseItem: Optional[QTreeWidgetItem] = self.__findDatabase(database)
 
-                break
+        if databaseItem is None:
+            return None
 
-            else:
-                continue
+        for i in range(databaseItem.childCount()):
+            folder: QTreeWidgetItem = databaseItem.child(i)
 
-            break
+            for j in range(folder.childCount()):
+                if folder.child(j).text(0) == table:
+                    return folder.child(j)
 
-        self.table.setText(f"Current Table: ")
-        self.displayedTable = ""
+        return None
 
     @Slot()
     def dropDatabase(self, database: str):
@@ -170,31 +262,29 @@ class WindowUI(QMainWindow):
         ) != QMessageBox.StandardButton.Yes:
             return
 
-        error: Optional[Error] = self.__backend.dropDatabase(database)
+        self.__workers.run(
+            self.__backend.dropDatabase, database, finished=lambda error: self.__databaseDropped(database, error)
+        )
 
+    def __databaseDropped(self, database: str, error: Optional[Error]):
         if error is not None:
             QMessageBox.critical(self, "Error", error.msg)
 
             return
 
-        item = self.databaseTree.currentItem()
-
-        if item.parent():
-            item = item.parent()
-
-            if item.parent():
-                item = item.parent()
-
         self.databaseTree.blockSignals(True)
 
-        self.databaseTree.takeTopLevelItem(self.databaseTree.indexOfTopLevelItem(item))
+        for i in range(self.databaseTree.topLevelItemCount()):
+            if self.databaseTree.topLevelItem(i).text(0) == database:
+                self.databaseTree.takeTopLevelItem(i)
+
+                break
 
         self.databaseTree.setCurrentItem(None)
 
         self.databaseTree.blockSignals(False)
 
-        self.tableStructure.clearData()
-        self.tableData.clearData()
+        self.__clearTableInfo()
 
         self.database.setText("Current Database:")
         self.table.setText("Current Text:")
@@ -202,74 +292,112 @@ class WindowUI(QMainWindow):
         QMessageBox.information(self, "Success", "Successfully Dropped!")
 
     def genDatabaseList(self):
+        self.__workers.run(self.__backend.getDatabases, finished=self.__showDatabases)
+
+    def __showDatabases(self, databases: Union[Error, List[Tuple[str]]]):
+        if isinstance(databases, Error):
+            QMessageBox.critical(self, "Error", databases.msg)
+
+            return
+
         self.databaseTree.blockSignals(True)
 
-        for (database,) in self.__backend.getDatabases():
+        for (database,) in databases:
             databaseItem = QTreeWidgetItem(self.databaseTree, (database,))
+            databaseItem.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+
+        self.databaseTree.blockSignals(False)
 
-            tablesItem = QTreeWidgetItem(databaseItem, ("Tables",))
-            viewsItem = QTreeWidgetItem(databaseItem, ("Views",))
+    @Slot(QTreeWidgetItem)
+    def loadTables(self, item: QTreeWidgetItem):
+        if item.parent() is not None or item.data(0, Qt.ItemDataRole.UserRole):
+            return
 
-            if database in ("mysql", "sys", "performance"):
-                for table in self.__backend.getTables(database, "BASE TABLE"):
-                    tablesItem.addChild(QTreeWidgetItem(table))
+        database: str = item.text(0)
 
-                for table in self.__backend.getTables(database, "VIEW"):
-                    viewsItem.addChild(QTreeWidgetItem(table))
+        item.setData(0, Qt.ItemDataRole.UserRole, True)
 
-            if database == "information_schema":
-                for table in self.__backend.getTables(database, "SYSTEM VIEW"):
-                    viewsItem.addChild(QTreeWidgetItem(table))
+        self.__workers.run(
+            self.__backend.getTables, database, finished=lambda tables: self.__showTables(database, tables)
+        )
 
-            else:
-                for table in self.__backend.getTables(database, "BASE TABLE"):
-                    tableItem = QTreeWidgetItem(tablesItem, table)
-                    tableItem.setFlags(tableItem.flags() | Qt.ItemFlag.ItemIsEditable)
+    def __showTables(self, database: str, tables: Union[Error, List[Tuple[str, str]]]):
+        if isinstance(tables, Error):
+            QMessageBox.critical(self, "Error", tables.msg)
 
-                for table in self.__backend.getTables(database, "VIEW"):
-                    tableItem = QTreeWidgetItem(viewsItem, table)
-                    tableItem.setFlags(tableItem.flags() | Qt.ItemFlag.ItemIsEditable)
+            return
+
+        databaseItem: Optional[QTreeWidgetItem] = self.__findDatabase(database)
+
+        if databaseItem is None or databaseItem.childCount():
+            return
+
+        self.databaseTree.blockSignals(True)
+
+        tablesItem = QTreeWidgetItem(databaseItem, ("Tables",))
+        viewsItem = QTreeWidgetItem(databaseItem, ("Views",))
+
+        for table, tableType in tables:
+            (tablesItem if tableType == "BASE TABLE" else viewsItem).addChild(
+                self.__tableItem(database, table, tableType)
+            )
+
+        databaseItem.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless)
 
         self.databaseTree.blockSignals(False)
 
+    @staticmethod
+    def __tableItem(database: str, table: str, tableType: str) -> QTreeWidgetItem:
+        tableItem = QTreeWidgetItem((table, tableType))
+        tableItem.setData(0, Qt.ItemDataRole.UserRole, table)
+
+        if database not in ("information_schema", "mysql", "sys", "performance"):
+            tableItem.setFlags(tableItem.flags() | Qt.ItemFlag.ItemIsEditable)
+
+        return tableItem
+
     @Slot(QTreeWidgetItem)
     def itemEdited(self, item: QTreeWidgetItem):
-        if not item.parent().parent():
+        if not item.parent() or not item.parent().parent():
             return
 
         database: str = item.parent().parent().text(0)
+        old: str = item.data(0, Qt.ItemDataRole.UserRole)
+        new: str = item.text(0)
 
-        existing: List[str] = [table for (table, _) in
-                               self.__backend.getTables(database, "BASE TABLE") + self.__backend.getTables(database,
-                                                                                                           "VIEW")]
-
-        for index in range(item.childCount()):
-            text: str = item.child(index).text(0)
+        if old == new:
+            return
 
-            if text not in existing:
-                continue
+        self.__workers.run(
+            self.__backend.renameTable, database, old, new,
+            finished=lambda error: self.__tableRenamed(item, database, old, new, error)
+        )
 
-            existing.remove(text)
+    def __tableRenamed(self, item: QTreeWidgetItem, database: str, old: str, new: str, error: Optional[Error]):
+        self.databaseTree.blockSignals(True)
 
-        if not existing:
-            return
+        if error is not None:
+            item.setText(0, old)
 
-        error: Optional[Error] = self.__backend.renameTable(database, existing[0], item.text(0))
+            self.databaseTree.blockSignals(False)
 
-        if error is not None:
             QMessageBox.critical(self, "Error", error.msg)
 
             return
 
-        self.table.setText(f"Current Table: `{item.text(0)}` From `{database}`")
-        self.displayedTable = item.text(0)
+        item.setData(0, Qt.ItemDataRole.UserRole, new)
+
+        self.databaseTree.blockSignals(False)
+
+        self.table.setText(f"Current Table: `{new}` From `{database}`")
+        self.displayedTable = new
 
     @Slot()
     def changeModes(self, sizes):
         queryBoxSize = sizes[1]
 
         self.fileMenu.setEnabled(queryBoxSize)
-        self.executeAction.setEnabled(queryBoxSize)
+        self.executeAction.setEnabled(queryBoxSize and not self.__executing)
         self.refreshAction.setEnabled(sizes[0])
 
         if queryBoxSize:
@@ -297,10 +425,32 @@ class WindowUI(QMainWindow):
         else:
             self.displayedDatabase = item.text(0)
 
-        self.__backend.setDatabase(self.displayedDatabase)
+        self.__useDatabase(self.queryTabs.currentWidget(), self.displayedDatabase)
 
         self.database.setText(f"Current Database: {self.displayedDatabase}")
 
+    def __useDatabase(self, tab: QueryTab, database: str):
+        if tab is self.__runningTab:
+            self.__deferredDatabase = database
+
+            return
+
+        self.__workers.run(self.__backend.setDatabase, database, tab)
+
+    @property
+    def tableData(self) -> TableDataView:
+        if self.__tableData is None:
+            self.__tableData = TableDataView()
+            self.__dataTab.layout().addWidget(self.__tableData)
+
+        return self.__tableData
+
+    def __clearTableInfo(self):
+        self.tableStructure.clearData()
+
+        if self.__tableData is not None:
+            self.__tableData.clearData()
+
     @Slot()
     def showTableInfo(self, database, table):
         self.displayedTable = table
@@ -313,82 +463,529 @@ class WindowUI(QMainWindow):
 
     @Slot()
     def executeQueries(self, queries: str):
-        if not queries.strip():
+        if not queries.strip() or self.__executing:
             return
 
-        queryList: List[str] = queries.split(';')
-
         tab: QueryTab = self.queryTabs.currentWidget()
 
         tab.results.clear()
+        tab.results.hide()
+
+        self.__startExecution(tab)
+
+        self.__workers.run(
+            self.__execute, queries, tab,
+            finished=lambda _: self.__executionFinished(tab), progress=lambda event: self.__showProgress(tab, event)
+        )
+
+    def __execute(self, queries: str, tab: QueryTab, progress: Callable[[QueryEvent], None]) -> None:
+        for batch in self.__statementBatches(splitStatements(queries)):
+            for position, result in self.__results(batch, tab):
+                i, statement = batch[position]
+
+                if isinstance(result, Error):
+                    progress(QueryEvent("error", i, statement, result))
+
+                    return
+
+                if result:
+                    progress(QueryEvent("result", i, statement, (result, self.__backend.resultAge(tab))))
+
+                    pack: float = 0.0
+
+                    while True:
+                        rows: Union[Error, List[Tuple[Any]]] = self.__backend.fetchRows(BATCH_SIZE, tab)
+
+                        if isinstance(rows, Error):
+                            progress(QueryEvent("error", i, statement, rows))
+
+                            return
+
+                        start: float = perf_counter()
+                        packed: RowStore = packRows(rows)
+                        pack += perf_counter() - start
+
+                        progress(QueryEvent("rows", i, statement, packed))
+
+                        if len(rows) < BATCH_SIZE:
+                            break
+
+                    stats: QueryStats = self.__backend.queryStats(tab)._replace(pack=pack)
 
-        count = 1
+                    progress(QueryEvent("fetched", i, statement, stats))
 
-        for i, query in enumerate(queryList):
-            query: str = query.strip()
+                    continue
+
+                QueryMonitor().publish(self.__backend.queryStats(tab))
+
+                database = USE_DATABASE.match(statement.text)
+
+                if database is not None:
+                    progress(QueryEvent("database", i, statement, database.group(1) or database.group(2)))
+
+                elif SCHEMA_CHANGE.match(statement.text):
+                    progress(QueryEvent("schema", i, statement, None))
+
+    def __statementBatches(self, statements: Iterable[Statement]) -> Iterator[List[Tuple[int, Statement]]]:
+        batch: List[Tuple[int, Statement]] = []
+        size: int = 0
+
+        for i, statement in enumerate(statements):
+            alone: bool = not self.__backend.canBatch(statement.text)
+
+            if batch and (alone or size + len(statement.text) > MULTI_STATEMENT_SIZE):
+                yield batch
 
-            if not query:
-                continue
+                batch, size = [], 0
 
-            result: Union[Error, Tuple[List[Any], List[str]]] = self.__backend.executeQuery(query)
+            batch.append((i, statement))
+            size += len(statement.text)
+
+            if alone:
+                yield batch
+
+                batch, size = [], 0
+
+        if batch:
+            yield batch
+
+    def __results(self, batch: List[Tuple[int, Statement]],
+                  tab: QueryTab) -> Iterator[Tuple[int, Union[Error, Tuple[str]]]]:
+        if len(batch) == 1:
+            result: Union[Error, Tuple[str], None] = self.__backend.startQuery(batch[0][1].text, tab)
+
+        else:
+            result = self.__backend.startBatch([statement.text for _, statement in batch], tab)
+
+        while result is not None:
+            yield self.__backend.statementIndex(tab), result
 
             if isinstance(result, Error):
-                QMessageBox.critical(self, f"Error executing query", f"In query {i + 1}:\n\n{query}\n\n{result.msg}")
+                return
+
+            result = self.__backend.nextResult(tab)
+
+    @Slot()
+    def exportQueryResult(self):
+        tab: QueryTab = self.queryTabs.currentWidget()
+        statement: Optional[Statement] = next(splitStatements(tab.queryBox.toPlainText()), None)
+
+        if statement is None:
+            return
+
+        if not READ_ONLY.match(statement.text):
+            QMessageBox.critical(self, "Error", "Only the result of a read-only query such as SELECT can be exported")
+
+            return
+
+        from mysql_editor.export import ExportDialog
+
+        ExportDialog(self, statement.text, self.__backend.getDatabase(tab)).start("result.csv")
+
+    @Slot()
+    def runScriptFile(self):
+        if self.__executing:
+            return
+
+        fileName: str = QFileDialog.getOpenFileName(self, "Run Script File", "", "SQL Query File (*.sql)")[0]
 
+        if not fileName:
+            return
+
+        question = QMessageBox(
+            QMessageBox.Icon.Question, "Run Script File", f"What should happen if a statement in {fileName} fails?",
+            QMessageBox.StandardButton.Cancel, self
+        )
+        stopButton = question.addButton("Stop", QMessageBox.ButtonRole.AcceptRole)
+        continueButton = question.addButton("Continue", QMessageBox.ButtonRole.AcceptRole)
+        question.setDefaultButton(stopButton)
+        question.exec()
+
+        if question.clickedButton() not in (stopButton, continueButton):
+            return
+
+        try:
+            reader = ScriptReader(fileName)
+
+        except OSError as error:
+            QMessageBox.critical(self, "Error", error.strerror)
+
+            return
+
+        tab: QueryTab = self.queryTabs.currentWidget()
+        stop = Event()
+
+        dialog = QProgressDialog(f"Running {fileName}", "Stop", 0, 1000, self)
+        dialog.setWindowTitle("Run Script File")
+        dialog.setAutoClose(False)
+        dialog.setAutoReset(False)
+        dialog.setMinimumDuration(0)
+        dialog.canceled.connect(stop.set)
+        dialog.canceled.connect(self.cancelQuery)
+        dialog.show()
+
+        self.__startExecution(tab)
+        self.runScriptAction.setEnabled(False)
+
+        self.__workers.run(
+            self.__runScript, reader, tab, stop, question.clickedButton() == stopButton,
+            finished=lambda result: self.__scriptFinished(tab, dialog, fileName, result),
+            progress=lambda event: self.__showScriptProgress(tab, dialog, event)
+        )
+
+    def __runScript(self, reader: ScriptReader, tab: QueryTab, stop: Event, stopOnError: bool,
+                    progress: Callable[[QueryEvent], None]) -> ScriptProgress:
+        start: float = perf_counter()
+        reported: float = start
+        errors: List[Tuple[Statement, Error]] = []
+        failures: int = 0
+        statements: int = 0
+        schemaChanged: bool = False
+        stopped: bool = False
+
+        for batch in self.__statementBatches(splitStatements(reader)):
+            while batch and not stopped:
+                if stop.is_set():
+                    stopped = True
+
+                    break
+
+                executed: List[Tuple[int, Statement]] = batch
+
+                for position, result in self.__results(batch, tab):
+                    i, statement = batch[position]
+
+                    if not isinstance(result, Error) and result:
+                        result = self.__discardRows(tab)
+
+                    if isinstance(result, Error) and stop.is_set() and result.errno == ER_QUERY_INTERRUPTED:
+                        executed = batch[:position]
+                        stopped = True
+
+                        break
+
+                    if isinstance(result, Error):
+                        executed = batch[:position + 1]
+                        failures += 1
+
+                        if len(errors) < SCRIPT_ERRORS_SHOWN:
+                            errors.append((statement, result))
+
+                        stopped = stopOnError
+
+                        break
+
+                    QueryMonitor().publish(self.__backend.queryStats(tab))
+
+                    database = USE_DATABASE.match(statement.text)
+
+                    if database is not None:
+                        progress(QueryEvent("database", i, statement, database.group(1) or database.group(2)))
+
+                    elif SCHEMA_CHANGE.match(statement.text):
+                        schemaChanged = True
+
+                statements += len(executed)
+                batch = batch[len(executed):]
+
+                now: float = perf_counter()
+
+                if executed and now - reported >= SCRIPT_PROGRESS_INTERVAL:
+                    reported = now
+                    i, statement = executed[-1]
+
+                    progress(QueryEvent(
+                        "script", i, statement,
+                        ScriptProgress(reader.bytesRead, reader.size, statements, failures, list(errors), now - start)
+                    ))
+
+            if stopped:
                 break
 
-            queryUpper: str = query.upper()
+        return ScriptProgress(
+            reader.bytesRead, reader.size, statements, failures, errors, perf_counter() - start, schemaChanged, stopped
+        )
+
+    def __discardRows(self, tab: QueryTab) -> Union[Error, Tuple[str]]:
+        while True:
+            rows: Union[Error, List[Tuple[Any]]] = self.__backend.fetchRows(BATCH_SIZE, tab)
+
+            if isinstance(rows, Error):
+                return rows
+
+            if len(rows) < BATCH_SIZE:
+                return ()
+
+    def __showScriptProgress(self, tab: QueryTab, dialog: QProgressDialog, event: QueryEvent):
+        if event.kind != "script":
+            self.__showProgress(tab, event)
+
+            return
+
+        report: ScriptProgress = event.payload
+        seconds: float = max(report.seconds, 1e-9)
+
+        dialog.setValue(int(report.bytesRead * 1000 / max(report.size, 1)))
+        dialog.setLabelText(
+            f"{report.bytesRead / 1048576:.1f} of {report.size / 1048576:.1f} MiB, {report.statements} statements "
+            f"({report.bytesRead / 1048576 / seconds:.1f} MiB/s, {report.statements / seconds:.0f} statements/s)\n"
+            f"{report.failures} failed"
+        )
+
+    def __scriptFinished(self, tab: QueryTab, dialog: QProgressDialog, fileName: str,
+                         report: Union[Error, ScriptProgress]):
+        self.__executionFinished(tab)
+        self.runScriptAction.setEnabled(True)
 
-            if "USE" in queryUpper:
-                index = 4
+        dialog.close()
 
-                while query[index] == " ":
-                    index += 1
+        if isinstance(report, Error):
+            QMessageBox.critical(self, "Error", report.msg)
 
-                if query[index] == "`":
-                    index += 1
+            return
 
-                    self.database.setText(f"Current Database: {query[index:-1]}")
+        if report.schemaChanged:
+            self.refresh()
 
-                else:
-                    self.database.setText(f"Current Database: {query[index:]}")
+        summary: str = (
+            f"{'Stopped' if report.stopped else 'Finished'} {fileName} after {report.statements} statements in "
+            f"{report.seconds:.2f} s ({report.statements / max(report.seconds, 1e-9):.0f} statements/s)"
+        )
 
-            elif any(clause in queryUpper for clause in ("SELECT", "SHOW", "EXPLAIN", "DESC", "DESCRIBE")):
-                data, columns = result
+        if not report.failures:
+            QMessageBox.information(self, "Run Script File", summary)
 
-                table = QTableWidget(len(data), len(columns))
-                table.setHorizontalHeaderLabels(columns)
-                table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+            return
 
-                for row, datum in enumerate(data):
-                    for col, value in enumerate(datum):
-                        if isinstance(value, bytes):
-                            value = value.decode("utf-8")
+        errors: str = "\n".join(
+            f"Line {statement.line}: {self.__errorMessage(statement, error)}" for statement, error in report.errors
+        )
 
-                        table.setCellWidget(row, col, QLabel(f'{value}'))
+        QMessageBox.warning(self, "Run Script File", f"{summary}\n\n{report.failures} statements failed:\n{errors}")
 
-                table.resizeColumnsToContents()
+    @staticmethod
+    def __errorMessage(statement: Statement, error: Error) -> str:
+        return ERROR_LINE.sub(lambda match: f"at line {statement.sourceLine(int(match.group(1)))}", error.msg)
 
-                tab.results.addTab(table, f"Result - {count}")
+    def __showProgress(self, tab: QueryTab, event: QueryEvent):
+        if event.kind == "error" and self.__cancelled and event.payload.errno == ER_QUERY_INTERRUPTED:
+            self.statusBar().showMessage(f"Query {event.index + 1} (line {event.statement.line}) was cancelled", 5000)
 
-                count += 1
+        elif event.kind == "error":
+            QMessageBox.critical(
+                self, "Error executing query",
+                f"In query {event.index + 1} (line {event.statement.line}):\n\n{event.statement.text}\n\n"
+                f"{self.__errorMessage(event.statement, event.payload)}"
+            )
 
-            elif any(clause in queryUpper for clause in ("ALTER", "CREATE", "DROP", "RENAME")):
-                self.refresh()
+        elif event.kind == "result":
+            tab.results.addTab(ResultView(*event.payload), f"Result - {tab.results.count() + 1}")
+            tab.results.show()
+
+        elif event.kind == "rows":
+            tab.results.widget(tab.results.count() - 1).appendRows(event.payload)
+
+        elif event.kind == "fetched":
+            tab.results.widget(tab.results.count() - 1).finish(event.payload)
+
+        elif event.kind == "database":
+            self.database.setText(f"Current Database: {event.payload}")
+
+        elif event.kind == "schema":
+            self.__schemaChanged = True
+
+    def __startExecution(self, tab: QueryTab):
+        self.__executing = True
+        self.__runningTab = tab
+        self.__cancelled = False
+        tab.running = True
+        self.executeAction.setEnabled(False)
+        self.cancelAction.setEnabled(True)
+
+        self.__backend.setExecutionTimeout(tab.timeout.value() * 1000, tab)
+
+    @Slot()
+    def cancelQuery(self):
+        if self.__runningTab is None or self.__cancelled:
+            return
+
+        self.__cancelled = True
+        self.cancelAction.setEnabled(False)
+
+        self.__workers.run(self.__backend.cancelQuery, self.__runningTab, finished=self.__cancelFinished, urgent=True)
+
+    def __cancelFinished(self, error: Optional[Error]):
+        if isinstance(error, Error):
+            QMessageBox.critical(self, "Error", error.msg)
+
+    def __executionFinished(self, tab: QueryTab):
+        self.__executing = False
+        self.__runningTab = None
+        tab.running = False
+        self.executeAction.setEnabled(self.fileMenu.isEnabled())
+        self.cancelAction.setEnabled(False)
 
         tab.results.setHidden(not tab.results.count())
 
+        if self.__deferredDatabase is not None:
+            database, self.__deferredDatabase = self.__deferredDatabase, None
+
+            self.__useDatabase(tab, database)
+
+        if self.__schemaChanged:
+            self.__schemaChanged = False
+
+            self.refresh()
+
+    @Slot(object)
+    def __workerFailed(self, error: Exception):
+        self.statusBar().showMessage(f"Background task failed: {type(error).__name__}: {error}", 10000)
+
+    @Slot(int)
+    def __updateStatus(self, active: int):
+        self.__busy.setVisible(active > 0)
+
+        metrics: PoolMetrics = self.__backend.getPoolMetrics()
+
+        self.__poolStatus.setText(f"Connections: {metrics.inUse}/{metrics.open} in use")
+        self.__poolStatus.setToolTip(
+            f"Pool size: {metrics.size}\n"
+            f"Query tab connections: {metrics.pinned}\n"
+            f"Acquisitions: {metrics.acquisitions} ({metrics.waits} waited)\n"
+            f"Average wait: {metrics.totalWait / max(metrics.acquisitions, 1) * 1000:.1f} ms\n"
+            f"Longest wait: {metrics.maxWait * 1000:.1f} ms"
+        )
+
     @Slot()
     def refresh(self):
-        self.database.setText("Current Database:")
-        self.databaseTree.clear()
-        self.table.setText("Current Table:")
-        self.tableStructure.clearData()
-        self.tableData.clearData()
-        self.genDatabaseList()
-        self.queryTabs.currentWidget().results.hide()
+        self.__backend.invalidateResults()
+        self.__backend.invalidateCatalog()
+
+        self.__refreshes += 1
+
+        generation: int = self.__refreshes
+
+        self.__workers.run(
+            self.__backend.getCatalog, finished=lambda catalog: self.__patchTree(generation, catalog)
+        )
+
+    def __patchTree(self, generation: int, catalog: Union[Error, Dict[str, List[Tuple[str, str]]]]):
+        if generation != self.__refreshes:
+            return
+
+        if isinstance(catalog, Error):
+            QMessageBox.critical(self, "Error", catalog.msg)
+
+            return
+
+        renamed: bool = False
+
+        self.databaseTree.blockSignals(True)
+
+        for i in reversed(range(self.databaseTree.topLevelItemCount())):
+            if self.databaseTree.topLevelItem(i).text(0) not in catalog:
+                self.databaseTree.takeTopLevelItem(i)
+
+        existing: Dict[str, QTreeWidgetItem] = {
+            self.databaseTree.topLevelItem(i).text(0): self.databaseTree.topLevelItem(i)
+            for i in range(self.databaseTree.topLevelItemCount())
+        }
+
+        for i, (database, tables) in enumerate(catalog.items()):
+            databaseItem: Optional[QTreeWidgetItem] = existing.get(database)
+
+            if databaseItem is None:
+                databaseItem = QTreeWidgetItem((database,))
+                databaseItem.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+
+                self.databaseTree.insertTopLevelItem(i, databaseItem)
+
+            elif databaseItem.childCount() == 2:
+                renamed |= self.__patchFolder(
+                    databaseItem.child(0), database, [entry for entry in tables if entry[1] == "BASE TABLE"]
+                )
+                renamed |= self.__patchFolder(
+                    databaseItem.child(1), database, [entry for entry in tables if entry[1] != "BASE TABLE"]
+                )
+
+        self.databaseTree.blockSignals(False)
 
-        self.tableData.setActionsClickable(False)
+        if self.displayedDatabase not in catalog:
+            self.displayedDatabase = ""
+            self.database.setText("Current Database:")
+
+        if not self.displayedTable:
+            return
+
+        if self.__findTable(self.displayedDatabase, self.displayedTable) is None:
+            self.displayedTable = ""
+            self.table.setText("Current Table:")
+            self.__clearTableInfo()
+
+            return
+
+        if renamed:
+            self.showTableInfo(self.displayedDatabase, self.displayedTable)
+
+            return
+
+        database, table = self.displayedDatabase, self.displayedTable
+
+        self.__workers.run(
+            self.__backend.getTableStructure, database, table,
+            finished=lambda result: self.__checkTable(database, table, result)
+        )
+
+    def __checkTable(self, database: str, table: str, result: Union[Error, Tuple[List[Tuple[Any]], Tuple[str]]]):
+        if (database, table) != (self.displayedDatabase, self.displayedTable) or isinstance(result, Error):
+            return
+
+        structure, _ = result
+
+        if structure != self.tableData.structure():
+            self.showTableInfo(database, table)
+
+    def __patchFolder(self, folder: QTreeWidgetItem, database: str, tables: List[Tuple[str, str]]) -> bool:
+        names: Dict[str, str] = dict(tables)
+        current: Dict[str, QTreeWidgetItem] = {
+            folder.child(i).text(0): folder.child(i) for i in range(folder.childCount())
+        }
+
+        removed: List[QTreeWidgetItem] = [item for table, item in current.items() if table not in names]
+        added: List[Tuple[str, str]] = [(table, tableType) for table, tableType in tables if table not in current]
+
+        if len(removed) == 1 and len(added) == 1:
+            item: QTreeWidgetItem = removed[0]
+            table, tableType = added[0]
+            displayed: bool = (self.displayedDatabase, self.displayedTable) == (database, item.text(0))
+            selected: bool = self.databaseTree.currentItem() is item
+
+            if displayed:
+                self.displayedTable = table
+
+            item.setText(0, table)
+            item.setText(1, tableType)
+            item.setData(0, Qt.ItemDataRole.UserRole, table)
+
+            folder.removeChild(item)
+            folder.insertChild(tables.index(added[0]), item)
+
+            if selected:
+                self.databaseTree.setCurrentItem(item)
+
+            return displayed
+
+        for item in removed:
+            folder.removeChild(item)
+
+        for i, (table, tableType) in enumerate(tables):
+            if table not in current:
+                folder.insertChild(i, self.__tableItem(database, table, tableType))
+
+            else:
+                current[table].setText(1, tableType)
+
+        return False
 
     def closeEvent(self, event):
         if self.queryTabs.checkSave():
@@ -396,3 +993,14 @@ class WindowUI(QMainWindow):
 
         else:
             event.ignore()
+
+
+def openWindow(newConnection: Callable[[], MySQLConnection], connection: MySQLConnection,
+               timeout: int = 0) -> WindowUI:
+    window = WindowUI(
+        ConnectionPool(newConnection, getIntSetting("PoolSize", POOL_SIZE), connection),
+        getIntSetting("ChunkSize", CHUNK_SIZE), getIntSetting("ResultCacheSize", 0) * 1048576, timeout
+    )
+    window.show()
+
+    return window
@@ -0,0 +1,103 @@
+from typing import Any, Callable, Optional, Set
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from mysql.connector.errors import Error
+from typing_extensions import Self
+
+from mysql_editor.pool import POOL_SIZE
+from mysql_editor.settings import getIntSetting
+
+
+class WorkerSignals(QObject):
+    finished = Signal(object)
+    progress = Signal(object)
+    error = Signal(object)
+
+
+class Worker(QRunnable):
+    def __init__(self, function: Callable[..., Any], *args: Any, progress: bool = False):
+        super().__init__()
+
+        self.setAutoDelete(False)
+
+        self.signals = WorkerSignals()
+
+        self.__function: Callable[..., Any] = function
+        self.__args = args
+        self.__progress: bool = progress
+
+    def run(self) -> None:
+        result: Any = None
+
+        try:
+            if self.__progress:
+                result = self.__function(*self.__args, progress=self.signals.progress.emit)
+
+            else:
+                result = self.__function(*self.__args)
+
+        except Error as error:
+            result = error
+
+        except Exception as error:
+            result = Error(msg=f"{type(error).__name__}: {error}")
+
+            self.signals.error.emit(error)
+
+        finally:
+            self.signals.finished.emit(result)
+
+
+class WorkerPool(QObject):
+    __instance: Optional[Self] = None
+
+    activeChanged = Signal(int)
+    failed = Signal(object)
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super(WorkerPool, cls).__new__(cls)
+            cls.__instance.__initialised = False
+
+        return cls.__instance
+
+    def __init__(self):
+        if self.__initialised:
+            return
+
+        super().__init__(None)
+
+        self.__initialised = True
+        self.__active: Set[Worker] = set()
+
+        self.__pool = QThreadPool(self)
+        self.__pool.setMaxThreadCount(max(getIntSetting("PoolSize", POOL_SIZE), 1) + 1)
+
+        self.__urgent = QThreadPool(self)
+
+    def run(self, function: Callable[..., Any], *args: Any, finished: Optional[Callable[[Any], None]] = None,
+            progress: Optional[Callable[[Any], None]] = None, urgent: bool = False) -> Worker:
+        worker = Worker(function, *args, progress=progress is not None)
+
+        if finished is not None:
+            worker.signals.finished.connect(finished)
+
+        if progress is not None:
+            worker.signals.progress.connect(progress)
+
+        worker.signals.error.connect(self.failed)
+        worker.signals.finished.connect(lambda _: self.__release(worker))
+
+        self.__active.add(worker)
+        self.activeChanged.emit(len(self.__active))
+
+        (self.__urgent if urgent else self.__pool).start(worker)
+
+        return worker
+
+    def activeCount(self) -> int:
+        return len(self.__active)
+
+    def __release(self, worker: Worker) -> None:
+        self.__active.discard(worker)
+        self.activeChanged.emit(len(self.__active))